@@ -1,47 +1,119 @@
-"""
-Función: Archivo de constantes globales.
-
-Define valores que se usan en toda la app, como el nombre de la aplicación, versión,
-extensiones de archivo permitidas (mp4, mkv, mp3...), colores por defecto y nombres
-de carpetas de datos.
-
-"""
-
-# =================================================
-# CONSTANTES GLOBALES DE LA APLICACIÓN
-# =================================================
-
-# Metadatos de la aplicación
-APP_NAME = "Reproductor de Cursos v2.1"
-APP_VERSION = "2.1"
-PUBLISH_DATE = "14 de Diciembre del 2025"
-AUTHOR = "Jose Luis Montero Laguado"
-CONTACT_EMAIL = "jlmonterol@outlook.com"
-# Asunto pre-codificado para enlaces mailto: (los espacios son %20)
-CONTACT_SUBJECT = "Feedback%20Reproductor%20Cursos"
-REPO_GITHUB = "https://github.com/jlmonterol/reproductordecursos"
-
-# =================================================
-# EXTENSIONES SOPORTADAS
-# =================================================
-
-# Tuplas de extensiones soportadas (Se pueden adicionar más si es necesario, recordar que VLC debe soportarlas)
-VIDEO_EXTS = ('.mp4', '.wmv', '.avi', '.mkv')
-AUDIO_EXTS = ('.m4a', '.mp3', '.oga', '.wav')
-
-# =================================================
-# CONFIGURACIÓN POR DEFECTO
-# =================================================
-
-DEFAULT_THEME = "light"
-DEFAULT_VOLUME = 80
-POMODORO_DEFAULT_MINUTES = 25
-
-# =================================================
-# RUTAS DE DATOS (PERSISTENCIA)
-# =================================================
-
-# Nombres de carpetas y archivos para guardar la configuración del usuario en AppData.
-
-DATA_FOLDER_NAME = "JLMLSoft"
-DATA_FILE_NAME = "user_data.data"
\ No newline at end of file
+"""
+Función: Archivo de constantes globales.
+
+Define valores que se usan en toda la app, como el nombre de la aplicación, versión,
+extensiones de archivo permitidas (mp4, mkv, mp3...), colores por defecto y nombres
+de carpetas de datos.
+
+"""
+
+# =================================================
+# CONSTANTES GLOBALES DE LA APLICACIÓN
+# =================================================
+
+# Metadatos de la aplicación
+APP_NAME = "Reproductor de Cursos v2.1"
+APP_VERSION = "2.1"
+PUBLISH_DATE = "14 de Diciembre del 2025"
+AUTHOR = "Jose Luis Montero Laguado"
+CONTACT_EMAIL = "jlmonterol@outlook.com"
+# Asunto pre-codificado para enlaces mailto: (los espacios son %20)
+CONTACT_SUBJECT = "Feedback%20Reproductor%20Cursos"
+REPO_GITHUB = "https://github.com/jlmonterol/reproductordecursos"
+
+# =================================================
+# EXTENSIONES SOPORTADAS
+# =================================================
+
+# Tuplas de extensiones soportadas (Se pueden adicionar más si es necesario, recordar que VLC debe soportarlas)
+VIDEO_EXTS = ('.mp4', '.wmv', '.avi', '.mkv')
+AUDIO_EXTS = ('.m4a', '.mp3', '.oga', '.wav')
+
+# =================================================
+# CONFIGURACIÓN POR DEFECTO
+# =================================================
+
+DEFAULT_THEME = "light"
+DEFAULT_VOLUME = 80
+POMODORO_DEFAULT_MINUTES = 25
+
+# =================================================
+# RUTAS DE DATOS (PERSISTENCIA)
+# =================================================
+
+# Nombres de carpetas y archivos para guardar la configuración del usuario en AppData.
+
+DATA_FOLDER_NAME = "JLMLSoft"
+DATA_FILE_NAME = "user_data.data"
+# Carpeta (dentro de DATA_FOLDER_NAME) con un archivo de datos por curso.
+COURSES_FOLDER_NAME = "courses"
+# Índice de búsqueda de los apuntes (se reconstruye solo si falta o quedó desactualizado).
+NOTES_INDEX_FILE_NAME = "notes_index.data"
+# Carpeta con la estructura escaneada de cada curso (el árbol se pinta desde ella y se valida en segundo plano).
+SCAN_CACHE_FOLDER_NAME = "scan_cache"
+
+# Escritura diferida (write-behind): los cambios se agrupan y se vuelcan a disco como máximo cada N milisegundos.
+SAVE_DEBOUNCE_MS = 1500
+
+# Motor de almacenamiento de los datos del usuario: "json" (user_data.data) o "sqlite" (user_data.sqlite3).
+# Al usar "sqlite" por primera vez se importan automáticamente los datos del user_data.data existente.
+DATA_BACKEND = "json"
+SQLITE_FILE_NAME = "user_data.sqlite3"
+
+
+# Diario de cambios (solo motor "json"): cada modificación se añade como una línea a user_data.data.journal
+# en lugar de reescribir todo el archivo. El JSON completo se reescribe ("compacta") al superar este tamaño o al cerrar.
+DATA_JOURNAL = True
+JOURNAL_COMPACT_BYTES = 256 * 1024
+
+# Formato de los archivos de datos (motor "json"): False = JSON legible (indentado); True = JSON minificado y
+# comprimido (más pequeño y rápido de leer). Al leer se detectan ambos. Conversor: python -m app.data.convert compact|json
+DATA_COMPACT_FORMAT = False
+
+# =================================================
+# ESCANEO DE CURSOS
+# =================================================
+
+# Hilos para leer a la vez los capítulos (cursos de vídeo) o las subcarpetas (cursos de audio). En unidades de red
+# (NAS/SMB), donde cada carpeta espera la respuesta del servidor, acelera mucho la apertura; en un disco local no.
+# 0 = automático (se mide la latencia de las primeras carpetas y solo se usan hilos si es alta); 1 = de una en una.
+SCAN_THREADS = 0
+# Máximo de hilos del modo automático.
+SCAN_MAX_THREADS = 16
+
+# Detección del tipo de curso (vídeo o audio) al abrirlo: se hace en el hilo de la interfaz, así que solo se miran las
+# primeras carpetas de cada nivel (raíz, capítulos y sus subcarpetas). El escaneo del árbol, en segundo plano, lee el resto.
+COURSE_KIND_DIRS_PER_LEVEL = 8
+
+
+# =================================================
+# REPRODUCCIÓN CONTINUA
+# =================================================
+
+# Segundos antes del final en los que se prepara el siguiente vídeo/audio (Media de VLC, descripción y archivos).
+PRELOAD_AHEAD_SECONDS = 15
+# Cursos de audio en reproducción continua: True = pasar al siguiente audio sin la cuenta atrás de 5 segundos.
+GAPLESS_AUDIO = False
+
+
+# =================================================
+# REANUDAR REPRODUCCIÓN
+# =================================================
+
+# Se recuerda por curso dónde se dejó cada vídeo/audio y al volver a abrirlo se ofrece continuar desde ahí.
+# La posición se guarda como mucho cada N milisegundos (y siempre al pausar, detener, cambiar de archivo o cerrar).
+POSITION_SAVE_INTERVAL_MS = 5000
+# No se ofrece reanudar si se dejó en los primeros segundos; en los últimos se considera terminado (vuelve al inicio).
+RESUME_MIN_SECONDS = 10
+RESUME_END_SECONDS = 15
+
+
+# =================================================
+# METADATOS DE AUDIOS Y VÍDEOS
+# =================================================
+
+# Duración, resolución y códec de cada archivo del curso: se leen en segundo plano con VLC al abrir el curso y se
+# guardan en la caché de escaneo (solo se vuelven a leer los archivos que cambian de tamaño o fecha).
+# Hilos que leen archivos a la vez (cada uno con su propia instancia de VLC) y tiempo máximo por archivo.
+MEDIA_INFO_THREADS = 4
+MEDIA_INFO_TIMEOUT_MS = 5000
\ No newline at end of file
@@ -1,5 +1,5 @@
-# =================================================
-# IMPORTACIONES NECESARIAS
-# =================================================
-
-from .data_manager import DataManager
\ No newline at end of file
+# =================================================
+# IMPORTACIONES NECESARIAS
+# =================================================
+
+from .data_manager import DataManager, get_data_manager
\ No newline at end of file
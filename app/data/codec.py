@@ -0,0 +1,89 @@
+"""
+Función: Formato en disco de los archivos de datos (JSON legible o compacto).
+
+El formato legible es el JSON de siempre (indentado). El compacto es el mismo
+JSON minificado y comprimido con zlib, precedido de una cabecera "mágica" que
+permite reconocerlo al leer. La lectura detecta el formato sola, así que se
+puede cambiar DATA_COMPACT_FORMAT en config.py sin perder datos; además se
+incluye un conversor para pasar todos los archivos de un formato a otro
+(convert_data_dir, o desde consola con app/data/convert.py).
+
+"""
+
+# =================================================
+# IMPORTACIONES NECESARIAS
+# =================================================
+
+import os
+import json
+import zlib
+
+from typing import Dict, Any, List
+from app.config import DATA_FILE_NAME, COURSES_FOLDER_NAME
+
+# Cabecera del formato compacto (5 bytes). Un JSON de texto nunca empieza así.
+MAGIC = b"JLMZ\x01"
+# Nivel 1 de zlib: casi la misma reducción de tamaño que el 6 con la cuarta parte de tiempo al guardar.
+COMPRESSION_LEVEL = 1
+
+
+# =================================================
+# CODIFICAR / DECODIFICAR (ENCODE / DECODE)
+# =================================================
+
+# Convierte los datos en los bytes que se escriben en disco.
+def encode(data: Dict[str, Any], compact: bool) -> bytes:
+    if compact:
+        raw = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return MAGIC + zlib.compress(raw, COMPRESSION_LEVEL)
+    return json.dumps(data, ensure_ascii=False, indent=4).encode("utf-8")
+
+
+# Lee los bytes de un archivo en cualquiera de los dos formatos. Lanza ValueError si están dañados.
+def decode(raw: bytes) -> Dict[str, Any]:
+    if raw.startswith(MAGIC):
+        try:
+            raw = zlib.decompress(raw[len(MAGIC):])
+        except zlib.error as e:
+            raise ValueError(f"Datos comprimidos dañados: {e}") from e
+    return json.loads(raw.decode("utf-8"))
+
+
+def is_compact(raw: bytes) -> bool:
+    return raw.startswith(MAGIC)
+
+
+# =================================================
+# CONVERSOR (CONVERT_FILE / CONVERT_DATA_DIR)
+# =================================================
+
+# Reescribe un archivo en el formato indicado. Devuelve False si ya estaba en ese formato.
+
+def convert_file(path: str, compact: bool) -> bool:
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if is_compact(raw) == compact:
+        return False
+
+    content = encode(decode(raw), compact)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+    return True
+
+
+# Convierte user_data.data y todos los archivos de curso de la carpeta de datos.
+# El diario (user_data.data.journal) no se toca: es texto por líneas en ambos formatos.
+
+def convert_data_dir(app_data_dir: str, compact: bool) -> List[str]:
+    paths = [os.path.join(app_data_dir, DATA_FILE_NAME)]
+    courses_dir = os.path.join(app_data_dir, COURSES_FOLDER_NAME)
+    if os.path.isdir(courses_dir):
+        paths += [os.path.join(courses_dir, name) for name in sorted(os.listdir(courses_dir)) if name.endswith(".data")]
+
+    converted = []
+    for path in paths:
+        if os.path.exists(path) and convert_file(path, compact):
+            converted.append(path)
+    return converted
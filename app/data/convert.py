@@ -0,0 +1,41 @@
+"""
+Función: Conversor de formato de los datos del usuario (línea de comandos).
+
+Reescribe user_data.data y los archivos de curso en formato compacto o en JSON
+legible. Debe ejecutarse con la aplicación cerrada:
+
+    python -m app.data.convert compact  [carpeta_de_datos]
+    python -m app.data.convert json     [carpeta_de_datos]
+
+"""
+
+# =================================================
+# IMPORTACIONES NECESARIAS
+# =================================================
+
+import os
+import sys
+
+from app.config import DATA_FOLDER_NAME
+from app.data.codec import convert_data_dir
+
+
+# =================================================
+# FUNCIÓN PRINCIPAL (MAIN)
+# =================================================
+
+def main() -> int:
+    if len(sys.argv) < 2 or sys.argv[1] not in ("compact", "json"):
+        print("Uso: python -m app.data.convert compact|json [carpeta_de_datos]")
+        return 1
+
+    # Por defecto, la misma carpeta que usa DataManager.
+    target_dir = sys.argv[2] if len(sys.argv) > 2 else os.path.join(
+        os.getenv('LOCALAPPDATA', os.path.expanduser('~')), DATA_FOLDER_NAME)
+    converted = convert_data_dir(target_dir, sys.argv[1] == "compact")
+    print(f"{len(converted)} archivo(s) convertido(s) en {target_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,310 +1,446 @@
-"""
-Función: El "cerebro" de la memoria. Gestiona el guardado y carga de datos.
-
-Crea y lee un archivo JSON (user_data.data) en la carpeta del usuario.
-Guarda qué videos has visto, tus apuntes, la configuración del tema
-(oscuro/claro), historiales de exámenes y rutas preferidas.
-
-"""
-
-# =================================================
-# IMPORTACIONES NECESARIAS
-# =================================================
-
-import os
-import json
-
-from typing import Dict, List, Any, Optional
-from app.config import DATA_FOLDER_NAME, DATA_FILE_NAME, DEFAULT_THEME
-
-
-# =================================================
-# CLASE DATAMANAGER (GESTIÓN DE DATOS)
-# =================================================
-
-# Se encarga de manejar la persistencia de datos (progreso, notas, configuración) guardando y leyendo la información en un archivo JSON local (user_data.data).
-
-class DataManager:
-# Busca el archivo de datos en la carpeta AppData del usuario. Si no existe, crea uno nuevo.
-
-    # =================================================
-    # CONSTRUCTOR DE LA CLASE
-    # =================================================
-    
-    # Inicializa las rutas donde se guardará el archivo de datos (AppData) y carga los datos existentes al instanciar la clase.
-    
-    def __init__(self):
-        # %UserProfile%\AppData\Local\JLMLSoft\user_data.data
-        self.app_data_dir = os.path.join(os.getenv('LOCALAPPDATA', os.path.expanduser('~')), DATA_FOLDER_NAME)
-        self.data_file_path = os.path.join(self.app_data_dir, DATA_FILE_NAME)
-        
-        self.data: Dict[str, Any] = {}
-        self._load_data()
-    
-    # =================================================
-    # FUNCIÓN CARGAR DATOS (_LOAD_DATA)
-    # =================================================
-    
-    # Lee el archivo JSON del disco. Si no existe o está corrupto, inicializa una estructura de diccionario vacía con valores por defecto.
-
-    def _load_data(self) -> None:
-        """Carga los datos del archivo JSON o inicializa la estructura base."""
-        if not os.path.exists(self.app_data_dir):
-            try:
-                os.makedirs(self.app_data_dir)
-            except OSError:
-                pass 
-
-        if os.path.exists(self.data_file_path):
-            try:
-                with open(self.data_file_path, 'r', encoding='utf-8') as f:
-                    self.data = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                self.data = {}
-        else:
-            self.data = {}
-
-    # Asegurar estructura base
-        if "config" not in self.data:
-            self.data["config"] = {"theme": DEFAULT_THEME, "ide_path": ""}
-        if "courses" not in self.data:
-            self.data["courses"] = {}
-
-    # =================================================
-    # FUNCIÓN GUARDAR DATOS (SAVE_DATA)
-    # =================================================
-    
-    # Escribe el estado actual del diccionario 'self.data' en el archivo físico JSON.
-    # Se debe llamar cada vez que se modifica algún dato importante.
-
-    def save_data(self) -> None:
-        """Escribe el estado actual en el disco."""
-        try:
-            with open(self.data_file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, ensure_ascii=False, indent=4)
-        except IOError as e:
-            print(f"Error crítico guardando datos: {e}")
-
-    # =================================================
-    # GESTIÓN DEL TEMA (GET/SET THEME)
-    # =================================================
-    
-    # Recupera o actualiza la preferencia visual (Oscuro/Claro).
-
-    def get_theme(self) -> str:
-        return self.data["config"].get("theme", DEFAULT_THEME)
-
-    def set_theme(self, theme_mode: str) -> None:
-        self.data["config"]["theme"] = theme_mode
-        self.save_data()
-
-    # =================================================
-    # GESTIÓN RUTA IDE (GET/SET IDE PATH)
-    # =================================================
-    
-    # Gestiona la ruta del ejecutable del editor de código (ej. VS Code) para abrir los ejercicios.
-
-    def get_ide_path(self) -> str:
-        return self.data["config"].get("ide_path", "")
-
-    def set_ide_path(self, path: str) -> None:
-        self.data["config"]["ide_path"] = path
-        self.save_data()
-        
-    # =================================================
-    # GESTIÓN ÚLTIMO DIRECTORIO (LAST OPEN DIR)
-    # =================================================
-    
-    # Recuerda la última carpeta que el usuario abrió para que, al reiniciar la app, el diálogo de "Abrir" comience allí.
-
-    def get_last_open_dir(self) -> str:
-        """Devuelve la última ruta abierta o el directorio home si no existe."""
-        path = self.data["config"].get("last_open_dir", "")
-        if path and os.path.exists(path):
-            return path
-        return os.path.expanduser("~")
-
-    def set_last_open_dir(self, path: str) -> None:
-        """Guarda la ruta del directorio para futuras sesiones."""
-    # Guardamos el directorio padre si es un archivo, o el mismo si es carpeta.
-        if os.path.isfile(path):
-            path = os.path.dirname(path)
-        self.data["config"]["last_open_dir"] = path
-        self.save_data()
-        
-    # =================================================
-    # CONFIGURACIÓN GENÉRICA (GET/SET SETTING)
-    # =================================================
-    
-    # Métodos auxiliares para guardar cualquier par clave-valor en la configuración.
-
-    def get_setting(self, key: str, default: Any = None) -> Any:
-        """Recupera un valor arbitrario de la configuración."""
-        return self.data["config"].get(key, default)
-
-    def set_setting(self, key: str, value: Any) -> None:
-        """Guarda un valor arbitrario en la configuración."""
-        self.data["config"][key] = value
-        self.save_data()
-
-    # =================================================
-    # GESTIÓN DIRECTORIO DE TRABAJO (WORK DIR)
-    # =================================================
-    
-    # Gestiona la carpeta donde el usuario quiere copiar y realizar sus ejercicios.
-    
-    def get_work_dir(self) -> str:
-        """Devuelve la ruta del directorio de trabajo del usuario."""
-        return self.data["config"].get("work_dir", "")
-
-    def set_work_dir(self, path: str) -> None:
-        """Guarda la ruta del directorio de trabajo."""
-        self.data["config"]["work_dir"] = path
-        self.save_data()
-
-    # =================================================
-    # PERSISTENCIA DE VENTANA (GEOMETRÍA)
-    # =================================================
-    
-    # Guarda y recupera el tamaño y posición de la ventana principal.
-    
-    def set_window_geometry(self, geometry_hex: str) -> None:
-        self.data["config"]["window_geometry"] = geometry_hex
-        self.save_data()
-
-    def get_window_geometry(self) -> str:
-        return self.data["config"].get("window_geometry", "")
-
-    # =================================================
-    # PERSISTENCIA DE PANELES (SPLITTERS)
-    # =================================================
-    
-    # Guarda y recupera la posición de las barras divisorias (paneles ajustables).
-    
-    def set_splitter_state(self, splitter_name: str, state_hex: str) -> None:
-        if "ui_states" not in self.data["config"]:
-            self.data["config"]["ui_states"] = {}
-        self.data["config"]["ui_states"][splitter_name] = state_hex
-        self.save_data()
-
-    def get_splitter_state(self, splitter_name: str) -> str:
-        if "ui_states" not in self.data["config"]:
-            return ""
-        return self.data["config"]["ui_states"].get(splitter_name, "")
-
-    # =================================================
-    # LÓGICA DE CURSOS (MÉTODOS PRIVADOS)
-    # =================================================
-    
-    # Genera claves únicas para identificar cada curso y asegura que existan en la BD (.JSON).
-
-    def _get_course_key(self, course_path: str) -> str:
-        return os.path.abspath(course_path)
-
-    def _ensure_course_exists(self, course_path: str) -> str:
-        key = self._get_course_key(course_path)
-        if key not in self.data["courses"]:
-            self.data["courses"][key] = {
-                "history": [], 
-                "notes": {},
-                "tests": {}
-            }
-        return key
-
-    # =================================================
-    # GESTIÓN DE VIDEO COMPLETADO
-    # =================================================
-    
-    # Verifica o marca si un video específico ha sido visto (check verde).
-    
-    def is_video_completed(self, course_path: str, rel_video_path: str) -> bool:
-        key = self._get_course_key(course_path)
-        if key not in self.data["courses"]:
-            return False
-        return rel_video_path in self.data["courses"][key]["history"]
-
-    def set_video_completed(self, course_path: str, rel_video_path: str, completed: bool) -> None:
-        key = self._ensure_course_exists(course_path)
-        history_list = self.data["courses"][key]["history"]
-        
-        if completed:
-            if rel_video_path not in history_list:
-                history_list.append(rel_video_path)
-        else:
-            if rel_video_path in history_list:
-                history_list.remove(rel_video_path)
-        self.save_data()
-
-    # =================================================
-    # GESTIÓN DE APUNTES (NOTES)
-    # =================================================
-    
-    # Guarda o recupera el texto de los apuntes para un video específico.
-
-    def get_notes(self, course_path: str, rel_video_path: str) -> str:
-        key = self._get_course_key(course_path)
-        if key not in self.data["courses"]:
-            return ""
-        return self.data["courses"][key]["notes"].get(rel_video_path, "")
-
-    def set_notes(self, course_path: str, rel_video_path: str, text: str) -> None:
-        key = self._ensure_course_exists(course_path)
-        self.data["courses"][key]["notes"][rel_video_path] = text
-        self.save_data()
-
-    # =================================================
-    # GESTIÓN DE TEST Y EVALUACIONES
-    # =================================================
-    
-    # Recupera el historial de exámenes y añade nuevos intentos.
-
-    def get_test_history(self, course_path: str, test_name: str) -> List[Dict[str, Any]]:
-        key = self._get_course_key(course_path)
-        if key not in self.data["courses"]:
-            return []
-        return self.data["courses"][key]["tests"].get(test_name, [])
-    
-    # Registra el resultado de una evaluación realizada por el usuario.
-    
-    def add_test_attempt(self, course_path: str, test_name: str, attempt_data: Dict[str, Any]) -> None:
-        key = self._ensure_course_exists(course_path)
-        if test_name not in self.data["courses"][key]["tests"]:
-            self.data["courses"][key]["tests"][test_name] = []
-        
-        self.data["courses"][key]["tests"][test_name].append(attempt_data)
-        self.save_data()
-
-    # =================================================
-    # GESTIÓN DE DATOS (RESET Y LIMPIEZA)
-    # =================================================
-    
-    # Funciones para borrar apuntes, historial o reiniciar la app de fábrica.
-
-    # Borra/limpia todos los apuntes que ha realizado el usuario.
-    def clear_all_notes(self) -> None:
-        for course_key in self.data["courses"]:
-            self.data["courses"][course_key]["notes"] = {}
-        self.save_data()
-
-    # Borra/limpia todo el historial de vídeos/audios completados que ha realizado el usuario.
-    def clear_all_history(self) -> None:
-        for course_key in self.data["courses"]:
-            self.data["courses"][course_key]["history"] = []
-        self.save_data()
-
-    # Borra/limpia todo el historial de puntajes de evaluaciones que ha realizado el usuario.
-    def clear_all_tests(self) -> None:
-        for course_key in self.data["courses"]:
-            self.data["courses"][course_key]["tests"] = {}
-        self.save_data()
-
-    # Borra/limpia todo los datos almacenados en USER_DATA.DATA.
-    def reset_all_data(self) -> None:
-        current_theme = self.get_theme()
-        self.data = {
-            "config": {"theme": current_theme, "ide_path": ""},
-            "courses": {}
-        }
-        self.save_data()
-    
-    
\ No newline at end of file
+"""
+Función: El "cerebro" de la memoria. Gestiona el guardado y carga de datos.
+
+Crea y lee los datos del usuario en su carpeta de AppData (por defecto archivos
+JSON: user_data.data para la configuración y uno por curso; o una base SQLite
+según DATA_BACKEND en config.py).
+Guarda qué videos has visto, dónde te quedaste en cada uno, tus apuntes, la
+configuración del tema (oscuro/claro), historiales de exámenes y rutas
+preferidas.
+
+"""
+
+# =================================================
+# IMPORTACIONES NECESARIAS
+# =================================================
+
+import os
+import time
+import atexit
+import threading
+
+from typing import Dict, List, Any, Iterator, Optional, Tuple, AbstractSet, Iterable
+from app.config import (DATA_FOLDER_NAME, DATA_FILE_NAME, DEFAULT_THEME, SAVE_DEBOUNCE_MS,
+                        DATA_BACKEND, SQLITE_FILE_NAME, DATA_JOURNAL, JOURNAL_COMPACT_BYTES,
+                        COURSES_FOLDER_NAME, DATA_COMPACT_FORMAT, NOTES_INDEX_FILE_NAME,
+                        SCAN_CACHE_FOLDER_NAME, POSITION_SAVE_INTERVAL_MS)
+from app.data.storage import StorageBackend
+from app.data.json_backend import JsonBackend
+from app.data.sqlite_backend import SqliteBackend
+from app.data.notes_index import NotesIndex
+from app.data.scan_cache import ScanCache
+
+
+# =================================================
+# CLASE DATAMANAGER (GESTIÓN DE DATOS)
+# =================================================
+
+# Se encarga de manejar la persistencia de datos (progreso, notas, configuración). No escribe directamente en disco:
+# delega en un motor de almacenamiento (StorageBackend) intercambiable, manteniendo siempre la misma API pública.
+
+class DataManager:
+# Busca los datos en la carpeta AppData del usuario. Si no existen, los crea.
+
+    # =================================================
+    # CONSTRUCTOR DE LA CLASE
+    # =================================================
+    
+    # Inicializa las rutas donde se guardarán los datos (AppData), crea el motor de almacenamiento y carga los datos existentes.
+    # backend: "json" (user_data.data + un archivo por curso) o "sqlite" (user_data.sqlite3, importa el JSON la primera vez).
+    # Con write_behind=True (solo JSON) las modificaciones se agrupan y un hilo de fondo las vuelca como máximo
+    # cada 'flush_interval_ms'. Al cerrar la app se debe llamar a flush().
+    
+    def __init__(self, backend: str = DATA_BACKEND, write_behind: bool = True, flush_interval_ms: int = SAVE_DEBOUNCE_MS):
+        # %UserProfile%\AppData\Local\JLMLSoft\user_data.data
+        self.app_data_dir = os.path.join(os.getenv('LOCALAPPDATA', os.path.expanduser('~')), DATA_FOLDER_NAME)
+        self.data_file_path = os.path.join(self.app_data_dir, DATA_FILE_NAME)
+        
+        if not os.path.exists(self.app_data_dir):
+            try:
+                os.makedirs(self.app_data_dir)
+            except OSError:
+                pass 
+
+        self._store = self._create_backend(backend, write_behind, flush_interval_ms)
+        self._store.load()
+
+        # Índice de búsqueda de apuntes: se carga (o reconstruye) la primera vez que se busca.
+        # Mientras tanto, los cambios de apuntes se acumulan en '_pending_index_updates'.
+        self._notes_index: Optional[NotesIndex] = None
+        self._pending_index_updates: List[Tuple[str, str, str, str]] = []
+        self._notes_index_lock = threading.Lock()
+        self._notes_index_build_lock = threading.Lock()
+
+        # Estructura escaneada de los cursos abiertos (la usa el árbol de contenidos).
+        self.scan_cache = ScanCache(os.path.join(self.app_data_dir, SCAN_CACHE_FOLDER_NAME))
+
+        # Posiciones de reproducción aún no entregadas al motor: clave_curso -> {ruta_relativa: ms}.
+        self._pending_positions: Dict[str, Dict[str, int]] = {}
+        self._positions_lock = threading.Lock()
+        self._positions_flushed_at = 0.0
+        # Red de seguridad: si la app termina sin flush() explícito, no perder cambios.
+        atexit.register(self.flush)
+
+    # =================================================
+    # SELECCIÓN DEL MOTOR (_CREATE_BACKEND)
+    # =================================================
+
+    def _create_backend(self, backend: str, write_behind: bool, flush_interval_ms: int) -> StorageBackend:
+        shards_dir = os.path.join(self.app_data_dir, COURSES_FOLDER_NAME)
+        if backend == "sqlite":
+            db_path = os.path.join(self.app_data_dir, SQLITE_FILE_NAME)
+            legacy_store = JsonBackend(self.data_file_path, shards_dir, write_behind=False, journal=DATA_JOURNAL)
+            return SqliteBackend(db_path, legacy_store=legacy_store)
+        if backend != "json":
+            print(f"Advertencia: motor de datos desconocido '{backend}', se usa JSON.")
+        return JsonBackend(self.data_file_path, shards_dir, write_behind=write_behind, flush_interval_ms=flush_interval_ms,
+                           journal=DATA_JOURNAL, compact_bytes=JOURNAL_COMPACT_BYTES,
+                           compact_format=DATA_COMPACT_FORMAT)
+
+    # =================================================
+    # GUARDADO Y CIERRE (SAVE_DATA / FLUSH / CLOSE)
+    # =================================================
+    
+    # Asegura que el estado actual quede escrito en disco (compatibilidad con el antiguo guardado inmediato).
+    def save_data(self) -> None:
+        """Escribe el estado actual en el disco."""
+        self._store.flush()
+
+    # Vuelca en disco los cambios pendientes. Debe llamarse al cerrar la aplicación.
+    def flush(self) -> None:
+        self.flush_positions()
+        self._save_notes_index()
+        self._store.flush()
+
+    # Vuelca lo pendiente y libera el motor (hilos, conexiones).
+    def close(self) -> None:
+        self.flush_positions()
+        self._save_notes_index()
+        self._store.close()
+
+    # Devuelve contadores del motor: escrituras solicitadas/realizadas/ahorradas, latencia de volcado (ms), etc.
+    def get_persistence_stats(self) -> Dict[str, Any]:
+        return self._store.stats()
+
+    # =================================================
+    # GESTIÓN DEL TEMA (GET/SET THEME)
+    # =================================================
+    
+    # Recupera o actualiza la preferencia visual (Oscuro/Claro).
+
+    def get_theme(self) -> str:
+        return self._store.config.get("theme", DEFAULT_THEME)
+
+    def set_theme(self, theme_mode: str) -> None:
+        self._store.set_config("theme", theme_mode)
+
+    # =================================================
+    # GESTIÓN RUTA IDE (GET/SET IDE PATH)
+    # =================================================
+    
+    # Gestiona la ruta del ejecutable del editor de código (ej. VS Code) para abrir los ejercicios.
+
+    def get_ide_path(self) -> str:
+        return self._store.config.get("ide_path", "")
+
+    def set_ide_path(self, path: str) -> None:
+        self._store.set_config("ide_path", path)
+        
+    # =================================================
+    # GESTIÓN ÚLTIMO DIRECTORIO (LAST OPEN DIR)
+    # =================================================
+    
+    # Recuerda la última carpeta que el usuario abrió para que, al reiniciar la app, el diálogo de "Abrir" comience allí.
+
+    def get_last_open_dir(self) -> str:
+        """Devuelve la última ruta abierta o el directorio home si no existe."""
+        path = self._store.config.get("last_open_dir", "")
+        if path and os.path.exists(path):
+            return path
+        return os.path.expanduser("~")
+
+    def set_last_open_dir(self, path: str) -> None:
+        """Guarda la ruta del directorio para futuras sesiones."""
+    # Guardamos el directorio padre si es un archivo, o el mismo si es carpeta.
+        if os.path.isfile(path):
+            path = os.path.dirname(path)
+        self._store.set_config("last_open_dir", path)
+        
+    # =================================================
+    # CONFIGURACIÓN GENÉRICA (GET/SET SETTING)
+    # =================================================
+    
+    # Métodos auxiliares para guardar cualquier par clave-valor en la configuración.
+
+    def get_setting(self, key: str, default: Any = None) -> Any:
+        """Recupera un valor arbitrario de la configuración."""
+        return self._store.config.get(key, default)
+
+    def set_setting(self, key: str, value: Any) -> None:
+        """Guarda un valor arbitrario en la configuración."""
+        self._store.set_config(key, value)
+
+    # =================================================
+    # GESTIÓN DIRECTORIO DE TRABAJO (WORK DIR)
+    # =================================================
+    
+    # Gestiona la carpeta donde el usuario quiere copiar y realizar sus ejercicios.
+    
+    def get_work_dir(self) -> str:
+        """Devuelve la ruta del directorio de trabajo del usuario."""
+        return self._store.config.get("work_dir", "")
+
+    def set_work_dir(self, path: str) -> None:
+        """Guarda la ruta del directorio de trabajo."""
+        self._store.set_config("work_dir", path)
+
+    # =================================================
+    # PERSISTENCIA DE VENTANA (GEOMETRÍA)
+    # =================================================
+    
+    # Guarda y recupera el tamaño y posición de la ventana principal.
+    
+    def set_window_geometry(self, geometry_hex: str) -> None:
+        self._store.set_config("window_geometry", geometry_hex)
+
+    def get_window_geometry(self) -> str:
+        return self._store.config.get("window_geometry", "")
+
+    # =================================================
+    # PERSISTENCIA DE PANELES (SPLITTERS)
+    # =================================================
+    
+    # Guarda y recupera la posición de las barras divisorias (paneles ajustables).
+    
+    def set_splitter_state(self, splitter_name: str, state_hex: str) -> None:
+        ui_states = dict(self._store.config.get("ui_states", {}))
+        ui_states[splitter_name] = state_hex
+        self._store.set_config("ui_states", ui_states)
+
+    def get_splitter_state(self, splitter_name: str) -> str:
+        return self._store.config.get("ui_states", {}).get(splitter_name, "")
+
+    # =================================================
+    # LÓGICA DE CURSOS (MÉTODOS PRIVADOS)
+    # =================================================
+    
+    # Genera claves únicas para identificar cada curso en el almacenamiento.
+
+    def _get_course_key(self, course_path: str) -> str:
+        return os.path.abspath(course_path)
+
+    # =================================================
+    # GESTIÓN DE VIDEO COMPLETADO
+    # =================================================
+    
+    # Verifica o marca si un video específico ha sido visto (check verde).
+    
+    def is_video_completed(self, course_path: str, rel_video_path: str) -> bool:
+        return self._store.is_completed(self._get_course_key(course_path), rel_video_path)
+
+    def set_video_completed(self, course_path: str, rel_video_path: str, completed: bool) -> None:
+        self._store.set_completed(self._get_course_key(course_path), rel_video_path, completed)
+
+    # Consultas en bloque: resuelven el estado de miles de elementos con una sola llamada al motor.
+    # completed_set devuelve el conjunto de rutas relativas vistas; are_completed, un diccionario ruta -> visto.
+
+    def completed_set(self, course_path: str) -> AbstractSet[str]:
+        return self._store.completed_set(self._get_course_key(course_path))
+
+    def are_completed(self, course_path: str, rel_video_paths: Iterable[str]) -> Dict[str, bool]:
+        done = self.completed_set(course_path)
+        return {rel: rel in done for rel in rel_video_paths}
+
+    # Recorre el historial como tuplas (clave_curso, ruta_relativa). Con course_path=None recorre todos los cursos.
+    def iter_history(self, course_path: Optional[str] = None) -> Iterator[Tuple[str, str]]:
+        course_key = self._get_course_key(course_path) if course_path else None
+        return self._store.iter_history(course_key)
+
+    # =================================================
+    # POSICIÓN DE REPRODUCCIÓN (REANUDAR)
+    # =================================================
+
+    # El reproductor informa de la posición varias veces por segundo: se apunta en memoria y se entrega al motor
+    # como mucho cada POSITION_SAVE_INTERVAL_MS (un único cambio por curso con la última posición de cada archivo),
+    # o cuando se llama a flush_positions() (pausa, parada, cambio de archivo, cierre). Así nunca se escribe en
+    # disco por cada avance. Posición 0 = no hay nada que reanudar (se borra la guardada).
+
+    def get_position(self, course_path: str, rel_video_path: str) -> int:
+        course_key = self._get_course_key(course_path)
+        with self._positions_lock:
+            pending = self._pending_positions.get(course_key, {}).get(rel_video_path)
+        if pending is not None:
+            return pending
+        return self._store.get_position(course_key, rel_video_path)
+
+    def set_position(self, course_path: str, rel_video_path: str, position_ms: int) -> None:
+        course_key = self._get_course_key(course_path)
+        with self._positions_lock:
+            self._pending_positions.setdefault(course_key, {})[rel_video_path] = max(0, int(position_ms))
+            due = time.monotonic() - self._positions_flushed_at >= POSITION_SAVE_INTERVAL_MS / 1000
+        if due:
+            self.flush_positions()
+
+    # Entrega al motor las posiciones pendientes (solo las que difieren de lo ya guardado).
+    def flush_positions(self) -> None:
+        with self._positions_lock:
+            pending, self._pending_positions = self._pending_positions, {}
+            self._positions_flushed_at = time.monotonic()
+        for course_key, positions in pending.items():
+            changed = {rel: ms for rel, ms in positions.items() if self._store.get_position(course_key, rel) != ms}
+            self._store.set_positions(course_key, changed)
+
+    # =================================================
+    # GESTIÓN DE APUNTES (NOTES)
+    # =================================================
+    
+    # Guarda o recupera el texto de los apuntes para un video específico.
+
+    def get_notes(self, course_path: str, rel_video_path: str) -> str:
+        return self._store.get_note(self._get_course_key(course_path), rel_video_path)
+
+    def set_notes(self, course_path: str, rel_video_path: str, text: str) -> None:
+        course_key = self._get_course_key(course_path)
+        old_text = self._store.get_note(course_key, rel_video_path)
+        self._store.set_note(course_key, rel_video_path, text)
+        self._on_note_changed(course_key, rel_video_path, old_text, text)
+
+    # Recorre los apuntes guardados como tuplas (clave_curso, ruta_relativa, texto).
+    # Con course_path=None recorre todos los cursos (exportación global).
+    def iter_notes(self, course_path: Optional[str] = None) -> Iterator[Tuple[str, str, str]]:
+        course_key = self._get_course_key(course_path) if course_path else None
+        return self._store.iter_notes(course_key)
+
+    # =================================================
+    # BÚSQUEDA EN APUNTES (SEARCH_NOTES)
+    # =================================================
+
+    # Busca en los apuntes de todos los cursos (sin distinguir mayúsculas ni tildes; la última palabra vale como prefijo).
+    # Devuelve tuplas (clave_curso, ruta_relativa); la clave del curso es su ruta absoluta.
+
+    def search_notes(self, query: str, limit: int = 100) -> List[Tuple[str, str]]:
+        return self._get_notes_index().search(query, limit)
+
+    # Carga (o reconstruye) el índice en un hilo de fondo para que la primera búsqueda sea inmediata.
+    def warm_up_notes_index(self) -> None:
+        if self._notes_index is None:
+            threading.Thread(target=self._get_notes_index, name="NotesIndexWarmUp", daemon=True).start()
+
+    def is_notes_index_ready(self) -> bool:
+        return self._notes_index is not None
+
+    # Devuelve el índice, cargándolo del disco o reconstruyéndolo si quedó desactualizado (cierre inesperado).
+    # La carga se hace fuera de '_notes_index_lock' para no bloquear set_notes(); los cambios que lleguen mientras
+    # tanto quedan en '_pending_index_updates' y se aplican al final (aplicarlos dos veces no altera el resultado).
+
+    def _get_notes_index(self) -> NotesIndex:
+        with self._notes_index_build_lock:
+            if self._notes_index is not None:
+                return self._notes_index
+
+            index = NotesIndex(os.path.join(self.app_data_dir, NOTES_INDEX_FILE_NAME))
+            if self.get_setting("notes_index_dirty", True) or not index.load():
+                index.rebuild(self._store.iter_notes())
+
+            with self._notes_index_lock:
+                if self._notes_index is None:
+                    for course_key, rel_path, old_text, new_text in self._pending_index_updates:
+                        index.update(course_key, rel_path, old_text, new_text)
+                    self._pending_index_updates = []
+                    self._notes_index = index
+                return self._notes_index
+
+    # Mantiene el índice al día con cada apunte guardado. La marca 'notes_index_dirty' (una vez por sesión) indica
+    # que el índice en disco no incluye todos los cambios hasta que se vuelva a guardar.
+
+    def _on_note_changed(self, course_key: str, rel_path: str, old_text: str, new_text: str) -> None:
+        with self._notes_index_lock:
+            if self._notes_index is not None:
+                self._notes_index.update(course_key, rel_path, old_text, new_text)
+            else:
+                self._pending_index_updates.append((course_key, rel_path, old_text, new_text))
+        if not self.get_setting("notes_index_dirty", False):
+            self.set_setting("notes_index_dirty", True)
+
+    def _save_notes_index(self) -> None:
+        if self._pending_index_updates:
+            self._get_notes_index()
+        if self._notes_index is not None and self._notes_index.dirty:
+            if self._notes_index.save():
+                self.set_setting("notes_index_dirty", False)
+
+    # El índice pasa a estar vacío (y marcado para guardarse) tras borrar todos los apuntes.
+    def _reset_notes_index(self) -> None:
+        index = NotesIndex(os.path.join(self.app_data_dir, NOTES_INDEX_FILE_NAME))
+        index.clear()
+        with self._notes_index_lock:
+            self._notes_index = index
+            self._pending_index_updates = []
+        self.set_setting("notes_index_dirty", True)
+
+    # =================================================
+    # GESTIÓN DE TEST Y EVALUACIONES
+    # =================================================
+    
+    # Recupera el historial de exámenes y añade nuevos intentos.
+
+    def get_test_history(self, course_path: str, test_name: str) -> List[Dict[str, Any]]:
+        return self._store.get_test_history(self._get_course_key(course_path), test_name)
+    
+    # Registra el resultado de una evaluación realizada por el usuario.
+    
+    def add_test_attempt(self, course_path: str, test_name: str, attempt_data: Dict[str, Any]) -> None:
+        self._store.add_test_attempt(self._get_course_key(course_path), test_name, attempt_data)
+
+    # Recorre los intentos como tuplas (clave_curso, nombre_test, datos). Con course_path=None recorre todos los cursos.
+    def iter_test_attempts(self, course_path: Optional[str] = None) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+        course_key = self._get_course_key(course_path) if course_path else None
+        return self._store.iter_test_attempts(course_key)
+
+    # =================================================
+    # GESTIÓN DE DATOS (RESET Y LIMPIEZA)
+    # =================================================
+    
+    # Funciones para borrar apuntes, historial o reiniciar la app de fábrica.
+
+    # Borra/limpia todos los apuntes que ha realizado el usuario.
+    def clear_all_notes(self) -> None:
+        self._store.clear_notes()
+        self._reset_notes_index()
+
+    # Borra/limpia todo el historial de vídeos/audios completados que ha realizado el usuario.
+    def clear_all_history(self) -> None:
+        self._store.clear_history()
+
+    # Borra/limpia todo el historial de puntajes de evaluaciones que ha realizado el usuario.
+    def clear_all_tests(self) -> None:
+        self._store.clear_tests()
+
+    # Borra/limpia todo los datos almacenados (USER_DATA).
+    def reset_all_data(self) -> None:
+        with self._positions_lock:
+            self._pending_positions = {}
+        current_theme = self.get_theme()
+        self._store.reset({"theme": current_theme, "ide_path": ""})
+        self._reset_notes_index()
+    
+    
+
+
+# =================================================
+# INSTANCIA COMPARTIDA (GET_DATA_MANAGER)
+# =================================================
+
+# Toda la aplicación (main.py, MainWindow y diálogos) debe usar el mismo DataManager: dos instancias sobre los
+# mismos archivos leerían los datos dos veces y se pisarían al guardar. Se crea la primera vez que se pide.
+
+_shared_instance: Optional[DataManager] = None
+_shared_lock = threading.Lock()
+
+def get_data_manager() -> DataManager:
+    global _shared_instance
+    if _shared_instance is None:
+        with _shared_lock:
+            if _shared_instance is None:
+                _shared_instance = DataManager()
+    return _shared_instance
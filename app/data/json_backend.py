@@ -0,0 +1,666 @@
+"""
+Función: Motor de almacenamiento JSON (user_data.data + un archivo por curso).
+
+La configuración se guarda en user_data.data (archivo pequeño) y los datos de
+cada curso (historial, apuntes, evaluaciones, posiciones de reproducción) en su
+propio archivo dentro de la carpeta de cursos. Los cursos se leen la primera vez
+que se usan y al guardar solo se reescriben los archivos que han cambiado.
+
+Con el diario (journal) activado, cada modificación se añade como una línea
+compacta a user_data.data.journal y los archivos solo se reescriben al
+"compactar" (cuando el diario supera un tamaño o al cerrar la aplicación).
+Al arrancar se reaplica el diario sobre los archivos.
+
+"""
+
+# =================================================
+# IMPORTACIONES NECESARIAS
+# =================================================
+
+import os
+import json
+import time
+import hashlib
+import threading
+
+from typing import Dict, List, Any, Iterator, Optional, Tuple, IO, Set, AbstractSet
+from app.config import DEFAULT_THEME
+from app.data.storage import StorageBackend
+from app.data.write_behind import WriteBehindWriter
+from app.data import codec
+
+
+# =================================================
+# CLASE JSONBACKEND (CONFIGURACIÓN + UN ARCHIVO POR CURSO)
+# =================================================
+
+# Archivos:
+#   user_data.data          -> {"config": {...}, "journal_seq": N}
+#   <cursos>/<hash>.data    -> {"course_key": clave, "journal_seq": N, "history": [...], "notes": {...}, "tests": {...},
+#                               "positions": {ruta: ms}}
+# 'journal_seq' es la última operación del diario incluida en ese archivo; al reaplicar el diario se saltan las anteriores.
+#
+# Toda modificación se expresa como una operación (diccionario pequeño) que se aplica en memoria con _apply().
+# Así la misma función sirve para el uso normal y para reaplicar el diario al arrancar.
+# El antiguo user_data.data con todos los cursos dentro se separa automáticamente en archivos la primera vez.
+
+class JsonBackend(StorageBackend):
+
+    # =================================================
+    # CONSTRUCTOR (__INIT__)
+    # =================================================
+
+    # write_behind: los guardados (o compactaciones) se hacen en un hilo de fondo, como máximo cada 'flush_interval_ms'.
+    # journal: cada cambio se añade al diario; 'compact_bytes' es el tamaño del diario que dispara la compactación.
+    # compact_format: los archivos se escriben minificados y comprimidos (ver codec.py). Al leer se aceptan ambos formatos.
+
+    def __init__(self, data_file_path: str, shards_dir: str, write_behind: bool = True, flush_interval_ms: int = 0,
+                 journal: bool = False, compact_bytes: int = 0, compact_format: bool = False):
+        super().__init__()
+        self.data_file_path = data_file_path
+        self.shards_dir = shards_dir
+        self.journal_path = data_file_path + ".journal"
+        self.compact_format = compact_format
+
+        # Cursos en memoria: clave_curso -> {"history": [...], "notes": {...}, "tests": {...}, "positions": {...}}
+        self._courses: Dict[str, Dict[str, Any]] = {}
+        # Índice en memoria del historial: clave_curso -> set de rutas vistas (se crea al primer uso).
+        # La lista "history" se conserva porque es lo que se guarda en disco (y mantiene el orden).
+        self._history_index: Dict[str, Set[str]] = {}
+
+        # Qué hay que escribir en el próximo guardado.
+        self._config_dirty = False
+        self._dirty_courses: Set[str] = set()
+
+        # Operaciones del diario pendientes de aplicar a cursos que aún no se han leído del disco.
+        self._pending_ops: Dict[str, List[Dict[str, Any]]] = {}
+        self._pending_global: List[Dict[str, Any]] = []
+        self._all_loaded = False
+
+        # Protege los datos y el diario mientras el hilo de escritura serializa.
+        self._lock = threading.RLock()
+        # Evita dos guardados simultáneos (hilo de fondo vs. cierre).
+        self._save_lock = threading.Lock()
+        self._writer: Optional[WriteBehindWriter] = None
+        if write_behind:
+            self._writer = WriteBehindWriter(self.save, flush_interval_ms)
+
+        # Estado del diario
+        self._journal_enabled = journal
+        self._compact_bytes = compact_bytes
+        self._journal_file: Optional[IO[str]] = None
+        self._seq = 0
+        # Última secuencia escrita en user_data.data.
+        self._config_seq = 0
+        self._journal_bytes = 0
+        self._journal_entries = 0
+
+        # Contadores
+        self._journal_appends = 0
+        self._compactions = 0
+        self._last_compaction_ms = 0.0
+        self._shards_loaded = 0
+        self._shards_written = 0
+
+    # =================================================
+    # CARGAR DATOS (LOAD)
+    # =================================================
+
+    # Lee solo la configuración y reaplica el diario. Los cursos se leen bajo demanda (_course).
+    # Si user_data.data no existe o está corrupto, se empieza con una configuración por defecto.
+
+    def load(self) -> None:
+        data = self._read_json(self.data_file_path) or {}
+
+        self.config = data.get("config") or {"theme": DEFAULT_THEME, "ide_path": ""}
+        self._seq = data.get("journal_seq", 0)
+        config_seq = self._config_seq = self._seq
+
+        # Formato antiguo: todos los cursos dentro de user_data.data. Se cargan ya y se separan al guardar.
+        legacy_courses = data.get("courses")
+        migrating = legacy_courses is not None
+        if migrating:
+            for key, course in legacy_courses.items():
+                self._courses[key] = self._normalize_course(course)
+                self._dirty_courses.add(key)
+            self._config_dirty = True
+            self._all_loaded = True
+
+        self._replay_journal(config_seq)
+
+        if migrating:
+            self._save_now()
+
+    # Lee un archivo de datos (JSON legible o compacto). Devuelve None si no existe o no se puede leer.
+    def _read_json(self, path: str) -> Optional[Dict[str, Any]]:
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'rb') as f:
+                return codec.decode(f.read())
+        except (ValueError, IOError):
+            return None
+
+    @staticmethod
+    def _normalize_course(course: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        course = course or {}
+        return {
+            "history": course.get("history", []),
+            "notes": course.get("notes", {}),
+            "tests": course.get("tests", {}),
+            "positions": course.get("positions", {})
+        }
+
+    # =================================================
+    # ARCHIVOS DE CURSO (SHARDS)
+    # =================================================
+
+    # Nombre de archivo estable para la clave del curso (la ruta no sirve como nombre de archivo).
+    def _shard_path(self, course_key: str) -> str:
+        digest = hashlib.sha1(course_key.encode('utf-8')).hexdigest()[:20]
+        return os.path.join(self.shards_dir, f"{digest}.data")
+
+    # Devuelve el curso en memoria, leyéndolo del disco (y aplicándole el diario pendiente) la primera vez.
+    # Un curso sin archivo se representa vacío; solo se escribe si llega a modificarse.
+
+    def _course(self, course_key: str) -> Dict[str, Any]:
+        course = self._courses.get(course_key)
+        if course is not None:
+            return course
+
+        shard = self._read_json(self._shard_path(course_key))
+        course = self._normalize_course(shard)
+        self._courses[course_key] = course
+        shard_seq = 0
+        if shard is not None:
+            self._shards_loaded += 1
+            shard_seq = shard.get("journal_seq", 0)
+            self._seen_seq(shard_seq)
+
+        self._apply_pending(course_key, shard_seq)
+        return course
+
+    # Las nuevas operaciones del diario deben numerarse por encima de la secuencia de cualquier archivo ya escrito;
+    # si no, al reaplicar el diario tras un cierre inesperado se saltarían por "ya incluidas". Normalmente
+    # user_data.data ya guarda la mayor, pero un archivo escrito por una versión anterior puede ir por delante.
+    def _seen_seq(self, shard_seq: int) -> None:
+        if shard_seq > self._seq:
+            self._seq = shard_seq
+
+    # Aplica (en orden) las operaciones del diario que afectan al curso y que su archivo aún no incluía.
+    def _apply_pending(self, course_key: str, shard_seq: int) -> None:
+        ops = self._pending_ops.pop(course_key, []) + self._pending_global
+        ops = sorted((op for op in ops if op["seq"] > shard_seq), key=lambda op: op["seq"])
+        for op in ops:
+            self._apply_to_course(course_key, op)
+
+    # Lee todos los archivos de curso (búsquedas globales, limpiezas, compactación con operaciones globales pendientes).
+    def _load_all(self) -> None:
+        if self._all_loaded:
+            return
+        loaded_files = {os.path.basename(self._shard_path(key)) for key in self._courses}
+        try:
+            names = os.listdir(self.shards_dir)
+        except OSError:
+            names = []
+        for name in names:
+            if not name.endswith(".data") or name in loaded_files:
+                continue
+            shard = self._read_json(os.path.join(self.shards_dir, name))
+            if not shard or "course_key" not in shard:
+                continue
+            key = shard["course_key"]
+            self._courses[key] = self._normalize_course(shard)
+            self._shards_loaded += 1
+            self._seen_seq(shard.get("journal_seq", 0))
+            self._apply_pending(key, shard.get("journal_seq", 0))
+
+        # Operaciones de cursos que nunca llegaron a tener archivo.
+        for key in list(self._pending_ops):
+            self._course(key)
+        self._pending_global = []
+        self._all_loaded = True
+
+    # =================================================
+    # REAPLICAR DIARIO (_REPLAY_JOURNAL)
+    # =================================================
+
+    # La configuración se actualiza ya; las operaciones de cursos se guardan para cuando se lea cada curso.
+    # Una última línea incompleta (cierre inesperado a mitad de escritura) se descarta.
+
+    def _replay_journal(self, config_seq: int) -> None:
+        if not os.path.exists(self.journal_path):
+            return
+
+        damaged = False
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    self._journal_bytes += len(line.encode('utf-8'))
+                    try:
+                        op = json.loads(line)
+                    except json.JSONDecodeError:
+                        damaged = True
+                        break
+                    self._replay_op(op, config_seq)
+                    self._seq = max(self._seq, op.get("seq", 0))
+                    self._journal_entries += 1
+        except IOError as e:
+            print(f"Advertencia: no se pudo leer el diario de datos: {e}")
+            return
+
+        # Quitar la línea dañada para que las nuevas operaciones no se añadan detrás de ella.
+        if damaged:
+            self._truncate_journal(0)
+
+    def _replay_op(self, op: Dict[str, Any], config_seq: int) -> None:
+        kind = op.get("op")
+        newer = op.get("seq", 0) > config_seq
+        if kind in ("cfg", "reset") and newer:
+            self._apply_config(op)
+        if kind == "cfg":
+            return
+
+        # Los cursos ya en memoria solo pueden venir del formato antiguo (misma secuencia que la configuración).
+        if kind in ("clear", "reset"):
+            if newer:
+                for key in self._courses:
+                    self._apply_to_course(key, op)
+            if not self._all_loaded:
+                self._pending_global.append(op)
+        elif op["c"] in self._courses:
+            if newer:
+                self._apply_to_course(op["c"], op)
+        else:
+            self._pending_ops.setdefault(op["c"], []).append(op)
+
+    # =================================================
+    # GUARDAR DATOS / COMPACTAR (SAVE)
+    # =================================================
+
+    # Escribe la configuración y los cursos modificados. Con diario, además recorta del diario lo que ya quedó escrito.
+    # user_data.data se reescribe también cuando avanzó la secuencia del diario aunque la configuración no cambiase:
+    # su 'journal_seq' es el punto de partida de la numeración en el próximo arranque.
+    # Si la escritura falla, lo pendiente se conserva y se relanza el error (el escritor diferido lo reintentará).
+
+    def save(self) -> None:
+        with self._save_lock:
+            start = time.perf_counter()
+
+            # La serialización se hace bajo el candado; la escritura física ya no lo necesita.
+            with self._lock:
+                # Las operaciones del diario de cursos aún no leídos se perderían al recortarlo: se aplican antes.
+                if self._journal_enabled:
+                    if self._pending_global:
+                        self._load_all()
+                    for key in list(self._pending_ops):
+                        self._course(key)
+
+                snapshot_seq = self._seq
+                writes: List[Tuple[str, Optional[bytes]]] = []
+                write_config = self._config_dirty or snapshot_seq > self._config_seq
+                if write_config:
+                    payload = {"config": self.config, "journal_seq": snapshot_seq}
+                    writes.append((self.data_file_path, codec.encode(payload, self.compact_format)))
+                for key in self._dirty_courses:
+                    course = self._courses[key]
+                    if not (course["history"] or course["notes"] or course["tests"] or course["positions"]):
+                        writes.append((self._shard_path(key), None))
+                        continue
+                    payload = dict(course_key=key, journal_seq=snapshot_seq, **course)
+                    writes.append((self._shard_path(key), codec.encode(payload, self.compact_format)))
+
+                dirty_courses, config_dirty = self._dirty_courses, self._config_dirty
+                self._dirty_courses, self._config_dirty = set(), False
+
+            try:
+                self._write_files(writes)
+            except (IOError, OSError):
+                # Se reintentará en el próximo guardado.
+                with self._lock:
+                    self._dirty_courses |= dirty_courses
+                    self._config_dirty = self._config_dirty or config_dirty
+                raise
+            if write_config:
+                self._config_seq = snapshot_seq
+
+            if self._journal_enabled:
+                self._truncate_journal(snapshot_seq)
+                self._compactions += 1
+                self._last_compaction_ms = (time.perf_counter() - start) * 1000.0
+
+    # Escritura atómica de cada archivo (None = el curso quedó vacío y su archivo se borra).
+    def _write_files(self, writes: List[Tuple[str, Optional[bytes]]]) -> None:
+        for path, content in writes:
+            if content is None:
+                if os.path.exists(path):
+                    os.remove(path)
+                continue
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+            if path != self.data_file_path:
+                self._shards_written += 1
+
+    # Guardado en el hilo que llama (sin escritor diferido, migración, cierre): un fallo se informa y lo pendiente
+    # se conserva para el próximo intento.
+    def _save_now(self) -> bool:
+        try:
+            self.save()
+        except (IOError, OSError) as e:
+            print(f"Error crítico guardando datos: {e}")
+            return False
+        return True
+
+    def _has_unsaved(self) -> bool:
+        with self._lock:
+            return bool(self._dirty_courses) or self._config_dirty
+
+    # Reescribe el diario conservando solo las operaciones posteriores a 'snapshot_seq'
+    # (las que llegaron mientras se escribían los archivos).
+
+    def _truncate_journal(self, snapshot_seq: int) -> None:
+        with self._lock:
+            self._close_journal_file()
+            kept: List[str] = []
+            try:
+                if os.path.exists(self.journal_path):
+                    with open(self.journal_path, 'r', encoding='utf-8') as f:
+                        for line in f:
+                            try:
+                                if json.loads(line).get("seq", 0) > snapshot_seq:
+                                    kept.append(line)
+                            except json.JSONDecodeError:
+                                break
+
+                tmp_path = self.journal_path + ".tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.writelines(kept)
+                os.replace(tmp_path, self.journal_path)
+            except IOError as e:
+                print(f"Error crítico compactando el diario de datos: {e}")
+                return
+
+            self._journal_entries = len(kept)
+            self._journal_bytes = sum(len(line.encode('utf-8')) for line in kept)
+
+    # =================================================
+    # DIARIO DE CAMBIOS (_COMMIT / _APPEND_JOURNAL)
+    # =================================================
+
+    # Aplica una operación en memoria y la hace persistente: una línea en el diario o, sin diario, un guardado diferido.
+
+    def _commit(self, op: Dict[str, Any]) -> None:
+        needs_save = not self._journal_enabled
+        with self._lock:
+            self._apply(op)
+            if self._journal_enabled:
+                self._append_journal(op)
+                needs_save = self._journal_bytes >= self._compact_bytes
+        if needs_save:
+            self._mark_dirty()
+
+    # Añade la operación al final del diario (una línea JSON compacta con número de secuencia).
+    def _append_journal(self, op: Dict[str, Any]) -> None:
+        self._seq += 1
+        entry = dict(op, seq=self._seq)
+        line = json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n"
+        try:
+            if self._journal_file is None:
+                self._journal_file = open(self.journal_path, 'a', encoding='utf-8')
+            self._journal_file.write(line)
+            self._journal_file.flush()
+        except IOError as e:
+            print(f"Error crítico guardando datos: {e}")
+            return
+        self._journal_bytes += len(line.encode('utf-8'))
+        self._journal_entries += 1
+        self._journal_appends += 1
+
+    def _close_journal_file(self) -> None:
+        if self._journal_file is not None:
+            try:
+                self._journal_file.close()
+            except IOError:
+                pass
+            self._journal_file = None
+
+    # =================================================
+    # APLICAR OPERACIÓN (_APPLY)
+    # =================================================
+
+    # Operaciones: cfg (configuración), done (historial), note (apunte), test (intento), pos (posiciones de
+    # reproducción), clear (limpieza), reset.
+    # clear y reset afectan a todos los cursos, así que antes se leen todos.
+
+    def _apply(self, op: Dict[str, Any]) -> None:
+        kind = op.get("op")
+        if kind in ("cfg", "reset"):
+            self._apply_config(op)
+        if kind == "cfg":
+            return
+
+        if kind in ("clear", "reset"):
+            self._load_all()
+            for key in self._courses:
+                self._apply_to_course(key, op)
+        else:
+            self._course(op["c"])
+            self._apply_to_course(op["c"], op)
+
+    def _apply_config(self, op: Dict[str, Any]) -> None:
+        if op["op"] == "cfg":
+            self.config[op["k"]] = op["v"]
+        else:
+            self.config = dict(op["v"])
+        self._config_dirty = True
+
+    # Aplica una operación a un curso que ya está en memoria y lo marca como modificado.
+    def _apply_to_course(self, course_key: str, op: Dict[str, Any]) -> None:
+        course = self._courses[course_key]
+        kind = op["op"]
+        if kind == "done":
+            history_list = course["history"]
+            history_set = self._history_set(course_key)
+            rel_path = op["p"]
+            if op["v"]:
+                if rel_path not in history_set:
+                    history_set.add(rel_path)
+                    history_list.append(rel_path)
+            else:
+                if rel_path in history_set:
+                    history_set.discard(rel_path)
+                    history_list.remove(rel_path)
+        elif kind == "note":
+            course["notes"][op["p"]] = op["v"]
+        elif kind == "test":
+            course["tests"].setdefault(op["t"], []).append(op["v"])
+        elif kind == "pos":
+            positions = course["positions"]
+            for rel_path, position in op["v"].items():
+                if position:
+                    positions[rel_path] = position
+                else:
+                    positions.pop(rel_path, None)
+        elif kind == "clear":
+            course[op["v"]] = [] if op["v"] == "history" else {}
+            if op["v"] == "history":
+                self._history_index.pop(course_key, None)
+        elif kind == "reset":
+            course.update(self._normalize_course(None))
+            self._history_index.pop(course_key, None)
+        self._dirty_courses.add(course_key)
+
+    # =================================================
+    # ESCRITURA DIFERIDA (WRITE-BEHIND)
+    # =================================================
+
+    # Pide un guardado (compactación si hay diario). Sin escritor diferido se guarda al instante.
+
+    def _mark_dirty(self) -> None:
+        if self._writer is not None:
+            self._writer.mark_dirty()
+        else:
+            self._save_now()
+
+    # Con diario: compacta si hay operaciones pendientes (cierre limpio). Sin diario: vuelca lo pendiente, también lo
+    # que quedó de un guardado fallido aunque el escritor diferido ya no lo tenga marcado.
+    def flush(self) -> None:
+        if self._journal_enabled:
+            if self._journal_entries:
+                self._save_now()
+            return
+        if self._writer is not None:
+            self._writer.flush()
+        if self._has_unsaved():
+            self._save_now()
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        self.flush()
+        with self._lock:
+            self._close_journal_file()
+
+    def stats(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {
+            "backend": "json",
+            "write_behind": self._writer is not None,
+            "courses_in_memory": len(self._courses),
+            "shards_loaded": self._shards_loaded,
+            "shards_written": self._shards_written,
+        }
+        if self._writer is not None:
+            stats.update(self._writer.stats())
+        if self._journal_enabled:
+            stats.update({
+                "journal_appends": self._journal_appends,
+                "journal_entries": self._journal_entries,
+                "journal_bytes": self._journal_bytes,
+                "compactions": self._compactions,
+                "last_compaction_ms": round(self._last_compaction_ms, 3),
+            })
+        return stats
+
+    # Copia completa en el formato antiguo {"config": ..., "courses": ...}. Lee todos los cursos (migración a SQLite).
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            self._load_all()
+            courses = {key: course for key, course in self._courses.items()
+                       if course["history"] or course["notes"] or course["tests"] or course["positions"]}
+            return json.loads(json.dumps({"config": self.config, "courses": courses}))
+
+    # =================================================
+    # CONFIGURACIÓN
+    # =================================================
+
+    def set_config(self, key: str, value: Any) -> None:
+        self._commit({"op": "cfg", "k": key, "v": value})
+
+    # =================================================
+    # HISTORIAL (VÍDEOS COMPLETADOS)
+    # =================================================
+
+    # Devuelve (creándolo si hace falta) el set del historial del curso, sincronizado con su lista.
+    def _history_set(self, course_key: str) -> Set[str]:
+        history_set = self._history_index.get(course_key)
+        if history_set is None:
+            history_set = set(self._course(course_key)["history"])
+            self._history_index[course_key] = history_set
+        return history_set
+
+    def is_completed(self, course_key: str, rel_path: str) -> bool:
+        with self._lock:
+            return rel_path in self._history_set(course_key)
+
+    def completed_set(self, course_key: str) -> AbstractSet[str]:
+        with self._lock:
+            return frozenset(self._history_set(course_key))
+
+    def set_completed(self, course_key: str, rel_path: str, completed: bool) -> None:
+        self._commit({"op": "done", "c": course_key, "p": rel_path, "v": bool(completed)})
+
+    def iter_history(self, course_key: Optional[str] = None) -> Iterator[Tuple[str, str]]:
+        for key in self._course_keys(course_key):
+            with self._lock:
+                history = list(self._courses[key]["history"])
+            for rel in history:
+                yield key, rel
+
+    # =================================================
+    # APUNTES
+    # =================================================
+
+    def get_note(self, course_key: str, rel_path: str) -> str:
+        with self._lock:
+            return self._course(course_key)["notes"].get(rel_path, "")
+
+    def set_note(self, course_key: str, rel_path: str, text: str) -> None:
+        self._commit({"op": "note", "c": course_key, "p": rel_path, "v": text})
+
+    def iter_notes(self, course_key: Optional[str] = None) -> Iterator[Tuple[str, str, str]]:
+        for key in self._course_keys(course_key):
+            # Copia por curso: el generador puede consumirse (incluso en otro hilo) mientras se modifican los datos.
+            with self._lock:
+                notes = list(self._courses[key]["notes"].items())
+            for rel, text in notes:
+                yield key, rel, text
+
+    # Claves de los cursos a recorrer (uno concreto o todos), ya cargados en memoria.
+    def _course_keys(self, course_key: Optional[str]) -> List[str]:
+        with self._lock:
+            if course_key is not None:
+                self._course(course_key)
+                return [course_key]
+            self._load_all()
+            return list(self._courses.keys())
+
+    # =================================================
+    # POSICIONES DE REPRODUCCIÓN (REANUDAR)
+    # =================================================
+
+    def get_position(self, course_key: str, rel_path: str) -> int:
+        with self._lock:
+            return self._course(course_key)["positions"].get(rel_path, 0)
+
+    # Una sola operación (una línea del diario) para todas las posiciones recibidas.
+    def set_positions(self, course_key: str, positions: Dict[str, int]) -> None:
+        if positions:
+            self._commit({"op": "pos", "c": course_key, "v": dict(positions)})
+
+    # =================================================
+    # EVALUACIONES
+    # =================================================
+
+    def get_test_history(self, course_key: str, test_name: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            return self._course(course_key)["tests"].get(test_name, [])
+
+    def add_test_attempt(self, course_key: str, test_name: str, attempt_data: Dict[str, Any]) -> None:
+        self._commit({"op": "test", "c": course_key, "t": test_name, "v": attempt_data})
+
+    def iter_test_attempts(self, course_key: Optional[str] = None) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+        for key in self._course_keys(course_key):
+            with self._lock:
+                tests = [(name, list(attempts)) for name, attempts in self._courses[key]["tests"].items()]
+            for name, attempts in tests:
+                for attempt in attempts:
+                    yield key, name, attempt
+
+    # =================================================
+    # LIMPIEZA Y RESET
+    # =================================================
+
+    def clear_notes(self) -> None:
+        self._commit({"op": "clear", "v": "notes"})
+
+    def clear_history(self) -> None:
+        self._commit({"op": "clear", "v": "history"})
+
+    def clear_tests(self) -> None:
+        self._commit({"op": "clear", "v": "tests"})
+
+    def reset(self, config: Dict[str, Any]) -> None:
+        self._commit({"op": "reset", "v": config})
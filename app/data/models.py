@@ -1,43 +1,240 @@
-"""
-Función: Definición de estructuras de datos.
-
-Define clases simples (dataclasses) como VideoItem y CourseStructure. Aunque en este
-código se usa poco, sirve para estructurar la información de un video
-de forma ordenada.
-
-"""
-
-# =================================================
-# IMPORTACIONES NECESARIAS
-# =================================================
-
-# Importamos dataclasses para crear estructuras de datos limpias y tipado para validación.
-from dataclasses import dataclass, field
-from typing import List, Optional
-
-# =================================================
-# CLASE VIDEOITEM (MODELO DE DATOS)
-# =================================================
-
-# Representa un único archivo de video dentro del sistema.
-# Almacena su ruta, título, si ya fue completado y los apuntes asociados.
-
-@dataclass
-class VideoItem:
-    path: str
-    title: str
-    is_completed: bool = False
-    notes: str = ""
-
-# =================================================
-# CLASE COURSESTRUCTURE (ESTRUCTURA DEL CURSO)
-# =================================================
-
-# Modelo para representar la estructura completa de un curso.
-# Contiene la ruta raíz y una lista de objetos VideoItem.
-# (Preparado para expansiones futuras de la lógica).
-
-@dataclass
-class CourseStructure:
-    root_path: str
-    videos: List[VideoItem] = field(default_factory=list)
\ No newline at end of file
+"""
+Función: Definición de estructuras de datos del curso (CourseIndex).
+
+Describe un curso ya escaneado: capítulos, audios/vídeos, evaluaciones,
+carpetas de ejercicios y archivos de recursos (y los metadatos de cada
+audio/vídeo: MediaInfo). Son clases simples con
+__slots__ (poca memoria aunque el curso tenga miles de archivos) y sin
+dependencias de Qt: las construye app/logic/scanner.py y las usan el árbol,
+la navegación, la exportación y el panel de ejercicios.
+
+"""
+
+# =================================================
+# IMPORTACIONES NECESARIAS
+# =================================================
+
+import os
+import re
+from functools import lru_cache
+from typing import AbstractSet, Dict, Iterable, Iterator, List, Optional, Tuple, Union, Any
+
+from app.data.notes_index import fold_text
+
+_DIGITS_RE = re.compile(r"(\d+)")
+
+
+# Clave para comparar rutas (en Windows no distingue mayúsculas, ni '/' de '\').
+def path_key(path: str) -> str:
+    return os.path.normcase(os.path.normpath(path))
+
+
+# Clave de orden natural de un nombre de archivo o carpeta: los números se comparan por su valor ("2 - Variables"
+# antes que "10 - Closures") y sin distinguir mayúsculas ni tildes. A igualdad, decide el nombre tal cual.
+# Los listados se guardan ya en este orden (CourseIndex.listings y la caché de escaneo): al revalidar o actualizar
+# el curso solo se ordenan las carpetas que cambiaron, y los nombres recientes no se vuelven a analizar (caché).
+@lru_cache(maxsize=16384)
+def natural_key(name: str) -> tuple:
+    parts = _DIGITS_RE.split(fold_text(name))
+    parts[1::2] = map(int, parts[1::2])
+    return tuple(parts), name
+
+# =================================================
+# CLASE MEDIAITEM (AUDIO / VÍDEO)
+# =================================================
+
+# Representa un único archivo de audio o vídeo dentro del curso.
+# kind: "video" (cursos de vídeo, aunque el archivo sea de audio) o "audio" (carpetas de audios/grabaciones).
+
+class MediaItem:
+    __slots__ = ("path", "rel_path", "title", "kind", "chapter")
+
+    def __init__(self, path: str, rel_path: str, title: str, kind: str, chapter: "ChapterItem"):
+        self.path = path
+        self.rel_path = rel_path
+        self.title = title
+        self.kind = kind
+        self.chapter = chapter
+
+    @property
+    def folder(self) -> str:
+        return os.path.dirname(self.path)
+
+    # Diccionario que guarda cada nodo del árbol (UserRole), con las mismas claves que usa MainWindow.
+    def item_data(self) -> Dict[str, Any]:
+        if self.kind == "audio":
+            return {
+                "type": "audio",
+                "chapter_title": self.chapter.title,
+                "audio_title": os.path.splitext(os.path.basename(self.path))[0],
+                "audio_path": self.path,
+                "parent_dir": self.folder,
+            }
+        return {"type": "media", "path": self.path, "parent_dir": self.folder}
+
+    def __repr__(self) -> str:
+        return f"MediaItem({self.rel_path!r})"
+
+# =================================================
+# CLASE MEDIAINFO (METADATOS DE UN AUDIO / VÍDEO)
+# =================================================
+
+# Metadatos de un archivo leídos por app/logic/media_info.py: duración (ms), resolución, códec (fourcc de la pista
+# principal) y bitrate medio (bits/s). 'size' y 'mtime_ns' son los del archivo cuando se leyó: si no cambian, los
+# metadatos siguen valiendo. duration_ms = 0 si VLC no pudo leerlo (se reintenta en la próxima lectura del curso).
+
+class MediaInfo:
+    __slots__ = ("size", "mtime_ns", "duration_ms", "width", "height", "codec", "bitrate")
+
+    def __init__(self, size: int, mtime_ns: int, duration_ms: int = 0, width: int = 0, height: int = 0,
+                 codec: str = "", bitrate: int = 0):
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.duration_ms = duration_ms
+        self.width = width
+        self.height = height
+        self.codec = codec
+        self.bitrate = bitrate
+
+    def matches(self, stat: os.stat_result) -> bool:
+        return self.size == stat.st_size and self.mtime_ns == stat.st_mtime_ns
+
+    # Forma compacta para la caché en disco (ver MediaInfoWorker en app/gui/tree_manager.py).
+    def to_list(self) -> list:
+        return [self.size, self.mtime_ns, self.duration_ms, self.width, self.height, self.codec, self.bitrate]
+
+    @classmethod
+    def from_list(cls, values: list) -> "MediaInfo":
+        return cls(*values)
+
+    def __repr__(self) -> str:
+        return f"MediaInfo({self.duration_ms} ms, {self.width}x{self.height}, {self.codec!r})"
+
+# Duración total y pendiente (la de los no vistos, según 'completed': rutas relativas) de 'media', en ms, con los
+# metadatos conocidos ('info': ruta relativa -> MediaInfo). 'missing' = archivos cuya duración aún no se conoce.
+def duration_totals(media: Iterable[MediaItem], info: Dict[str, MediaInfo],
+                    completed: AbstractSet[str]) -> Tuple[int, int, int]:
+    total = remaining = missing = 0
+    for item in media:
+        media_info = info.get(item.rel_path)
+        if media_info is None or not media_info.duration_ms:
+            missing += 1
+            continue
+        total += media_info.duration_ms
+        if item.rel_path not in completed:
+            remaining += media_info.duration_ms
+    return total, remaining, missing
+
+# =================================================
+# CLASE TESTITEM (EVALUACIÓN)
+# =================================================
+
+# Archivo .test de la carpeta "Tests" de un capítulo.
+
+class TestItem:
+    __slots__ = ("path", "title")
+
+    def __init__(self, path: str, title: str):
+        self.path = path
+        self.title = title
+
+    def item_data(self) -> Dict[str, Any]:
+        return {"type": "test", "path": self.path}
+
+# =================================================
+# CLASE CHAPTERITEM (CAPÍTULO / CARPETA)
+# =================================================
+
+# Una carpeta del curso. 'entries' guarda, en el orden en que se muestran, sus audios/vídeos y subcarpetas
+# (los cursos de audio pueden anidar carpetas). Además recuerda lo que el panel de ejercicios necesita:
+# carpetas "Ejercicio..." y archivos de recursos (PDF, ZIP...), obtenidos en el mismo recorrido.
+
+class ChapterItem:
+    __slots__ = ("path", "name", "title", "parent", "entries", "tests", "exercises", "resources")
+
+    def __init__(self, path: str, name: str, title: str, parent: Optional["ChapterItem"] = None):
+        self.path = path
+        self.name = name
+        self.title = title
+        self.parent = parent
+        self.entries: List[Union["ChapterItem", MediaItem]] = []
+        self.tests: List[TestItem] = []
+        self.exercises: List[str] = []      # Rutas de las carpetas de ejercicios.
+        self.resources: List[str] = []      # Rutas de los archivos de recursos.
+
+    # Audios/vídeos de la carpeta y de sus subcarpetas, en orden.
+    def iter_media(self) -> Iterator[MediaItem]:
+        for entry in self.entries:
+            if isinstance(entry, MediaItem):
+                yield entry
+            else:
+                yield from entry.iter_media()
+
+    def __repr__(self) -> str:
+        return f"ChapterItem({self.name!r}, {len(self.entries)} entradas)"
+
+# =================================================
+# CLASE COURSEINDEX (ESTRUCTURA DEL CURSO)
+# =================================================
+
+# Curso completo. 'root' es la carpeta raíz (sus 'entries' son los archivos sueltos y los capítulos) y 'media' la
+# lista de todos los audios/vídeos en orden de reproducción (el mismo orden del árbol), con la posición de cada uno
+# por ruta para que anterior/siguiente no recorran la lista.
+# 'listings' guarda el listado de cada carpeta con su fecha de modificación (lo que se persiste en la caché de
+# escaneo) y 'changed' indica si difiere de los listados con los que se validó.
+
+class CourseIndex:
+    __slots__ = ("root_path", "kind", "root", "media", "_media_by_path", "_positions", "_folders", "listings",
+                 "changed")
+
+    def __init__(self, root_path: str, kind: str, root: ChapterItem):
+        self.root_path = root_path
+        self.kind = kind
+        self.root = root
+        self.media: List[MediaItem] = []
+        self._media_by_path: Dict[str, MediaItem] = {}
+        self._positions: Dict[str, int] = {}
+        self._folders: Dict[str, ChapterItem] = {}
+        self.listings: Dict[str, list] = {}
+        self.changed = True
+
+    # Registra un capítulo ya completo (y sus subcarpetas) para las búsquedas por ruta y la lista de reproducción.
+    # Las rutas del escáner ya están normalizadas (basta normcase); las que llegan de fuera pasan por path_key().
+    def register_chapter(self, chapter: ChapterItem) -> None:
+        normcase = os.path.normcase
+        self._folders[normcase(chapter.path)] = chapter
+        for entry in chapter.entries:
+            if isinstance(entry, MediaItem):
+                self.register_media(entry)
+            else:
+                self.register_chapter(entry)
+
+    # Añade un audio/vídeo al final del orden de reproducción.
+    def register_media(self, media: MediaItem) -> None:
+        key = os.path.normcase(media.path)
+        self._media_by_path[key] = media
+        self._positions[key] = len(self.media)
+        self.media.append(media)
+
+    # Capítulos de primer nivel (en los cursos de vídeo, los que se muestran en negrita).
+    def chapters(self) -> List[ChapterItem]:
+        return [entry for entry in self.root.entries if isinstance(entry, ChapterItem)]
+
+    def find_media(self, path: str) -> Optional[MediaItem]:
+        return self._media_by_path.get(path_key(path))
+
+    def find_folder(self, path: str) -> Optional[ChapterItem]:
+        return self._folders.get(path_key(path))
+
+    # Audio/vídeo anterior o siguiente (en orden de reproducción) al de 'path'. None si no hay o no pertenece al curso.
+    def neighbour_media(self, path: str, step: int) -> Optional[MediaItem]:
+        position = self._positions.get(path_key(path))
+        if position is None:
+            return None
+        position += step
+        if 0 <= position < len(self.media):
+            return self.media[position]
+        return None
+
+    def __len__(self) -> int:
+        return len(self.media)
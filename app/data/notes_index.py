@@ -0,0 +1,306 @@
+"""
+Función: Índice de búsqueda de texto completo sobre los apuntes de todos los cursos.
+
+Índice invertido (palabra -> apuntes que la contienen) con las palabras en
+minúsculas y sin tildes, para que "funcion" encuentre "Función". Se actualiza
+apunte a apunte cuando se guardan y se persiste en disco, así que no hay que
+reconstruirlo al arrancar.
+
+"""
+
+# =================================================
+# IMPORTACIONES NECESARIAS
+# =================================================
+
+import os
+import re
+import sys
+import json
+import array
+import bisect
+import struct
+import threading
+import unicodedata
+
+from typing import Dict, List, Optional, Set, Tuple, Iterable
+
+# Cabecera del archivo del índice: MAGIC + longitud de la cabecera JSON (4 bytes) + cabecera + ids (uint32).
+MAGIC = b"JLMI\x01"
+
+# Palabras de una sola letra no se indexan (artículos, conjunciones...).
+MIN_TOKEN_LENGTH = 2
+_TOKEN_RE = re.compile(r"\w{%d,}" % MIN_TOKEN_LENGTH)
+_WORD_RE = re.compile(r"\w+")
+
+# Atajo para las tildes del español; el resto de caracteres acentuados pasa por la normalización Unicode.
+_SPANISH_FOLD = str.maketrans("áéíóúüñàèìòùâêîôûäëïöç", "aeiouunaeiouaeiouaeioc")
+
+
+# =================================================
+# NORMALIZACIÓN DE TEXTO (FOLD_TEXT / TOKENIZE)
+# =================================================
+
+# Minúsculas y sin marcas diacríticas: "Canción Ñandú" -> "cancion nandu".
+def fold_text(text: str) -> str:
+    text = text.lower().translate(_SPANISH_FOLD)
+    if text.isascii():
+        return text
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def tokenize(text: str) -> Set[str]:
+    return set(_TOKEN_RE.findall(fold_text(text)))
+
+
+# =================================================
+# CLASE NOTESINDEX (ÍNDICE INVERTIDO)
+# =================================================
+
+# Cada apunte es un documento identificado por un entero (posición en 'self._docs'), que guarda (clave_curso, ruta_relativa).
+# Búsqueda: todas las palabras de la consulta deben aparecer; la última se trata como prefijo (búsqueda mientras se escribe).
+#
+# Al cargar del disco las listas de documentos quedan empaquetadas en un array de enteros ('_packed') y cada palabra
+# solo se convierte en set la primera vez que se usa; así abrir un índice de 100.000 apuntes no cuesta segundos.
+
+class NotesIndex:
+
+    # =================================================
+    # CONSTRUCTOR (__INIT__)
+    # =================================================
+
+    def __init__(self, index_path: str):
+        self.index_path = index_path
+        self._lock = threading.RLock()
+
+        self._docs: List[Optional[Tuple[str, str]]] = []
+        self._doc_ids: Dict[Tuple[str, str], int] = {}
+        self._free_ids: List[int] = []
+
+        # palabra -> set de documentos (ya en uso) / palabra -> (inicio, cantidad) dentro de '_packed' (aún sin usar).
+        self._postings: Dict[str, Set[int]] = {}
+        self._packed_ranges: Dict[str, Tuple[int, int]] = {}
+        self._packed = array.array('I')
+
+        # Vocabulario ordenado para las búsquedas por prefijo (se reordena solo si cambian las palabras).
+        self._vocabulary: List[str] = []
+        self._vocabulary_stale = False
+        self.dirty = False
+
+    # =================================================
+    # CARGAR / GUARDAR (LOAD / SAVE)
+    # =================================================
+
+    # Lee el índice persistido. Devuelve False si no existe o está dañado (hay que reconstruirlo).
+
+    def load(self) -> bool:
+        if not os.path.exists(self.index_path):
+            return False
+        try:
+            with open(self.index_path, 'rb') as f:
+                raw = f.read()
+            if not raw.startswith(MAGIC):
+                return False
+            offset = len(MAGIC)
+            (header_len,) = struct.unpack_from("<I", raw, offset)
+            offset += 4
+            header = json.loads(raw[offset:offset + header_len].decode("utf-8"))
+            packed = array.array('I')
+            packed.frombytes(raw[offset + header_len:])
+            if sys.byteorder == "big":
+                packed.byteswap()
+            docs = [tuple(doc) if doc else None for doc in header["docs"]]
+            ranges = {token: (start, count) for token, start, count in header["tokens"]}
+        except (ValueError, KeyError, TypeError, IOError, struct.error):
+            return False
+
+        with self._lock:
+            self._docs = docs
+            self._doc_ids = {doc: doc_id for doc_id, doc in enumerate(docs) if doc is not None}
+            self._free_ids = [doc_id for doc_id, doc in enumerate(docs) if doc is None]
+            self._postings = {}
+            self._packed_ranges = ranges
+            self._packed = packed
+            self._vocabulary_stale = True
+            self.dirty = False
+        return True
+
+    def save(self) -> bool:
+        with self._lock:
+            tokens = []
+            packed = array.array('I')
+            for token in sorted(self._postings.keys() | self._packed_ranges.keys()):
+                ids = self._postings.get(token)
+                if ids is not None:
+                    values = sorted(ids)
+                else:
+                    start, count = self._packed_ranges[token]
+                    values = self._packed[start:start + count]
+                tokens.append([token, len(packed), len(values)])
+                packed.extend(values)
+            header = json.dumps({"docs": [list(doc) if doc else None for doc in self._docs], "tokens": tokens},
+                                ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            self.dirty = False
+
+        if sys.byteorder == "big":
+            packed.byteswap()
+        try:
+            tmp_path = self.index_path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(MAGIC + struct.pack("<I", len(header)) + header)
+                f.write(packed.tobytes())
+            os.replace(tmp_path, self.index_path)
+        except (IOError, OSError) as e:
+            print(f"Error guardando el índice de apuntes: {e}")
+            with self._lock:
+                self.dirty = True
+            return False
+        return True
+
+    # Vacía el índice y lo llena con los apuntes recibidos como (clave_curso, ruta_relativa, texto).
+    def rebuild(self, notes: Iterable[Tuple[str, str, str]]) -> None:
+        with self._lock:
+            self.clear()
+            postings = self._postings
+            for course_key, rel_path, text in notes:
+                tokens = tokenize(text)
+                if not tokens:
+                    continue
+                doc_id = len(self._docs)
+                self._docs.append((course_key, rel_path))
+                self._doc_ids[(course_key, rel_path)] = doc_id
+                for token in tokens:
+                    ids = postings.get(token)
+                    if ids is None:
+                        postings[token] = {doc_id}
+                    else:
+                        ids.add(doc_id)
+            self._vocabulary_stale = True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._docs, self._doc_ids, self._free_ids = [], {}, []
+            self._postings, self._packed_ranges, self._packed = {}, {}, array.array('I')
+            self._vocabulary = []
+            self._vocabulary_stale = False
+            self.dirty = True
+
+    # Documentos de una palabra como set (desempaquetándolos la primera vez). None si la palabra no está.
+    def _ids(self, token: str) -> Optional[Set[int]]:
+        ids = self._postings.get(token)
+        if ids is None:
+            packed_range = self._packed_ranges.pop(token, None)
+            if packed_range is None:
+                return None
+            start, count = packed_range
+            ids = set(self._packed[start:start + count])
+            self._postings[token] = ids
+        return ids
+
+    # =================================================
+    # ACTUALIZACIÓN INCREMENTAL (UPDATE)
+    # =================================================
+
+    # Sustituye el texto de un apunte: quita las palabras que ya no están y añade las nuevas. Texto vacío = apunte borrado.
+
+    def update(self, course_key: str, rel_path: str, old_text: str, new_text: str) -> None:
+        key = (course_key, rel_path)
+        old_tokens = tokenize(old_text) if old_text else set()
+        new_tokens = tokenize(new_text) if new_text.strip() else set()
+
+        with self._lock:
+            doc_id = self._doc_ids.get(key)
+            if doc_id is None:
+                if not new_tokens:
+                    return
+                if self._free_ids:
+                    doc_id = self._free_ids.pop()
+                    self._docs[doc_id] = key
+                else:
+                    doc_id = len(self._docs)
+                    self._docs.append(key)
+                self._doc_ids[key] = doc_id
+
+            for token in old_tokens - new_tokens:
+                ids = self._ids(token)
+                if ids is not None:
+                    ids.discard(doc_id)
+                    if not ids:
+                        del self._postings[token]
+                        self._vocabulary_stale = True
+
+            for token in new_tokens - old_tokens:
+                ids = self._ids(token)
+                if ids is None:
+                    self._postings[token] = {doc_id}
+                    self._vocabulary_stale = True
+                else:
+                    ids.add(doc_id)
+
+            if not new_tokens:
+                del self._doc_ids[key]
+                self._docs[doc_id] = None
+                self._free_ids.append(doc_id)
+            self.dirty = True
+
+    # =================================================
+    # BÚSQUEDA (SEARCH)
+    # =================================================
+
+    # Devuelve hasta 'limit' apuntes (clave_curso, ruta_relativa) que contienen todas las palabras de la consulta.
+
+    def search(self, query: str, limit: int = 100) -> List[Tuple[str, str]]:
+        words = _WORD_RE.findall(fold_text(query))
+        if not words:
+            return []
+
+        with self._lock:
+            candidate_sets: List[Set[int]] = []
+            # Palabras completas
+            for word in words[:-1]:
+                if len(word) < MIN_TOKEN_LENGTH:
+                    continue
+                ids = self._ids(word)
+                if not ids:
+                    return []
+                candidate_sets.append(ids)
+
+            # Última palabra: prefijo (lo que el usuario está escribiendo). Con una sola letra aún no se filtra por ella.
+            if len(words[-1]) >= MIN_TOKEN_LENGTH:
+                prefix_ids = self._prefix_ids(words[-1])
+                if prefix_ids is None:
+                    return []
+                candidate_sets.append(prefix_ids)
+            if not candidate_sets:
+                return []
+
+            # Intersección empezando por el conjunto más pequeño.
+            candidate_sets.sort(key=len)
+            result = set(candidate_sets[0])
+            for ids in candidate_sets[1:]:
+                result &= ids
+                if not result:
+                    return []
+
+            docs = [self._docs[doc_id] for doc_id in result]
+        docs.sort()
+        return docs[:limit]
+
+    # Unión de los documentos de todas las palabras que empiezan por 'prefix' (None si ninguna).
+    def _prefix_ids(self, prefix: str) -> Optional[Set[int]]:
+        if self._vocabulary_stale:
+            self._vocabulary = sorted(self._postings.keys() | self._packed_ranges.keys())
+            self._vocabulary_stale = False
+
+        vocabulary = self._vocabulary
+        position = bisect.bisect_left(vocabulary, prefix)
+        ids: Set[int] = set()
+        found = False
+        while position < len(vocabulary) and vocabulary[position].startswith(prefix):
+            ids |= self._ids(vocabulary[position])
+            found = True
+            position += 1
+        return ids if found else None
+
+    def __len__(self) -> int:
+        return len(self._doc_ids)
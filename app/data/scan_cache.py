@@ -0,0 +1,79 @@
+"""
+Función: Caché en disco de la estructura de los cursos ya abiertos.
+
+Guarda, por curso, el listado de cada carpeta junto con su fecha de
+modificación (CourseIndex.listings). Al volver a abrir el curso el árbol se
+pinta al instante desde la caché y luego, en segundo plano, solo se vuelven a
+leer las carpetas cuya fecha cambió (ver scan_course en app/logic/scanner.py).
+También guarda los metadatos de sus audios/vídeos (duración, resolución...),
+ver MediaInfoWorker en app/gui/tree_manager.py.
+
+"""
+
+# =================================================
+# IMPORTACIONES NECESARIAS
+# =================================================
+
+import os
+import hashlib
+
+from typing import Dict, Optional
+from app.data import codec
+from app.data.models import path_key
+
+# Versión del formato: si cambia la estructura guardada, las cachés antiguas se ignoran (se vuelve a escanear).
+CACHE_VERSION = 3
+
+
+# =================================================
+# CLASE SCANCACHE (CACHÉ DE ESCANEO)
+# =================================================
+
+# Un archivo comprimido por curso en 'cache_dir', nombrado con el hash de la ruta del curso (como los datos de cada
+# curso en json_backend). Es solo una caché: si falta o está dañada se ignora.
+
+class ScanCache:
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    def _cache_path(self, root_path: str, kind: str) -> str:
+        digest = hashlib.sha1(f"{kind}|{path_key(root_path)}".encode("utf-8")).hexdigest()[:20]
+        return os.path.join(self.cache_dir, f"{digest}.data")
+
+    # Listados guardados del curso ('kind': "video" o "audio"; "media" para los metadatos de los archivos), o None si
+    # no hay caché válida.
+    def load(self, root_path: str, kind: str) -> Optional[Dict[str, list]]:
+        try:
+            with open(self._cache_path(root_path, kind), 'rb') as f:
+                data = codec.decode(f.read())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return None
+        if data.get("root") != path_key(root_path) or not isinstance(data.get("listings"), dict):
+            return None
+        return data["listings"]
+
+    def save(self, root_path: str, kind: str, listings: Dict[str, list]) -> None:
+        data = {"version": CACHE_VERSION, "root": path_key(root_path), "listings": listings}
+        path = self._cache_path(root_path, kind)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(codec.encode(data, compact=True))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Error guardando la caché de escaneo: {e}")
+
+    # Borra la caché de todos los cursos.
+    def clear(self) -> None:
+        if not os.path.isdir(self.cache_dir):
+            return
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".data"):
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except OSError:
+                    pass
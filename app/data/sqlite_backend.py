@@ -0,0 +1,392 @@
+"""
+Función: Motor de almacenamiento SQLite (user_data.sqlite3).
+
+Guarda historial, apuntes, evaluaciones y posiciones de reproducción en tablas
+indexadas por curso, de modo que marcar un vídeo o guardar un apunte cuesta una
+sola sentencia (UPSERT) en lugar de reescribir todo el archivo. La primera vez importa automáticamente los
+datos del antiguo user_data.data (JSON).
+
+"""
+
+# =================================================
+# IMPORTACIONES NECESARIAS
+# =================================================
+
+import os
+import json
+import sqlite3
+import threading
+
+from typing import Dict, List, Any, Iterator, Optional, Tuple, AbstractSet
+from app.config import DEFAULT_THEME
+from app.data.storage import StorageBackend
+from app.data.json_backend import JsonBackend
+
+
+# =================================================
+# ESQUEMA DE LA BASE DE DATOS
+# =================================================
+
+# Cada tabla de cursos usa (course_id, ...) como índice, así que toda consulta es por curso.
+# El 'id' autoincremental conserva el orden de inserción (igual que las listas del JSON).
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS config (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS courses (
+    id         INTEGER PRIMARY KEY,
+    course_key TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS history (
+    id        INTEGER PRIMARY KEY,
+    course_id INTEGER NOT NULL REFERENCES courses(id),
+    rel_path  TEXT NOT NULL,
+    UNIQUE (course_id, rel_path)
+);
+CREATE TABLE IF NOT EXISTS notes (
+    id        INTEGER PRIMARY KEY,
+    course_id INTEGER NOT NULL REFERENCES courses(id),
+    rel_path  TEXT NOT NULL,
+    text      TEXT NOT NULL,
+    UNIQUE (course_id, rel_path)
+);
+CREATE TABLE IF NOT EXISTS positions (
+    course_id   INTEGER NOT NULL REFERENCES courses(id),
+    rel_path    TEXT NOT NULL,
+    position_ms INTEGER NOT NULL,
+    PRIMARY KEY (course_id, rel_path)
+);
+CREATE TABLE IF NOT EXISTS test_attempts (
+    id        INTEGER PRIMARY KEY,
+    course_id INTEGER NOT NULL REFERENCES courses(id),
+    test_name TEXT NOT NULL,
+    data      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_test_attempts_course ON test_attempts (course_id, test_name, id);
+"""
+
+
+# =================================================
+# CLASE SQLITEBACKEND (BASE DE DATOS LOCAL)
+# =================================================
+
+# Todas las operaciones pasan por una única conexión protegida por un candado (la exportación puede leer desde otro hilo).
+# Con WAL + synchronous=NORMAL cada sentencia confirma sin forzar un fsync completo del archivo.
+
+class SqliteBackend(StorageBackend):
+
+    # =================================================
+    # CONSTRUCTOR (__INIT__)
+    # =================================================
+
+    # 'legacy_store' es el almacenamiento JSON (sin cargar) que se importa una sola vez si la base de datos es nueva.
+
+    def __init__(self, db_path: str, legacy_store: Optional[JsonBackend] = None):
+        super().__init__()
+        self.db_path = db_path
+        self.legacy_store = legacy_store
+
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        # Caché clave_curso -> id para no consultar la tabla 'courses' en cada operación.
+        self._course_ids: Dict[str, int] = {}
+        self._statements = 0
+
+    # =================================================
+    # CARGAR / CREAR BASE DE DATOS (LOAD)
+    # =================================================
+
+    def load(self) -> None:
+        # isolation_level=None: cada sentencia suelta se confirma sola; las operaciones múltiples usan transacciones explícitas.
+        self._conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+        if self._get_meta("json_migrated") is None:
+            self._migrate_from_json()
+
+        self.config = {key: json.loads(value) for key, value in self._conn.execute("SELECT key, value FROM config")}
+        if not self.config:
+            for key, value in {"theme": DEFAULT_THEME, "ide_path": ""}.items():
+                self.set_config(key, value)
+
+        for course_id, course_key in self._conn.execute("SELECT id, course_key FROM courses"):
+            self._course_ids[course_key] = course_id
+
+    # =================================================
+    # MIGRACIÓN DESDE JSON (_MIGRATE_FROM_JSON)
+    # =================================================
+
+    # Importa los datos JSON (user_data.data y archivos de curso) en una sola transacción. Los archivos JSON no se borran (quedan como respaldo).
+
+    def _migrate_from_json(self) -> None:
+        legacy: Dict[str, Any] = {}
+        legacy_path = ""
+        if self.legacy_store is not None and os.path.exists(self.legacy_store.data_file_path):
+            # JsonBackend también aplica los cambios que aún estén solo en su diario.
+            self.legacy_store.load()
+            legacy = self.legacy_store.snapshot()
+            legacy_path = self.legacy_store.data_file_path
+
+        with self._lock:
+            cur = self._conn.cursor()
+            cur.execute("BEGIN")
+            try:
+                for key, value in legacy.get("config", {}).items():
+                    cur.execute("INSERT OR REPLACE INTO config (key, value) VALUES (?, ?)",
+                                (key, json.dumps(value, ensure_ascii=False)))
+
+                for course_key, course in legacy.get("courses", {}).items():
+                    cur.execute("INSERT OR IGNORE INTO courses (course_key) VALUES (?)", (course_key,))
+                    course_id = cur.execute("SELECT id FROM courses WHERE course_key = ?", (course_key,)).fetchone()[0]
+
+                    cur.executemany("INSERT OR IGNORE INTO history (course_id, rel_path) VALUES (?, ?)",
+                                    [(course_id, rel) for rel in course.get("history", [])])
+                    cur.executemany("INSERT OR REPLACE INTO notes (course_id, rel_path, text) VALUES (?, ?, ?)",
+                                    [(course_id, rel, text) for rel, text in course.get("notes", {}).items()])
+                    cur.executemany("INSERT OR REPLACE INTO positions (course_id, rel_path, position_ms) "
+                                    "VALUES (?, ?, ?)",
+                                    [(course_id, rel, ms) for rel, ms in course.get("positions", {}).items()])
+                    for test_name, attempts in course.get("tests", {}).items():
+                        cur.executemany("INSERT INTO test_attempts (course_id, test_name, data) VALUES (?, ?, ?)",
+                                        [(course_id, test_name, json.dumps(a, ensure_ascii=False)) for a in attempts])
+
+                cur.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('json_migrated', ?)",
+                            (legacy_path,))
+                cur.execute("COMMIT")
+            except sqlite3.Error:
+                cur.execute("ROLLBACK")
+                raise
+
+    # =================================================
+    # CICLO DE VIDA (FLUSH / CLOSE / STATS)
+    # =================================================
+
+    # Cada operación ya está confirmada; solo se traslada el WAL al archivo principal.
+    def flush(self) -> None:
+        if self._conn is None:
+            return
+        with self._lock:
+            try:
+                self._conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+            except sqlite3.Error as e:
+                print(f"Error crítico guardando datos: {e}")
+
+    def close(self) -> None:
+        if self._conn is None:
+            return
+        self.flush()
+        with self._lock:
+            self._conn.close()
+            self._conn = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "sqlite", "write_behind": False, "statements": self._statements}
+
+    # =================================================
+    # AUXILIARES (MÉTODOS PRIVADOS)
+    # =================================================
+
+    # Ejecuta una sentencia de escritura (confirmación automática).
+    def _write(self, sql: str, params: Tuple = ()) -> None:
+        with self._lock:
+            try:
+                self._conn.execute(sql, params)
+                self._statements += 1
+            except sqlite3.Error as e:
+                print(f"Error crítico guardando datos: {e}")
+
+    def _query(self, sql: str, params: Tuple = ()) -> List[Tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    # Recorre por bloques, en orden (course_id, id), una tabla de datos de cursos (history, notes, test_attempts):
+    # entrega (clave_curso, *columnas) sin cargar el resultado completo en memoria. Cada bloque es una consulta
+    # completa hecha bajo el candado y el siguiente continúa desde la última fila entregada, así que entre bloques no
+    # queda ningún cursor abierto en la conexión compartida (otros hilos pueden escribir mientras se exporta).
+    # Sin clave de curso recorre todos los cursos.
+
+    def _iter_course_rows(self, table: str, columns: str, course_key: Optional[str],
+                          chunk_size: int = 500) -> Iterator[Tuple]:
+        conditions, params = ["(t.course_id, t.id) > (?, ?)"], []
+        if course_key is not None:
+            course_id = self._get_course_id(course_key)
+            if course_id is None:
+                return
+            conditions.append("t.course_id = ?")
+            params.append(course_id)
+        sql = (f"SELECT t.course_id, t.id, c.course_key, {columns} FROM {table} t "
+               f"JOIN courses c ON c.id = t.course_id WHERE {' AND '.join(conditions)} "
+               f"ORDER BY t.course_id, t.id LIMIT ?")
+        last = (0, 0)
+        while True:
+            rows = self._query(sql, last + tuple(params) + (chunk_size,))
+            for row in rows:
+                yield row[2:]
+            if len(rows) < chunk_size:
+                return
+            last = tuple(rows[-1][:2])
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    # Id del curso, o None si nunca se ha guardado nada de él (las lecturas no crean filas).
+    def _get_course_id(self, course_key: str) -> Optional[int]:
+        return self._course_ids.get(course_key)
+
+    def _ensure_course_id(self, course_key: str) -> int:
+        course_id = self._course_ids.get(course_key)
+        if course_id is None:
+            with self._lock:
+                self._conn.execute("INSERT OR IGNORE INTO courses (course_key) VALUES (?)", (course_key,))
+                course_id = self._conn.execute("SELECT id FROM courses WHERE course_key = ?", (course_key,)).fetchone()[0]
+            self._course_ids[course_key] = course_id
+        return course_id
+
+    # =================================================
+    # CONFIGURACIÓN
+    # =================================================
+
+    def set_config(self, key: str, value: Any) -> None:
+        self.config[key] = value
+        self._write("INSERT INTO config (key, value) VALUES (?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                    (key, json.dumps(value, ensure_ascii=False)))
+
+    # =================================================
+    # HISTORIAL (VÍDEOS COMPLETADOS)
+    # =================================================
+
+    def is_completed(self, course_key: str, rel_path: str) -> bool:
+        course_id = self._get_course_id(course_key)
+        if course_id is None:
+            return False
+        return bool(self._query("SELECT 1 FROM history WHERE course_id = ? AND rel_path = ?", (course_id, rel_path)))
+
+    def set_completed(self, course_key: str, rel_path: str, completed: bool) -> None:
+        course_id = self._ensure_course_id(course_key)
+        if completed:
+            self._write("INSERT OR IGNORE INTO history (course_id, rel_path) VALUES (?, ?)", (course_id, rel_path))
+        else:
+            self._write("DELETE FROM history WHERE course_id = ? AND rel_path = ?", (course_id, rel_path))
+
+    def iter_history(self, course_key: Optional[str] = None) -> Iterator[Tuple[str, str]]:
+        yield from self._iter_course_rows("history", "t.rel_path", course_key)
+
+    def completed_set(self, course_key: str) -> AbstractSet[str]:
+        course_id = self._get_course_id(course_key)
+        if course_id is None:
+            return frozenset()
+        return frozenset(row[0] for row in self._query("SELECT rel_path FROM history WHERE course_id = ?", (course_id,)))
+
+    # =================================================
+    # APUNTES
+    # =================================================
+
+    def get_note(self, course_key: str, rel_path: str) -> str:
+        course_id = self._get_course_id(course_key)
+        if course_id is None:
+            return ""
+        rows = self._query("SELECT text FROM notes WHERE course_id = ? AND rel_path = ?", (course_id, rel_path))
+        return rows[0][0] if rows else ""
+
+    def set_note(self, course_key: str, rel_path: str, text: str) -> None:
+        course_id = self._ensure_course_id(course_key)
+        self._write("INSERT INTO notes (course_id, rel_path, text) VALUES (?, ?, ?) "
+                    "ON CONFLICT(course_id, rel_path) DO UPDATE SET text = excluded.text",
+                    (course_id, rel_path, text))
+
+    def iter_notes(self, course_key: Optional[str] = None) -> Iterator[Tuple[str, str, str]]:
+        yield from self._iter_course_rows("notes", "t.rel_path, t.text", course_key)
+
+    # =================================================
+    # POSICIONES DE REPRODUCCIÓN (REANUDAR)
+    # =================================================
+
+    def get_position(self, course_key: str, rel_path: str) -> int:
+        course_id = self._get_course_id(course_key)
+        if course_id is None:
+            return 0
+        rows = self._query("SELECT position_ms FROM positions WHERE course_id = ? AND rel_path = ?",
+                           (course_id, rel_path))
+        return rows[0][0] if rows else 0
+
+    # Todas las posiciones en una sola transacción.
+    def set_positions(self, course_key: str, positions: Dict[str, int]) -> None:
+        if not positions:
+            return
+        course_id = self._ensure_course_id(course_key)
+        with self._lock:
+            cur = self._conn.cursor()
+            try:
+                cur.execute("BEGIN")
+                cur.executemany("INSERT INTO positions (course_id, rel_path, position_ms) VALUES (?, ?, ?) "
+                                "ON CONFLICT(course_id, rel_path) DO UPDATE SET position_ms = excluded.position_ms",
+                                [(course_id, rel, ms) for rel, ms in positions.items() if ms])
+                cur.executemany("DELETE FROM positions WHERE course_id = ? AND rel_path = ?",
+                                [(course_id, rel) for rel, ms in positions.items() if not ms])
+                cur.execute("COMMIT")
+                self._statements += 1
+            except sqlite3.Error as e:
+                cur.execute("ROLLBACK")
+                print(f"Error crítico guardando datos: {e}")
+
+    # =================================================
+    # EVALUACIONES
+    # =================================================
+
+    def get_test_history(self, course_key: str, test_name: str) -> List[Dict[str, Any]]:
+        course_id = self._get_course_id(course_key)
+        if course_id is None:
+            return []
+        rows = self._query("SELECT data FROM test_attempts WHERE course_id = ? AND test_name = ? ORDER BY id",
+                           (course_id, test_name))
+        return [json.loads(data) for (data,) in rows]
+
+    def add_test_attempt(self, course_key: str, test_name: str, attempt_data: Dict[str, Any]) -> None:
+        course_id = self._ensure_course_id(course_key)
+        self._write("INSERT INTO test_attempts (course_id, test_name, data) VALUES (?, ?, ?)",
+                    (course_id, test_name, json.dumps(attempt_data, ensure_ascii=False)))
+
+    def iter_test_attempts(self, course_key: Optional[str] = None) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+        for key, name, data in self._iter_course_rows("test_attempts", "t.test_name, t.data", course_key):
+            yield key, name, json.loads(data)
+
+    # =================================================
+    # LIMPIEZA Y RESET
+    # =================================================
+
+    def clear_notes(self) -> None:
+        self._write("DELETE FROM notes")
+
+    def clear_history(self) -> None:
+        self._write("DELETE FROM history")
+
+    def clear_tests(self) -> None:
+        self._write("DELETE FROM test_attempts")
+
+    def reset(self, config: Dict[str, Any]) -> None:
+        config_rows = [(k, json.dumps(v, ensure_ascii=False)) for k, v in config.items()]
+        with self._lock:
+            cur = self._conn.cursor()
+            try:
+                cur.execute("BEGIN")
+                for table in ("history", "notes", "positions", "test_attempts", "courses", "config"):
+                    cur.execute(f"DELETE FROM {table}")
+                cur.executemany("INSERT INTO config (key, value) VALUES (?, ?)", config_rows)
+                cur.execute("COMMIT")
+            except sqlite3.Error as e:
+                # Sin ROLLBACK la transacción quedaría abierta y arrastraría todas las escrituras siguientes.
+                cur.execute("ROLLBACK")
+                print(f"Error crítico guardando datos: {e}")
+                return
+            self._course_ids.clear()
+        self.config = dict(config)
@@ -0,0 +1,151 @@
+"""
+Función: Contrato común de los motores de almacenamiento.
+
+Define la interfaz que debe cumplir cualquier "backend" de persistencia (JSON,
+SQLite...). DataManager solo habla con esta interfaz, así que el resto de la
+aplicación no sabe (ni necesita saber) dónde se guardan realmente los datos.
+
+"""
+
+# =================================================
+# IMPORTACIONES NECESARIAS
+# =================================================
+
+from abc import ABC, abstractmethod
+from typing import Dict, List, Any, Iterator, Optional, Tuple, AbstractSet
+
+
+# =================================================
+# CLASE STORAGEBACKEND (INTERFAZ BASE)
+# =================================================
+
+# Todas las operaciones de cursos reciben la clave del curso (ruta absoluta, ver DataManager._get_course_key)
+# y la ruta relativa del vídeo/audio. La configuración se mantiene completa en memoria (es pequeña) en 'self.config'.
+# Los métodos abstractos son obligatorios: un motor al que le falte alguno no se puede instanciar.
+
+class StorageBackend(ABC):
+
+    def __init__(self):
+        self.config: Dict[str, Any] = {}
+
+    # =================================================
+    # CICLO DE VIDA (LOAD / FLUSH / CLOSE)
+    # =================================================
+
+    # Carga (o crea) el almacenamiento. Debe dejar 'self.config' listo para usarse.
+    @abstractmethod
+    def load(self) -> None:
+        ...
+
+    # Asegura que todo cambio pendiente quede escrito en disco.
+    @abstractmethod
+    def flush(self) -> None:
+        ...
+
+    # Libera recursos (hilos, conexiones) tras volcar lo pendiente.
+    def close(self) -> None:
+        self.flush()
+
+    # Contadores de rendimiento propios del motor.
+    def stats(self) -> Dict[str, Any]:
+        return {}
+
+    # =================================================
+    # CONFIGURACIÓN
+    # =================================================
+
+    # Guarda una clave de configuración (el valor debe ser serializable a JSON).
+    @abstractmethod
+    def set_config(self, key: str, value: Any) -> None:
+        ...
+
+    # =================================================
+    # HISTORIAL (VÍDEOS COMPLETADOS)
+    # =================================================
+
+    @abstractmethod
+    def is_completed(self, course_key: str, rel_path: str) -> bool:
+        ...
+
+    @abstractmethod
+    def set_completed(self, course_key: str, rel_path: str, completed: bool) -> None:
+        ...
+
+    # Devuelve todas las rutas completadas del curso de una vez (conjunto de solo lectura, búsqueda O(1)).
+    @abstractmethod
+    def completed_set(self, course_key: str) -> AbstractSet[str]:
+        ...
+
+    # Recorre el historial como tuplas (clave_curso, ruta_relativa). Sin clave recorre todos los cursos.
+    @abstractmethod
+    def iter_history(self, course_key: Optional[str] = None) -> Iterator[Tuple[str, str]]:
+        ...
+
+    # =================================================
+    # APUNTES
+    # =================================================
+
+    @abstractmethod
+    def get_note(self, course_key: str, rel_path: str) -> str:
+        ...
+
+    @abstractmethod
+    def set_note(self, course_key: str, rel_path: str, text: str) -> None:
+        ...
+
+    # Recorre los apuntes como tuplas (clave_curso, ruta_relativa, texto). Sin clave recorre todos los cursos.
+    @abstractmethod
+    def iter_notes(self, course_key: Optional[str] = None) -> Iterator[Tuple[str, str, str]]:
+        ...
+
+    # =================================================
+    # POSICIONES DE REPRODUCCIÓN (REANUDAR)
+    # =================================================
+
+    # Última posición guardada (ms) del vídeo/audio, o 0 si no hay.
+    @abstractmethod
+    def get_position(self, course_key: str, rel_path: str) -> int:
+        ...
+
+    # Guarda de una vez varias posiciones del curso (ruta_relativa -> ms). 0 borra la posición guardada.
+    @abstractmethod
+    def set_positions(self, course_key: str, positions: Dict[str, int]) -> None:
+        ...
+
+    # =================================================
+    # EVALUACIONES
+    # =================================================
+
+    @abstractmethod
+    def get_test_history(self, course_key: str, test_name: str) -> List[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def add_test_attempt(self, course_key: str, test_name: str, attempt_data: Dict[str, Any]) -> None:
+        ...
+
+    # Recorre los intentos como tuplas (clave_curso, nombre_test, datos_intento). Sin clave recorre todos los cursos.
+    @abstractmethod
+    def iter_test_attempts(self, course_key: Optional[str] = None) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+        ...
+
+    # =================================================
+    # LIMPIEZA Y RESET
+    # =================================================
+
+    @abstractmethod
+    def clear_notes(self) -> None:
+        ...
+
+    @abstractmethod
+    def clear_history(self) -> None:
+        ...
+
+    @abstractmethod
+    def clear_tests(self) -> None:
+        ...
+
+    # Borra todos los cursos y reemplaza la configuración completa.
+    @abstractmethod
+    def reset(self, config: Dict[str, Any]) -> None:
+        ...
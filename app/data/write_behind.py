@@ -0,0 +1,176 @@
+"""
+Función: Escritor diferido (write-behind) para la persistencia.
+
+Agrupa muchas modificaciones seguidas en una sola escritura a disco y la ejecuta
+en un hilo secundario, de modo que marcar un vídeo como visto o mover un panel
+no bloquee la interfaz mientras se reescribe el archivo de datos.
+
+"""
+
+# =================================================
+# IMPORTACIONES NECESARIAS
+# =================================================
+
+import threading
+import time
+
+from typing import Callable, Dict, Any, Optional
+
+
+# =================================================
+# CLASE WRITEBEHINDWRITER (ESCRITURA DIFERIDA)
+# =================================================
+
+# Las modificaciones solo "marcan" los datos como sucios. Un hilo en segundo plano espera el intervalo configurado
+# (agrupando todas las marcas que lleguen mientras tanto) y después llama UNA sola vez a la función de guardado.
+# flush() fuerza la escritura pendiente de forma síncrona (cierre de la aplicación).
+# Si la función de guardado falla, los cambios siguen pendientes y el hilo lo reintenta pasado el intervalo
+# (como mínimo RETRY_S segundos después).
+
+class WriteBehindWriter:
+
+    RETRY_S = 1.0
+
+    # =================================================
+    # CONSTRUCTOR (__INIT__)
+    # =================================================
+
+    def __init__(self, write_callback: Callable[[], None], interval_ms: int):
+        self._write_callback = write_callback
+        self._interval = max(0, interval_ms) / 1000.0
+
+        self._cond = threading.Condition()
+        # Serializa las escrituras reales (hilo de fondo vs. flush() del hilo principal).
+        self._io_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+        # Estado interno
+        self._dirty = False
+        self._dirty_since = 0.0
+        self._retrying = False
+        self._closed = False
+
+        # Contadores (estadísticas)
+        self._requests = 0
+        self._flushes = 0
+        self._last_flush_ms = 0.0
+        self._total_flush_ms = 0.0
+        self._max_flush_ms = 0.0
+        self._failures = 0
+
+    # =================================================
+    # MARCAR DATOS MODIFICADOS (MARK_DIRTY)
+    # =================================================
+
+    # Registra que hay cambios pendientes. El hilo de escritura se crea la primera vez que se necesita.
+
+    def mark_dirty(self) -> None:
+        with self._cond:
+            self._requests += 1
+            if not self._dirty:
+                self._dirty = True
+                self._dirty_since = time.monotonic()
+            if self._closed:
+                return
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="WriteBehindWriter", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    # =================================================
+    # VOLCADO SÍNCRONO (FLUSH / CLOSE)
+    # =================================================
+
+    # Escribe inmediatamente los cambios pendientes (si los hay).
+
+    def flush(self) -> None:
+        self._flush_now()
+
+    # Escribe lo pendiente y detiene el hilo de fondo. Marcas posteriores quedan pendientes hasta el siguiente flush().
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._flush_now()
+
+    # =================================================
+    # ESTADÍSTICAS (STATS)
+    # =================================================
+
+    # writes_saved = escrituras completas que se evitaron gracias a la agrupación.
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            flushes = self._flushes
+            return {
+                "write_requests": self._requests,
+                "flushes": flushes,
+                "writes_saved": max(0, self._requests - flushes),
+                "pending": self._dirty,
+                "last_flush_ms": round(self._last_flush_ms, 3),
+                "avg_flush_ms": round(self._total_flush_ms / flushes, 3) if flushes else 0.0,
+                "max_flush_ms": round(self._max_flush_ms, 3),
+                "failed_flushes": self._failures,
+            }
+
+    # =================================================
+    # BUCLE DEL HILO DE ESCRITURA (_RUN)
+    # =================================================
+
+    # Espera a que haya cambios, deja pasar el intervalo desde la primera marca (agrupando el resto) y escribe.
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._dirty and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+
+                delay = max(self._interval, self.RETRY_S) if self._retrying else self._interval
+                deadline = self._dirty_since + delay
+                remaining = deadline - time.monotonic()
+                while remaining > 0 and not self._closed:
+                    self._cond.wait(remaining)
+                    remaining = deadline - time.monotonic()
+                if self._closed:
+                    return
+
+            self._flush_now()
+
+    # =================================================
+    # ESCRITURA REAL (_FLUSH_NOW)
+    # =================================================
+
+    # Si la función de guardado lanza una excepción, se informa y los datos vuelven a quedar pendientes.
+
+    def _flush_now(self) -> None:
+        with self._io_lock:
+            with self._cond:
+                if not self._dirty:
+                    return
+                self._dirty = False
+
+            start = time.perf_counter()
+            try:
+                self._write_callback()
+            except Exception as e:
+                print(f"Error crítico guardando datos: {e}")
+                with self._cond:
+                    self._failures += 1
+                    self._retrying = True
+                    self._dirty = True
+                    self._dirty_since = time.monotonic()
+                return
+            elapsed_ms = (time.perf_counter() - start) * 1000.0
+
+            with self._cond:
+                self._retrying = False
+                self._flushes += 1
+                self._last_flush_ms = elapsed_ms
+                self._total_flush_ms += elapsed_ms
+                self._max_flush_ms = max(self._max_flush_ms, elapsed_ms)
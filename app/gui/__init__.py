@@ -1,5 +1,5 @@
-# =================================================
-# IMPORTACIONES NECESARIAS
-# =================================================
-
+# =================================================
+# IMPORTACIONES NECESARIAS
+# =================================================
+
 from .main_window import MainWindow
\ No newline at end of file
@@ -0,0 +1,504 @@
+"""
+Función: Modelo del árbol de navegación (QAbstractItemModel) sobre el CourseIndex.
+
+En vez de un QTreeWidgetItem por archivo (cada uno con su diccionario, fuente
+y color), los nodos son enteros y su información vive en unos pocos arrays.
+Texto, color (visto/no visto), fuente e icono se calculan en data() solo para
+las filas que la vista está pintando, así que un curso con decenas de miles
+de audios apenas ocupa memoria. Los hijos de cada capítulo se crean la
+primera vez que se abre (canFetchMore / fetchMore).
+
+"""
+
+# =================================================
+# IMPORTACIONES NECESARIAS
+# =================================================
+
+import os
+from array import array
+from typing import AbstractSet, Callable, Dict, List, Optional, Set, Tuple
+
+from PyQt6.QtCore import Qt, QAbstractItemModel, QModelIndex
+from PyQt6.QtGui import QBrush, QColor, QFont, QIcon
+
+from app.data.models import ChapterItem, MediaInfo, MediaItem, duration_totals, path_key
+from app.utils.helpers import format_ms_to_time, format_time_left
+
+# Tipos de nodo.
+NODE_ROOT, NODE_MEDIA, NODE_CHAPTER, NODE_TESTS, NODE_TEST, NODE_NOTICE = range(6)
+
+# La vista consulta flags() de cada fila al insertarla: se devuelven valores ya calculados.
+_ITEM_FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+_NO_FLAGS = Qt.ItemFlag.NoItemFlags
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_USER_ROLE = Qt.ItemDataRole.UserRole
+_FOREGROUND_ROLE = Qt.ItemDataRole.ForegroundRole
+_FONT_ROLE = Qt.ItemDataRole.FontRole
+_DECORATION_ROLE = Qt.ItemDataRole.DecorationRole
+_TOOLTIP_ROLE = Qt.ItemDataRole.ToolTipRole
+
+
+# =================================================
+# CLASE COURSETREEMODEL (MODELO DEL ÁRBOL)
+# =================================================
+
+# Cada nodo es un entero (0 = raíz invisible). Por nodo se guarda: padre, fila dentro del padre, tipo, si está visto
+# y el objeto del CourseIndex que representa (MediaItem, ChapterItem o TestItem; el grupo "Test/Evaluaciones" guarda
+# su capítulo). '_children[nodo]' es None mientras el capítulo no se ha abierto.
+# Cada QModelIndex lleva su número de nodo (internalId).
+
+class CourseTreeModel(QAbstractItemModel):
+
+    DONE_COLOR = "#00AA00"
+
+    # =================================================
+    # CONSTRUCTOR (__INIT__)
+    # =================================================
+
+    # completed_set() -> rutas relativas de los audios/vídeos vistos (se consulta una vez por operación).
+    # read_chapter(capítulo) -> capítulo completo: lee un capítulo de la lista inicial que aún no se escaneó.
+
+    def __init__(self, completed_set: Callable[[], AbstractSet[str]],
+                 read_chapter: Callable[[ChapterItem], ChapterItem], parent=None):
+        super().__init__(parent)
+        self._completed_set = completed_set
+        self._read_chapter = read_chapter
+        self._done_set: Optional[AbstractSet[str]] = None
+
+        self._bold = QFont()
+        self._bold.setBold(True)
+        self._italic = QFont()
+        self._italic.setItalic(True)
+        # Pinceles compartidos por todas las filas: cambiar de tema solo cambia cuál se devuelve.
+        self._done_brush = QBrush(QColor(self.DONE_COLOR))
+        self._theme_brushes = (QBrush(QColor("black")), QBrush(QColor("white")))
+        self._text_brush = self._theme_brushes[0]
+        self._test_icon = QIcon()
+        # Metadatos de los audios/vídeos (ruta relativa -> MediaInfo) y velocidad de reproducción, para los tooltips
+        # con la duración de cada archivo y los totales de cada capítulo (se calculan al pasar el ratón).
+        self._media_info: Dict[str, MediaInfo] = {}
+        self._rate = 1.0
+        self._clear_nodes()
+
+    def _clear_nodes(self):
+        self._parent = array('i', [-1])
+        self._row = array('i', [0])
+        self._kind = bytearray([NODE_ROOT])
+        self._done = bytearray(1)
+        self._obj: List[object] = [None]
+        self._children: List[Optional[array]] = [array('i')]
+        # Búsquedas por ruta (path_key) y capítulos de la lista inicial aún sin leer.
+        self._media_ids: Dict[str, int] = {}
+        self._chapter_ids: Dict[str, int] = {}
+        self._stubs: Set[int] = set()
+        self._notice = 0    # Nodo del aviso "Escaneando contenido..." (0 = no hay).
+
+    # Vacía el árbol (nuevo curso).
+    def clear(self):
+        self.beginResetModel()
+        self._clear_nodes()
+        self.endResetModel()
+
+    # =================================================
+    # INTERFAZ QABSTRACTITEMMODEL
+    # =================================================
+
+    def _node(self, index: QModelIndex) -> int:
+        return index.internalId() if index.isValid() else 0
+
+    def _index(self, node: int) -> QModelIndex:
+        return self.createIndex(self._row[node], 0, node) if node > 0 else QModelIndex()
+
+    def index(self, row, column, parent=QModelIndex()):
+        children = self._children[self._node(parent)]
+        if column != 0 or children is None or not 0 <= row < len(children):
+            return QModelIndex()
+        return self.createIndex(row, 0, children[row])
+
+    def parent(self, index=QModelIndex()):
+        if not index.isValid():
+            return QModelIndex()
+        return self._index(max(self._parent[index.internalId()], 0))
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        children = self._children[self._node(parent)]
+        return len(children) if children is not None else 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def hasChildren(self, parent=QModelIndex()):
+        node = self._node(parent)
+        children = self._children[node]
+        if children is not None:
+            return len(children) > 0
+        if self._kind[node] == NODE_CHAPTER:
+            chapter = self._obj[node]
+            return node in self._stubs or bool(chapter.entries or chapter.tests)
+        return self._kind[node] == NODE_TESTS
+
+    def canFetchMore(self, parent):
+        return parent.isValid() and self._children[self._node(parent)] is None
+
+    def fetchMore(self, parent):
+        if parent.isValid():
+            self.populate(self._node(parent))
+
+    # Historial del curso, leído una sola vez durante cada operación que crea o actualiza nodos (ver _end_batch).
+    def _is_completed(self, rel_path: str) -> bool:
+        if self._done_set is None:
+            self._done_set = self._completed_set()
+        return rel_path in self._done_set
+
+    def _end_batch(self):
+        self._done_set = None
+
+    def flags(self, index):
+        if index.isValid() and self._kind[index.internalId()] != NODE_NOTICE:
+            return _ITEM_FLAGS
+        return _NO_FLAGS
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalId()
+        kind = self._kind[node]
+        obj = self._obj[node]
+
+        if role == _DISPLAY_ROLE:
+            if kind == NODE_TESTS:
+                return "Test/Evaluaciones"
+            return obj if kind == NODE_NOTICE else obj.title
+        if role == _USER_ROLE:
+            # Mismo diccionario que usa MainWindow para reproducir/abrir ("media", "audio" o "test").
+            return obj.item_data() if kind in (NODE_MEDIA, NODE_TEST) else None
+        if role == _FOREGROUND_ROLE:
+            if kind == NODE_MEDIA:
+                return self._done_brush if self._done[node] else self._text_brush
+            return None
+        if role == _FONT_ROLE:
+            if kind == NODE_CHAPTER:
+                return self._bold
+            return self._italic if kind in (NODE_TESTS, NODE_NOTICE) else None
+        if role == _DECORATION_ROLE and kind == NODE_TEST:
+            return self._test_icon
+        if role == _TOOLTIP_ROLE:
+            if kind == NODE_MEDIA:
+                return self._media_tooltip(obj)
+            return self._chapter_tooltip(obj) if kind == NODE_CHAPTER else None
+        return None
+
+    # "12:34 · 1920x1080 · h264 · 2.1 Mb/s" (lo que se conozca del archivo).
+    def _media_tooltip(self, media: MediaItem) -> Optional[str]:
+        info = self._media_info.get(media.rel_path)
+        if info is None or not info.duration_ms:
+            return None
+        parts = [format_ms_to_time(info.duration_ms)]
+        if info.width and info.height:
+            parts.append(f"{info.width}x{info.height}")
+        if info.codec:
+            parts.append(info.codec)
+        if info.bitrate:
+            parts.append(f"{info.bitrate / 1000000:.1f} Mb/s" if info.bitrate >= 1000000
+                         else f"{info.bitrate // 1000} kb/s")
+        return " · ".join(parts)
+
+    # Duración total del capítulo y lo que falta por ver (a la velocidad actual).
+    def _chapter_tooltip(self, chapter: ChapterItem) -> Optional[str]:
+        if not self._media_info:
+            return None
+        total, remaining, missing = duration_totals(chapter.iter_media(), self._media_info, self._completed_set())
+        if not total:
+            return None
+        text = format_time_left(total, remaining, self._rate)
+        return text + f" (sin calcular: {missing})" if missing else text
+
+    # =================================================
+    # CREAR / QUITAR NODOS
+    # =================================================
+
+    # Hijos que corresponden a un nodo: entradas del capítulo (+ grupo de tests) o tests del grupo.
+    def _wanted(self, kind: int, obj) -> List[Tuple[int, object]]:
+        if kind == NODE_TESTS:
+            return [(NODE_TEST, test) for test in obj.tests]
+        wanted = [(NODE_MEDIA if isinstance(entry, MediaItem) else NODE_CHAPTER, entry) for entry in obj.entries]
+        if obj.tests:
+            wanted.append((NODE_TESTS, obj))
+        return wanted
+
+    def _new_node(self, parent: int, row: int, kind: int, obj) -> int:
+        node = len(self._kind)
+        self._parent.append(parent)
+        self._row.append(row)
+        self._kind.append(kind)
+        self._obj.append(obj)
+        self._children.append(None)
+        if kind == NODE_MEDIA:
+            self._done.append(1 if self._is_completed(obj.rel_path) else 0)
+            self._media_ids[path_key(obj.path)] = node
+        else:
+            self._done.append(0)
+            if kind == NODE_CHAPTER:
+                self._chapter_ids[path_key(obj.path)] = node
+        return node
+
+    def _open_node(self, node: int):
+        self._children[node] = array('i')
+
+    def _insert_rows(self, parent: int, position: int, entries: List[Tuple[int, object]], stubs: bool = False):
+        children = self._children[parent]
+        self.beginInsertRows(self._index(parent), position, position + len(entries) - 1)
+        new_nodes = array('i', [self._new_node(parent, position + offset, kind, obj)
+                                for offset, (kind, obj) in enumerate(entries)])
+        if stubs:
+            self._stubs.update(node for node in new_nodes if self._kind[node] == NODE_CHAPTER)
+        children[position:position] = new_nodes
+        self._renumber(parent, position + len(entries))
+        self.endInsertRows()
+
+    def _remove_rows(self, parent: int, first: int, last: int):
+        children = self._children[parent]
+        self.beginRemoveRows(self._index(parent), first, last)
+        stack = list(children[first:last + 1])
+        while stack:
+            node = stack.pop()
+            self._forget(node)
+            if self._children[node] is not None:
+                stack.extend(self._children[node])
+        del children[first:last + 1]
+        self._renumber(parent, first)
+        self.endRemoveRows()
+
+    # Libera lo que ocupa un nodo quitado del árbol. Su número no se reutiliza hasta el próximo curso (algún
+    # QModelIndex viejo podría seguir usándolo).
+    def _forget(self, node: int):
+        kind, obj = self._kind[node], self._obj[node]
+        if kind == NODE_MEDIA and self._media_ids.get(path_key(obj.path)) == node:
+            del self._media_ids[path_key(obj.path)]
+        elif kind == NODE_CHAPTER and self._chapter_ids.get(path_key(obj.path)) == node:
+            del self._chapter_ids[path_key(obj.path)]
+        self._stubs.discard(node)
+        self._obj[node] = None
+        self._children[node] = None
+        self._parent[node] = -1
+
+    def _renumber(self, parent: int, start: int):
+        children = self._children[parent]
+        rows = self._row
+        for row in range(start, len(children)):
+            rows[children[row]] = row
+
+    def _key(self, node: int) -> Tuple[int, str]:
+        obj = self._obj[node]
+        return self._kind[node], path_key(obj.path) if obj is not None and not isinstance(obj, str) else ""
+
+    # =================================================
+    # SINCRONIZAR HIJOS (SYNC)
+    # =================================================
+
+    # Lleva los hijos de 'parent' a 'entries' [(tipo, objeto)]: quita los que ya no están, inserta los nuevos en su
+    # posición (en bloques) y actualiza el resto sin recrearlos (se conservan selección y ramas abiertas).
+    # El aviso de escaneo (si lo hay) se queda al final.
+
+    def sync(self, parent: int, entries: List[Tuple[int, object]]):
+        children = self._children[parent]
+        if children is None:
+            # Capítulo aún sin abrir: basta con guardar el objeto nuevo.
+            return
+        wanted_keys = [(kind, path_key(obj.path)) for kind, obj in entries]
+        wanted = set(wanted_keys)
+
+        # 1. Quitar (de atrás hacia delante, en bloques contiguos).
+        row = len(children) - 1
+        while row >= 0:
+            node = children[row]
+            if self._kind[node] == NODE_NOTICE or self._key(node) in wanted:
+                row -= 1
+                continue
+            last = row
+            while row - 1 >= 0 and self._kind[children[row - 1]] != NODE_NOTICE \
+                    and self._key(children[row - 1]) not in wanted:
+                row -= 1
+            self._remove_rows(parent, row, last)
+            row -= 1
+
+        # 2. Insertar los nuevos y actualizar los existentes. Si los que quedan cambiaron de orden (otro criterio de
+        #    ordenación), se vuelven a crear todos.
+        existing = {self._key(node): node for node in children if self._kind[node] != NODE_NOTICE}
+        if [key for key in wanted_keys if key in existing] != list(existing):
+            count = len(existing)
+            if count:
+                self._remove_rows(parent, 0, count - 1)
+            existing = {}
+        position = 0
+        pending: List[Tuple[int, object]] = []
+        for key, entry in zip(wanted_keys, entries):
+            node = existing.get(key)
+            if node is None:
+                pending.append(entry)
+                continue
+            if pending:
+                self._insert_rows(parent, position, pending)
+                position += len(pending)
+                pending = []
+            self._update_node(node, entry[1])
+            position += 1
+        if pending:
+            self._insert_rows(parent, position, pending)
+
+    def _update_node(self, node: int, obj):
+        old = self._obj[node]
+        self._obj[node] = obj
+        kind = self._kind[node]
+        if kind == NODE_MEDIA:
+            done = 1 if self._is_completed(obj.rel_path) else 0
+            if done != self._done[node] or old.title != obj.title:
+                self._done[node] = done
+                index = self._index(node)
+                self.dataChanged.emit(index, index)
+        elif kind in (NODE_CHAPTER, NODE_TESTS):
+            if kind == NODE_CHAPTER:
+                self._stubs.discard(node)
+                if old.title != obj.title:
+                    index = self._index(node)
+                    self.dataChanged.emit(index, index)
+            self.sync(node, self._wanted(kind, obj))
+
+    # Crea los hijos de un capítulo (o del grupo de tests) la primera vez que se abre. Si es un capítulo de la lista
+    # inicial que aún no se escaneó, se lee ahora.
+    def populate(self, node: int):
+        if self._children[node] is not None or self._kind[node] not in (NODE_CHAPTER, NODE_TESTS):
+            return
+        if node in self._stubs:
+            self._stubs.discard(node)
+            self._obj[node] = self._read_chapter(self._obj[node])
+        self._open_node(node)
+        entries = self._wanted(self._kind[node], self._obj[node])
+        try:
+            if entries:
+                self._insert_rows(node, 0, entries)
+        finally:
+            self._end_batch()
+
+    # =================================================
+    # OPERACIONES DEL GESTOR DEL ÁRBOL
+    # =================================================
+
+    def chapter_entries(self, chapter: ChapterItem) -> List[Tuple[int, object]]:
+        return self._wanted(NODE_CHAPTER, chapter)
+
+    # Primer nivel: capítulos y archivos sueltos (vídeo) o el nodo raíz del curso (audio).
+    def sync_root(self, entries: List[Tuple[int, object]]):
+        try:
+            self.sync(0, entries)
+        finally:
+            self._end_batch()
+
+    # Añade al final de 'parent' (antes del aviso de escaneo). Si un capítulo ya estaba (lista inicial), se completa.
+    # Con stubs=True los capítulos son de la lista inicial (aún sin leer).
+    def append(self, parent: int, entries: List[Tuple[int, object]], stubs: bool = False):
+        try:
+            pending = []
+            for kind, obj in entries:
+                node = self._chapter_ids.get(path_key(obj.path)) if kind == NODE_CHAPTER else None
+                if node is None or self._parent[node] != parent:
+                    pending.append((kind, obj))
+                elif not stubs:
+                    self._update_node(node, obj)
+            if pending:
+                children = self._children[parent]
+                position = len(children) - (1 if self._notice and self._parent[self._notice] == parent else 0)
+                self._insert_rows(parent, position, pending, stubs)
+        finally:
+            self._end_batch()
+
+    # Nodo de primer nivel creado ya abierto (raíz de los cursos de audio).
+    def add_open_chapter(self, chapter: ChapterItem) -> int:
+        self._insert_rows(0, len(self._children[0]), [(NODE_CHAPTER, chapter)])
+        node = self._children[0][-1]
+        self._open_node(node)
+        return node
+
+    def set_notice(self, text: Optional[str]):
+        if self._notice:
+            self._remove_rows(0, self._row[self._notice], self._row[self._notice])
+            self._notice = 0
+        if text:
+            self._insert_rows(0, len(self._children[0]), [(NODE_NOTICE, text)])
+            self._notice = self._children[0][-1]
+
+    def top_level(self) -> List[object]:
+        return [self._obj[node] for node in self._children[0] if self._kind[node] != NODE_NOTICE]
+
+    def node_for_index(self, index: QModelIndex) -> int:
+        return self._node(index)
+
+    def index_for_node(self, node: int) -> QModelIndex:
+        return self._index(node)
+
+    def chapter_node(self, path: str) -> int:
+        return self._chapter_ids.get(path_key(path), 0)
+
+    # QModelIndex del audio/vídeo (inválido si no está). Si su capítulo aún no se había abierto, se crean sus nodos
+    # (y los de las carpetas que lo contienen).
+    def media_index(self, path: str) -> QModelIndex:
+        key = path_key(path)
+        node = self._media_ids.get(key)
+        if node is None and self._chapter_ids:
+            folders = []
+            folder, parent = os.path.dirname(key), key
+            while folder != parent:
+                folders.append(folder)
+                folder, parent = os.path.dirname(folder), folder
+            for folder in reversed(folders):
+                chapter = self._chapter_ids.get(folder)
+                if chapter is not None:
+                    self.populate(chapter)
+            node = self._media_ids.get(key)
+        return self._index(node) if node is not None else QModelIndex()
+
+    # =================================================
+    # COLORES E ICONOS (VISTO / TEMA)
+    # =================================================
+
+    # Vuelve a consultar si el audio/vídeo del índice está visto y repinta su fila.
+    def refresh_completed(self, index: QModelIndex):
+        node = self._node(index)
+        if self._kind[node] != NODE_MEDIA:
+            return
+        done = 1 if self._is_completed(self._obj[node].rel_path) else 0
+        self._end_batch()
+        if done != self._done[node]:
+            self._done[node] = done
+            self.dataChanged.emit(index, index, [_FOREGROUND_ROLE])
+
+    # Vuelve a consultar el estado visto/no visto de todos los audios/vídeos ya creados (tras borrar el historial o
+    # restablecer los datos desde Opciones) y repinta solo las filas que cambiaron.
+    def refresh_all_completed(self):
+        for node in self._media_ids.values():
+            done = 1 if self._is_completed(self._obj[node].rel_path) else 0
+            if done != self._done[node]:
+                self._done[node] = done
+                index = self._index(node)
+                self.dataChanged.emit(index, index, [_FOREGROUND_ROLE])
+        self._end_batch()
+
+    # Colores del tema (texto no visto) e icono de los tests. Como data() los lee al pintar, no hay que avisar fila a
+    # fila: basta con que la vista repinte lo visible (ver CourseTreeManager.update_theme).
+    def set_theme(self, dark_mode: bool, test_icon: QIcon):
+        self._text_brush = self._theme_brushes[1 if dark_mode else 0]
+        self._test_icon = test_icon
+
+    # =================================================
+    # DURACIONES (TOOLTIPS)
+    # =================================================
+
+    # Diccionario de metadatos que se consulta en los tooltips (el gestor del árbol lo va completando: como los
+    # tooltips se calculan al mostrarse, no hace falta avisar a la vista).
+    def set_media_info(self, media_info: Dict[str, MediaInfo]):
+        self._media_info = media_info
+
+    def set_playback_rate(self, rate: float):
+        self._rate = rate
@@ -1,151 +1,271 @@
-"""
-Función: Ventana para elegir qué apuntes exportar a Excel/CSV (solo el actual, todo el curso o todo global).
-
-"""
-
-# =================================================
-# IMPORTACIONES NECESARIAS
-# =================================================
-
-import os
-import csv
-
-from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QRadioButton, QPushButton, QFileDialog, QMessageBox)
-from PyQt6.QtCore import Qt
-from app.data.data_manager import DataManager
-
-# =================================================
-# CLASE EXPORTNOTESDIALOG (EXPORTACIÓN)
-# =================================================
-
-# Diálogo que permite al usuario elegir el alcance de la exportación de sus apuntes:
-
-# 1. Solo el video actual.
-# 2. Todo el curso actual.
-# 3. Todos los cursos (Global).
-
-class ExportNotesDialog(QDialog):
-    
-    # =================================================
-    # CONSTRUCTOR (__INIT__)
-    # =================================================
-    
-    def __init__(self, parent, data_manager: DataManager, current_course_path: str, current_video_path=None):
-        super().__init__(parent)
-        self.data_manager = data_manager
-        self.course_path = current_course_path
-        self.video_path = current_video_path
-        self.dark_mode = (self.data_manager.get_theme() == "dark")
-        self.setup_ui()
-
-    # =================================================
-    # CONFIGURACIÓN DE INTERFAZ (SETUP_UI)
-    # =================================================
-
-    def setup_ui(self):
-        self.setWindowTitle("Exportación de apuntes")
-        self.resize(450, 170)
-        self.setWindowFlags(self.windowFlags() & ~Qt.WindowType.WindowContextHelpButtonHint)
-
-        layout = QVBoxLayout(self)
-        layout.addWidget(QLabel("Seleccione qué tipo de exportación desea realizar:"))
-        layout.addSpacing(15)
-
-        self.rb_current = QRadioButton("Exportar únicamente los apuntes del presente audio/vídeo.")
-        self.rb_course = QRadioButton("Exportar todos los apuntes del presente curso.")
-        self.rb_all = QRadioButton("Exportar todos los apuntes del aplicativo (Global).")
-
-        if self.video_path:
-            self.rb_current.setChecked(True)
-        else:
-            self.rb_current.setEnabled(False)
-            self.rb_course.setChecked(True)
-
-        layout.addWidget(self.rb_current)
-        layout.addWidget(self.rb_course)
-        layout.addWidget(self.rb_all)
-        layout.addStretch()
-
-        btn_layout = QHBoxLayout()
-        btn_export = QPushButton("Exportar")
-        btn_export.clicked.connect(self.export_action)
-        btn_cancel = QPushButton("Cancelar")
-        btn_cancel.clicked.connect(self.reject)
-
-        # ... (dentro de setup_ui)
-        btn_layout = QHBoxLayout()
-        btn_export = QPushButton("Exportar")
-        btn_export.clicked.connect(self.export_action)
-        btn_cancel = QPushButton("Cancelar")
-        btn_cancel.clicked.connect(self.reject)
-
-        # CENTRADO DE BOTONES
-        btn_layout.addStretch()  # <--- RESORTE IZQUIERDO
-        btn_layout.addWidget(btn_export)
-        btn_layout.addWidget(btn_cancel)
-        btn_layout.addStretch()  # <--- RESORTE DERECHO
-        
-        layout.addLayout(btn_layout)
-        self.apply_styles()
-        
-    # =================================================
-    # APLICAR ESTILOS (APPLY_STYLES)
-    # =================================================
-
-    def apply_styles(self):
-        if self.dark_mode:
-            self.setStyleSheet("""
-                QDialog { background-color: #353535; color: white; }
-                QLabel, QRadioButton { color: white; }
-                QPushButton { background-color: #444; color: white; border: 1px solid #666; padding: 5px; }
-            """)
-
-    # =================================================
-    # LÓGICA DE EXPORTACIÓN (EXPORT_ACTION)
-    # =================================================
-    
-    # Recopila los datos según la opción seleccionada, abre un cuadro de diálogo para guardar archivo y escribe el CSV.
-
-    def export_action(self):
-        rows = []
-        
-        # 1. Recopilar datos
-        if self.rb_current.isChecked() and self.video_path:
-            rel = os.path.relpath(self.video_path, self.course_path)
-            note = self.data_manager.get_notes(self.course_path, rel)
-            if note.strip():
-                rows.append([os.path.basename(self.course_path), os.path.basename(rel), note])
-        
-        elif self.rb_course.isChecked():
-            # Accedemos a la data interna del manager (un poco intrusivo pero necesario aquí)
-            key = self.data_manager._get_course_key(self.course_path)
-            if key in self.data_manager.data["courses"]:
-                notes_dict = self.data_manager.data["courses"][key]["notes"]
-                for rel, text in notes_dict.items():
-                    if text.strip():
-                        rows.append([os.path.basename(self.course_path), os.path.basename(rel), text])
-
-        elif self.rb_all.isChecked():
-            for c_key, c_data in self.data_manager.data["courses"].items():
-                c_name = os.path.basename(c_key)
-                for rel, text in c_data.get("notes", {}).items():
-                    if text.strip():
-                        rows.append([c_name, os.path.basename(rel), text])
-
-        if not rows:
-            QMessageBox.information(self, "Información", "No hay apuntes para exportar.")
-            return
-
-        # 2. Guardar archivo
-        path, _ = QFileDialog.getSaveFileName(self, "Guardar CSV", "", "CSV (*.csv)")
-        if path:
-            try:
-                with open(path, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f, delimiter=';')
-                    writer.writerow(["Curso", "Archivo", "Apuntes"])
-                    writer.writerows(rows)
-                QMessageBox.information(self, "Éxito", "Exportación completada.")
-                self.accept()
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Fallo al guardar: {e}")
\ No newline at end of file
+"""
+Función: Ventana para exportar los datos del usuario (apuntes, historial de vistos o evaluaciones).
+
+Permite elegir el alcance (solo el actual, todo el curso o todo global) y el formato (CSV, JSON Lines o
+Markdown). La escritura se hace en un hilo secundario con barra de progreso y botón para cancelar.
+
+"""
+
+# =================================================
+# IMPORTACIONES NECESARIAS
+# =================================================
+
+import os
+
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QProgressBar,
+                             QRadioButton, QPushButton, QFileDialog, QMessageBox)
+from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from app.data.data_manager import DataManager
+from app.logic.exporter import EXPORT_KINDS, EXPORT_FORMATS, iter_export_rows, create_row_writer
+
+# =================================================
+# CLASE EXPORTWORKER (HILO DE EXPORTACIÓN)
+# =================================================
+
+# Recorre el generador de filas y las escribe en el archivo a medida que llegan.
+# Informa del avance cada PROGRESS_EVERY filas. Si se cancela (o falla), borra el archivo a medio escribir;
+# si no había nada que exportar, borra el archivo vacío.
+
+class ExportWorker(QThread):
+
+    progress = pyqtSignal(int)            # Filas escritas hasta ahora
+    finished_ok = pyqtSignal(int)         # Total de filas escritas
+    failed = pyqtSignal(str)
+
+    PROGRESS_EVERY = 200
+
+    def __init__(self, data_manager: DataManager, kind: str, fmt: str, path: str,
+                 course_path: str, video_path=None, course_index=None, parent=None):
+        super().__init__(parent)
+        self.data_manager = data_manager
+        self.kind = kind
+        self.fmt = fmt
+        self.path = path
+        self.course_path = course_path
+        self.video_path = video_path
+        self.course_index = course_index
+
+    def run(self):
+        count = 0
+        try:
+            with open(self.path, 'w', newline='', encoding='utf-8') as f:
+                writer = create_row_writer(self.fmt, f, self.kind)
+                writer.write_header()
+                for row in iter_export_rows(self.data_manager, self.kind, self.course_path, self.video_path,
+                                                self.course_index):
+                    if self.isInterruptionRequested():
+                        break
+                    writer.write_row(row)
+                    count += 1
+                    if count % self.PROGRESS_EVERY == 0:
+                        self.progress.emit(count)
+        except Exception as e:
+            self._remove_partial_file()
+            self.failed.emit(str(e))
+            return
+
+        if self.isInterruptionRequested():
+            self._remove_partial_file()
+            return
+        if count == 0:
+            self._remove_partial_file()
+        self.finished_ok.emit(count)
+
+    def _remove_partial_file(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+# =================================================
+# CLASE EXPORTNOTESDIALOG (EXPORTACIÓN)
+# =================================================
+
+# Diálogo que permite al usuario elegir qué exportar (apuntes, historial de vistos o evaluaciones),
+# en qué formato y con qué alcance:
+
+# 1. Solo el video actual.
+# 2. Todo el curso actual.
+# 3. Todos los cursos (Global).
+
+class ExportNotesDialog(QDialog):
+
+    # =================================================
+    # CONSTRUCTOR (__INIT__)
+    # =================================================
+
+    def __init__(self, parent, data_manager: DataManager, current_course_path: str, current_video_path=None,
+                 course_index=None):
+        super().__init__(parent)
+        self.data_manager = data_manager
+        self.course_path = current_course_path
+        self.video_path = current_video_path
+        # Estructura del curso abierto (opcional): ordena la exportación del curso como el árbol.
+        self.course_index = course_index
+        self.dark_mode = (self.data_manager.get_theme() == "dark")
+        self.worker = None
+        self.setup_ui()
+
+    # =================================================
+    # CONFIGURACIÓN DE INTERFAZ (SETUP_UI)
+    # =================================================
+
+    def setup_ui(self):
+        self.setWindowTitle("Exportación de datos")
+        self.resize(450, 260)
+        self.setWindowFlags(self.windowFlags() & ~Qt.WindowType.WindowContextHelpButtonHint)
+
+        layout = QVBoxLayout(self)
+
+        # Qué exportar y en qué formato.
+        options_layout = QHBoxLayout()
+        options_layout.addWidget(QLabel("Contenido:"))
+        self.cmb_kind = QComboBox()
+        for key, label in EXPORT_KINDS.items():
+            self.cmb_kind.addItem(label, key)
+        self.cmb_kind.currentIndexChanged.connect(self._on_kind_changed)
+        options_layout.addWidget(self.cmb_kind, 1)
+        options_layout.addWidget(QLabel("Formato:"))
+        self.cmb_format = QComboBox()
+        for key, (label, _) in EXPORT_FORMATS.items():
+            self.cmb_format.addItem(label, key)
+        options_layout.addWidget(self.cmb_format, 1)
+        layout.addLayout(options_layout)
+        layout.addSpacing(10)
+
+        layout.addWidget(QLabel("Seleccione qué tipo de exportación desea realizar:"))
+        layout.addSpacing(15)
+
+        self.rb_current = QRadioButton("Exportar únicamente los datos del presente audio/vídeo.")
+        self.rb_course = QRadioButton("Exportar todos los datos del presente curso.")
+        self.rb_all = QRadioButton("Exportar todos los datos del aplicativo (Global).")
+
+        if self.video_path:
+            self.rb_current.setChecked(True)
+        else:
+            self.rb_current.setEnabled(False)
+            self.rb_course.setChecked(True)
+
+        layout.addWidget(self.rb_current)
+        layout.addWidget(self.rb_course)
+        layout.addWidget(self.rb_all)
+        layout.addStretch()
+
+        # Progreso (visible solo mientras se exporta).
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setVisible(False)
+        self.lbl_progress = QLabel("")
+        self.lbl_progress.setVisible(False)
+        layout.addWidget(self.progress_bar)
+        layout.addWidget(self.lbl_progress)
+
+        btn_layout = QHBoxLayout()
+        self.btn_export = QPushButton("Exportar")
+        self.btn_export.clicked.connect(self.export_action)
+        self.btn_cancel = QPushButton("Cancelar")
+        self.btn_cancel.clicked.connect(self._on_cancel_clicked)
+
+        # CENTRADO DE BOTONES
+        btn_layout.addStretch()  # <--- RESORTE IZQUIERDO
+        btn_layout.addWidget(self.btn_export)
+        btn_layout.addWidget(self.btn_cancel)
+        btn_layout.addStretch()  # <--- RESORTE DERECHO
+
+        layout.addLayout(btn_layout)
+        self.apply_styles()
+
+    # =================================================
+    # APLICAR ESTILOS (APPLY_STYLES)
+    # =================================================
+
+    def apply_styles(self):
+        if self.dark_mode:
+            self.setStyleSheet("""
+                QDialog { background-color: #353535; color: white; }
+                QLabel, QRadioButton { color: white; }
+                QPushButton { background-color: #444; color: white; border: 1px solid #666; padding: 5px; }
+            """)
+
+    # Las evaluaciones pertenecen al curso, no a un vídeo concreto.
+    def _on_kind_changed(self):
+        is_tests = self.cmb_kind.currentData() == "tests"
+        self.rb_current.setEnabled(bool(self.video_path) and not is_tests)
+        if is_tests and self.rb_current.isChecked():
+            self.rb_course.setChecked(True)
+
+    # =================================================
+    # LÓGICA DE EXPORTACIÓN (EXPORT_ACTION)
+    # =================================================
+
+    # Pide la ruta del archivo y lanza el hilo que genera y escribe las filas sin bloquear la ventana.
+
+    def export_action(self):
+        kind = self.cmb_kind.currentData()
+        fmt = self.cmb_format.currentData()
+
+        # 1. Alcance
+        course_path, video_path = self.course_path, None
+        if self.rb_current.isChecked() and self.video_path:
+            video_path = self.video_path
+        elif self.rb_all.isChecked():
+            course_path = None
+
+        # 2. Archivo de destino
+        path, _ = QFileDialog.getSaveFileName(self, "Guardar exportación", "", EXPORT_FORMATS[fmt][1])
+        if not path:
+            return
+
+        # 3. Exportar en segundo plano
+        self._set_running(True)
+        self.worker = ExportWorker(self.data_manager, kind, fmt, path, course_path, video_path,
+                                   self.course_index, self)
+        self.worker.progress.connect(self._on_progress)
+        self.worker.finished_ok.connect(self._on_export_finished)
+        self.worker.failed.connect(self._on_export_failed)
+        self.worker.finished.connect(self._on_worker_stopped)
+        self.worker.start()
+
+    def _set_running(self, running: bool):
+        self.btn_export.setEnabled(not running)
+        self.cmb_kind.setEnabled(not running)
+        self.cmb_format.setEnabled(not running)
+        self.progress_bar.setVisible(running)
+        self.lbl_progress.setVisible(running)
+        self.lbl_progress.setText("Exportando..." if running else "")
+
+    def _on_progress(self, count: int):
+        self.lbl_progress.setText(f"Exportando... {count} filas")
+
+    def _on_export_finished(self, count: int):
+        if count == 0:
+            QMessageBox.information(self, "Información", "No hay datos para exportar.")
+            return
+        QMessageBox.information(self, "Éxito", f"Exportación completada ({count} filas).")
+        self.accept()
+
+    def _on_export_failed(self, message: str):
+        QMessageBox.critical(self, "Error", f"Fallo al guardar: {message}")
+
+    def _on_worker_stopped(self):
+        self._set_running(False)
+        self.worker = None
+
+    # =================================================
+    # CANCELAR / CERRAR
+    # =================================================
+
+    # Durante la exportación el botón cancela el hilo (el archivo incompleto se borra); si no, cierra el diálogo.
+
+    def _on_cancel_clicked(self):
+        if self.worker is not None and self.worker.isRunning():
+            self.lbl_progress.setText("Cancelando...")
+            self.worker.requestInterruption()
+            return
+        self.reject()
+
+    def reject(self):
+        if self.worker is not None and self.worker.isRunning():
+            self.worker.requestInterruption()
+            self.worker.wait()
+        super().reject()
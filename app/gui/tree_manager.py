@@ -1,290 +1,651 @@
-"""
-Función: Gestor del árbol de navegación (panel izquierdo).
-
-Escanea la carpeta del curso y "dibuja" la lista de capítulos y videos en el panel
-lateral. Se encarga de pintar de verde los videos vistos y manejar los iconos.
-
-"""
-
-# =================================================
-# IMPORTACIONES NECESARIAS
-# =================================================
-
-import os
-from PyQt6.QtWidgets import QTreeWidget, QTreeWidgetItem, QTreeWidgetItemIterator
-from PyQt6.QtGui import QIcon, QBrush, QColor, QFont
-from PyQt6.QtCore import Qt
-
-from app.config import VIDEO_EXTS, AUDIO_EXTS
-from app.utils.paths import resource_path
-from app.utils.helpers import format_date_name
-from app.data.data_manager import DataManager
-
-# =================================================
-# CLASE COURSETREEMANAGER (GESTOR DEL ÁRBOL)
-# =================================================
-
-# Se encarga de construir, poblar y actualizar el árbol de contenidos (QTreeWidget) situado en el panel izquierdo de la aplicación.
-# Maneja la lógica de iconos, colores (visto/no visto) y estructura de carpetas.
-
-class CourseTreeManager:
-    
-    # =================================================
-    # CONSTRUCTOR (__INIT__)
-    # =================================================
-    
-    def __init__(self, tree_widget: QTreeWidget, data_manager: DataManager, dark_mode: bool):
-        self.tree = tree_widget
-        self.data_manager = data_manager
-        self.dark_mode = dark_mode
-        self.course_path = ""
-
-        # Cargar iconos en memoria al iniciar
-        self._load_icons()
-
-    # =================================================
-    # CARGA DE ICONOS (_LOAD_ICONS)
-    # =================================================
-    
-    # Carga los iconos necesarios (como el del Test) según el tema actual (Dark/Light).
-
-    def _load_icons(self):
-        suffix = "_dark.svg" if self.dark_mode else "_light.svg"
-        test_path = resource_path(os.path.join("assets", "images", f"test{suffix}"))
-        self.icon_test = QIcon(test_path) if os.path.exists(test_path) else QIcon()
-
-    # =================================================
-    # ESTABLECER RUTA (SET_COURSE_PATH)
-    # =================================================
-
-    def set_course_path(self, path):
-        self.course_path = path
-
-    # =================================================
-    # ACTUALIZAR TEMA (UPDATE_THEME)
-    # =================================================
-    
-    # Se llama cuando el usuario cambia el tema en la ventana principal.
-    # Recarga los iconos y repinta todo el árbol para asegurar contraste correcto. (OJO aún falla al cambiar el tema en el árbol, se actualiza a presionar otra rama (contenido)).
-
-    def update_theme(self, is_dark: bool):
-        self.dark_mode = is_dark
-        self._load_icons()
-        
-        # Iterar sobre todos los elementos para repintar el texto y cambiar iconos.
-        iterator = QTreeWidgetItemIterator(self.tree)
-        while iterator.value():
-            item = iterator.value()
-            self.update_item_color(item)
-            # Actualizar icono test si corresponde
-            data = item.data(0, Qt.ItemDataRole.UserRole)
-            if data and data.get("type") == "test":
-                item.setIcon(0, self.icon_test)
-            iterator += 1
-
-    # =================================================
-    # CONSTRUIR ÁRBOL DE VIDEOS (BUILD_VIDEO_TREE)
-    # =================================================
-    
-    # Lógica principal para cursos de video.
-    # Estructura: Raíz -> Capítulos (Carpetas) -> Videos/Tests
-
-    def build_video_tree(self, root_path: str):
-        self.tree.clear()
-        try:
-            entries = sorted(os.listdir(root_path))
-        except OSError:
-            return
-
-        # 1. Archivos sueltos en raíz (sin capítulo).
-        for f in entries:
-            full_path = os.path.join(root_path, f)
-            if os.path.isfile(full_path):
-                ext = os.path.splitext(f)[1].lower()
-                if ext in VIDEO_EXTS or ext in AUDIO_EXTS:
-                    self._create_media_item(self.tree, f, full_path, root_path)
-
-        # 2. Carpetas (Capítulos).
-        for entry in entries:
-            full_path = os.path.join(root_path, entry)
-            if not os.path.isdir(full_path):
-                continue
-            
-            # Crear nodo padre (Capítulo).
-            chapter_item = QTreeWidgetItem(self.tree)
-            chapter_item.setText(0, entry)
-            # Poner en negrita.
-            f_bold = chapter_item.font(0)
-            f_bold.setBold(True)
-            chapter_item.setFont(0, f_bold)
-            
-            try:
-                sub_files = sorted(os.listdir(full_path))
-            except OSError:
-                continue
-
-            # Agregar Videos dentro del capítulo.
-            for f in sub_files:
-                ext = os.path.splitext(f)[1].lower()
-                if ext in VIDEO_EXTS or ext in AUDIO_EXTS:
-                    media_path = os.path.join(full_path, f)
-                    self._create_media_item(chapter_item, f, media_path, full_path)
-
-            # Buscar y agregar Tests dentro del capítulo.
-            self._scan_tests(chapter_item, full_path)
-
-    # =================================================
-    # CONSTRUIR ÁRBOL DE AUDIOS (BUILD_AUDIO_TREE)
-    # =================================================
-    
-    # Lógica especializada para cursos de audio. 
-    # Utiliza recursividad para navegar subcarpetas anidadas.
-
-    def build_audio_tree(self, root_path: str):
-        self.tree.clear()
-        root_name = os.path.basename(root_path.rstrip(os.sep))
-        # Nodo raíz del curso
-        root_item = QTreeWidgetItem(self.tree)
-        root_item.setText(0, root_name)
-        f_root = root_item.font(0); f_root.setBold(True); root_item.setFont(0, f_root)
-        
-        self._build_audio_recursive(root_item, root_path)
-        self.tree.expandItem(root_item)
-
-    # =================================================
-    # RECURSIVIDAD AUDIOS (_BUILD_AUDIO_RECURSIVE)
-    # =================================================
-    
-    # Navega carpetas. Si encuentra una carpeta que contiene UN solo archivo de audio con el mismo nombre, la "aplana" (muestra la carpeta como si fuera el archivo).
-
-    def _build_audio_recursive(self, parent_item, current_path):
-        try:
-            entries = sorted(os.listdir(current_path))
-        except OSError:
-            return
-
-        dirs = [e for e in entries if os.path.isdir(os.path.join(current_path, e))]
-        files = [e for e in entries if os.path.isfile(os.path.join(current_path, e))]
-
-        # Procesar Carpetas
-        for d_name in dirs:
-            full_dir_path = os.path.join(current_path, d_name)
-            
-            # Lógica de aplanamiento (Smart Flatten).
-            target_file = None
-            try:
-                sub_entries = os.listdir(full_dir_path)
-                for sub_f in sub_entries:
-                    s_name, s_ext = os.path.splitext(sub_f)
-                    # Si el archivo se llama igual a la carpeta y es audio.
-                    if s_name == d_name and s_ext.lower() in AUDIO_EXTS:
-                        target_file = sub_f
-                        break
-            except OSError:
-                pass
-
-            if target_file:
-                # Caso especial: Carpeta se visualiza como un nodo reproducible.
-                chapter_display = parent_item.text(0)
-                self._add_audio_node(parent_item, full_dir_path, target_file, chapter_display)
-            else:
-                # Caso normal: Es una carpeta contenedora, seguimos bajando.
-                display_text = format_date_name(d_name)
-                dir_item = QTreeWidgetItem(parent_item)
-                dir_item.setText(0, display_text)
-                font = dir_item.font(0); font.setBold(True); dir_item.setFont(0, font)
-                # Llamada recursiva
-                self._build_audio_recursive(dir_item, full_dir_path)
-
-        # Procesar Archivos sueltos
-        for f_name in files:
-            if f_name.lower().endswith(AUDIO_EXTS):
-                chapter_display = parent_item.text(0)
-                self._add_audio_node(parent_item, current_path, f_name, chapter_display)
-
-    # =================================================
-    # CREAR ITEM DE MEDIA (_CREATE_MEDIA_ITEM)
-    # =================================================
-    
-    # Crea el nodo visual (QTreeWidgetItem) para un video y adjunta sus datos.
-
-    def _create_media_item(self, parent, filename, full_path, parent_dir):
-        item = QTreeWidgetItem(parent)
-        item.setText(0, os.path.splitext(filename)[0])
-        # Guardamos la metadata crítica en UserRole.
-        data = {"type": "media", "path": full_path, "parent_dir": parent_dir}
-        item.setData(0, Qt.ItemDataRole.UserRole, data)
-        # Aplicamos color si ya fue visto.
-        self.update_item_color(item)
-
-    # =================================================
-    # ESCANEAR TESTS (_SCAN_TESTS)
-    # =================================================
-    
-    # Busca una carpeta llamada "Tests" dentro del capítulo y agrega los exámenes al árbol.
-
-    def _scan_tests(self, parent_item, folder_path):
-        tests_path = os.path.join(folder_path, "Tests")
-        if os.path.exists(tests_path) and os.path.isdir(tests_path):
-            test_files = [f for f in os.listdir(tests_path) if f.endswith(".test")]
-            if test_files:
-                # Crear sub-nodo "Test/Evaluaciones"
-                root_t = QTreeWidgetItem(parent_item)
-                root_t.setText(0, "Test/Evaluaciones")
-                f = root_t.font(0); f.setItalic(True); root_t.setFont(0, f)
-                
-                for t_file in sorted(test_files):
-                    t_item = QTreeWidgetItem(root_t)
-                    t_item.setText(0, os.path.splitext(t_file)[0])
-                    t_item.setIcon(0, self.icon_test)
-                    t_data = {"type": "test", "path": os.path.join(tests_path, t_file)}
-                    t_item.setData(0, Qt.ItemDataRole.UserRole, t_data)
-
-    # =================================================
-    # AGREGAR NODO AUDIO (_ADD_AUDIO_NODE)
-    # =================================================
-    
-    # Helper específico para agregar nodos de audio con el formato de nombre correcto.
-
-    def _add_audio_node(self, parent_item, folder_path, filename, chapter_display):
-        base_name, _ = os.path.splitext(filename)
-        display_text = format_date_name(base_name)
-        
-        item = QTreeWidgetItem(parent_item)
-        item.setText(0, display_text)
-        
-        info = {
-            "type": "audio",
-            "chapter_title": chapter_display,
-            "audio_title": base_name,
-            "audio_path": os.path.join(folder_path, filename),
-            "parent_dir": folder_path
-        }
-        item.setData(0, Qt.ItemDataRole.UserRole, info)
-        self.update_item_color(item)
-
-    # =================================================
-    # ACTUALIZAR COLOR ITEM (UPDATE_ITEM_COLOR)
-    # =================================================
-    
-    # Consulta al DataManager si el archivo está "Completado" y cambia el color del texto.
-    # Verde = Visto. Blanco/Negro = No visto (según tema).
-
-    def update_item_color(self, item):
-        """Pinta verde si está completado."""
-        data = item.data(0, Qt.ItemDataRole.UserRole)
-        if not data: return
-        
-        path = data.get("path") or data.get("audio_path") or data.get("video_path")
-        if not path: return
-
-        try:
-            rel_path = os.path.relpath(path, self.course_path)
-        except ValueError:
-            rel_path = path
-            
-        is_done = self.data_manager.is_video_completed(self.course_path, rel_path)
-        
-        base_color = QColor("white") if self.dark_mode else QColor("black")
-        color = QColor("#00AA00") if is_done else base_color
-        item.setForeground(0, QBrush(color))
\ No newline at end of file
+"""
+Función: Gestor del árbol de navegación (panel izquierdo).
+
+Escanea la carpeta del curso en un hilo secundario (CourseIndex, ver app/logic/scanner.py)
+y "dibuja" la lista de capítulos y videos en el panel lateral a medida que aparecen, a través del modelo
+CourseTreeModel (app/gui/course_model.py). Se encarga de pintar de verde los videos vistos y manejar los iconos.
+
+"""
+
+# =================================================
+# IMPORTACIONES NECESARIAS
+# =================================================
+
+import os
+import time
+from functools import partial
+from typing import List, Optional
+from PyQt6.QtWidgets import QTreeView
+from PyQt6.QtGui import QIcon
+from PyQt6.QtCore import Qt, QThread, QTimer, QFileSystemWatcher, QModelIndex, pyqtSignal
+
+from app.config import SCAN_THREADS, COURSE_KIND_DIRS_PER_LEVEL
+from app.utils.paths import resource_path
+from app.data.data_manager import DataManager
+from app.data.models import CourseIndex, ChapterItem, MediaInfo, MediaItem, duration_totals, path_key
+from app.gui.course_model import CourseTreeModel, NODE_MEDIA, NODE_CHAPTER
+from app.logic.scanner import scan_course, scan_chapter, cached_outline, census_course, CourseCensus
+from app.logic.media_info import read_media_info
+
+# Los metadatos de los archivos (duraciones) se guardan en la caché de escaneo junto a la estructura del curso.
+MEDIA_INFO_CACHE_KIND = "media"
+
+# =================================================
+# CLASE COURSESCANWORKER (ESCANEO EN SEGUNDO PLANO)
+# =================================================
+
+# Ejecuta scan_course (app/logic/scanner.py) en un hilo secundario (leer carpetas puede tardar segundos en USB o red)
+# y envía al hilo de la interfaz los elementos de primer nivel (capítulos o archivos sueltos) a medida que se
+# completan, agrupados en lotes de como máximo BATCH_INTERVAL_S. Al terminar envía el CourseIndex completo.
+# Solo produce datos; el modelo del árbol se modifica siempre en el hilo de la interfaz.
+#
+# En los cursos de vídeo, nada más leer la raíz se envía la lista de capítulos (outline_ready) para que el árbol los
+# muestre todos sin esperar a que se lea cada carpeta.
+#
+# Con 'listings' (caché de escaneo) el árbol ya está pintado: no se envían lotes, solo se validan las carpetas
+# (un stat() por carpeta, releyendo únicamente las modificadas) y se envía el índice resultante. Con 'from_cache'
+# el árbol solo tiene la lista de capítulos: antes de validar se envía el índice tal como está en la caché.
+# Si el resultado cambió (o no había caché), se guarda en 'scan_cache'. 'known_listings' son las carpetas que ya se
+# leyeron al detectar el tipo de curso (ver CourseTreeManager.detect_course_kind): no se vuelven a leer.
+
+class CourseScanWorker(QThread):
+
+    batch_ready = pyqtSignal(list)
+    outline_ready = pyqtSignal(list)      # ChapterItem vacíos
+    index_ready = pyqtSignal(object)      # CourseIndex
+
+    BATCH_INTERVAL_S = 0.1
+
+    def __init__(self, mode: str, root_path: str, listings=None, scan_cache=None, from_cache=False,
+                 known_listings=None, parent=None):
+        super().__init__(parent)
+        self.mode = mode
+        self.root_path = root_path
+        self.listings = listings
+        self.known_listings = known_listings
+        self.scan_cache = scan_cache
+        self.from_cache = from_cache
+        self._batch = []
+        self._last_emit = 0.0
+
+    def run(self):
+        if self.from_cache:
+            cached = scan_course(self.root_path, self.mode, is_cancelled=self.isInterruptionRequested,
+                                 listings=self.listings, trust_listings=True)
+            if cached is None or self.isInterruptionRequested():
+                return
+            self.index_ready.emit(cached)
+        progressive = self.listings is None
+        index = scan_course(self.root_path, self.mode, on_entry=self._push if progressive else None,
+                            on_outline=self._outline if progressive else None,
+                            is_cancelled=self.isInterruptionRequested, listings=self.listings,
+                            known_listings=self.known_listings, threads=SCAN_THREADS)
+        self._emit_batch()
+        if index is None or self.isInterruptionRequested():
+            return
+        if index.changed and self.scan_cache is not None:
+            self.scan_cache.save(self.root_path, self.mode, index.listings)
+        self.index_ready.emit(index)
+
+    # Añade un elemento al lote y lo envía si ya pasó el intervalo (el primero sale enseguida).
+    def _push(self, entry):
+        self._batch.append(entry)
+        if time.monotonic() - self._last_emit >= self.BATCH_INTERVAL_S:
+            self._emit_batch()
+
+    # Lo ya completado (archivos sueltos de la raíz) sale antes que la lista de capítulos, para respetar el orden.
+    def _outline(self, chapters):
+        self._emit_batch()
+        if chapters and not self.isInterruptionRequested():
+            self.outline_ready.emit(chapters)
+
+    def _emit_batch(self):
+        if self._batch and not self.isInterruptionRequested():
+            self.batch_ready.emit(self._batch)
+        self._batch = []
+        self._last_emit = time.monotonic()
+
+
+# =================================================
+# CLASE MEDIAINFOWORKER (DURACIONES EN SEGUNDO PLANO)
+# =================================================
+
+# Lee los metadatos (duración, resolución, códec) de todos los audios/vídeos del índice con read_media_info
+# (app/logic/media_info.py) y envía al hilo de la interfaz, en lotes de como máximo BATCH_INTERVAL_S, los que no
+# estaban ya en 'cached' (los que sí estaban y no cambiaron no se vuelven a analizar ni a enviar). Si el resultado
+# difiere de 'cached' (archivos nuevos, modificados o borrados) se guarda en 'scan_cache', sin los archivos que VLC no
+# pudo leer: esos se vuelven a analizar la próxima vez.
+
+class MediaInfoWorker(QThread):
+
+    info_ready = pyqtSignal(dict)     # ruta relativa -> MediaInfo
+
+    BATCH_INTERVAL_S = 0.5
+
+    def __init__(self, index: CourseIndex, cached, scan_cache=None, parent=None):
+        super().__init__(parent)
+        self.root_path = index.root_path
+        self.media = list(index.media)
+        self.cached = cached
+        self.scan_cache = scan_cache
+        self._batch = {}
+        self._last_emit = 0.0
+
+    def run(self):
+        result = read_media_info(self.media, self.cached, is_cancelled=self.isInterruptionRequested,
+                                 on_result=self._push)
+        self._emit_batch()
+        if result is None or self.isInterruptionRequested():
+            return
+        readable = {rel_path: info for rel_path, info in result.items() if info.duration_ms}
+        changed = readable.keys() != self.cached.keys() or any(self.cached.get(rel_path) is not info
+                                                               for rel_path, info in readable.items())
+        if changed and self.scan_cache is not None:
+            self.scan_cache.save(self.root_path, MEDIA_INFO_CACHE_KIND,
+                                 {rel_path: info.to_list() for rel_path, info in readable.items()})
+
+    def _push(self, rel_path, info):
+        if self.cached.get(rel_path) is info:
+            return
+        self._batch[rel_path] = info
+        if time.monotonic() - self._last_emit >= self.BATCH_INTERVAL_S:
+            self._emit_batch()
+
+    def _emit_batch(self):
+        if self._batch and not self.isInterruptionRequested():
+            self.info_ready.emit(self._batch)
+        self._batch = {}
+        self._last_emit = time.monotonic()
+
+
+# =================================================
+# CLASE COURSETREEMANAGER (GESTOR DEL ÁRBOL)
+# =================================================
+
+# Se encarga de construir, poblar y actualizar el árbol de contenidos (QTreeView + CourseTreeModel) situado en el panel izquierdo de la aplicación.
+# Maneja la lógica de iconos, colores (visto/no visto) y estructura de carpetas.
+# Los "items" que devuelve (item_for_path) son QModelIndex: item.data(Qt.ItemDataRole.UserRole) da el diccionario
+# del audio/vídeo o test.
+
+class CourseTreeManager:
+
+    WATCH_DEBOUNCE_MS = 500
+    WATCH_POLL_MS = 15000
+    # Máximo de carpetas vigiladas individualmente (el resto se revisa por sondeo).
+    WATCH_MAX_DIRS = 2000
+    
+    # =================================================
+    # CONSTRUCTOR (__INIT__)
+    # =================================================
+    
+    def __init__(self, tree_view: QTreeView, data_manager: DataManager, dark_mode: bool):
+        self.tree = tree_view
+        self.data_manager = data_manager
+        self.dark_mode = dark_mode
+        self.course_path = ""
+
+        # Modelo del árbol. Los hijos de cada capítulo se crean la primera vez que se abre (fetchMore) o se
+        # selecciona; los capítulos de la lista inicial que el escaneo aún no leyó se leen en ese momento.
+        self.model = CourseTreeModel(self._completed_set, self._read_chapter)
+        self.tree.setModel(self.model)
+        self.tree.expanded.connect(self._fetch_children)
+        self.tree.selectionModel().currentChanged.connect(self._fetch_children)
+
+        # Escaneo en curso (solo uno activo; los cancelados se conservan en '_workers' hasta que terminan).
+        self._scan_worker = None
+        self._workers = set()
+        self._audio_root = 0
+        # Estructura del curso abierto (None mientras se escanea). Mientras tanto, '_partial_index' reúne lo que ya
+        # llegó del escaneo (en orden) para poder ir al anterior/siguiente sin esperar a que termine.
+        self.course_index: Optional[CourseIndex] = None
+        self._partial_index: Optional[CourseIndex] = None
+        # Carpetas leídas por detect_course_kind: (clave de la ruta del curso, listados) para el siguiente escaneo.
+        self._known_listings = None
+        # Se llama (sin argumentos) cuando el árbol queda completo.
+        self.scan_finished_callback = None
+        self._tree_complete = False
+        # Se llama (sin argumentos) cuando el árbol se actualiza por cambios en las carpetas del curso.
+        self.tree_updated_callback = None
+
+        # Metadatos de los audios/vídeos del curso (ruta relativa -> MediaInfo): se cargan de la caché al abrir el
+        # curso y los completa un MediaInfoWorker cuando el índice está listo (o cambia). El modelo los usa en los
+        # tooltips. Se llama a 'media_info_callback' (sin argumentos) cada vez que llegan nuevos.
+        self.media_info = {}
+        self._info_worker = None
+        self.media_info_callback = None
+        self.playback_rate = 1.0
+        self.model.set_media_info(self.media_info)
+
+        # Vigilancia de las carpetas del curso abierto: los avisos se agrupan (WATCH_DEBOUNCE_MS) y se revalida el
+        # índice (solo se releen las carpetas modificadas). Si alguna carpeta no se puede vigilar (límite del sistema,
+        # unidades de red) se revisa periódicamente cada WATCH_POLL_MS.
+        self._watcher = QFileSystemWatcher()
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+        self._watch_timer = QTimer()
+        self._watch_timer.setSingleShot(True)
+        self._watch_timer.setInterval(self.WATCH_DEBOUNCE_MS)
+        self._watch_timer.timeout.connect(self.refresh)
+        self._poll_timer = QTimer()
+        self._poll_timer.setInterval(self.WATCH_POLL_MS)
+        self._poll_timer.timeout.connect(self.refresh)
+        self._refresh_pending = False
+
+        # Cargar iconos en memoria al iniciar (se guardan por tema: cambiar de tema no vuelve a leer el disco)
+        self._icon_cache = {}
+        self._load_icons()
+        self.model.set_theme(self.dark_mode, self.icon_test)
+
+    # =================================================
+    # CARGA DE ICONOS (_LOAD_ICONS)
+    # =================================================
+    
+    # Carga los iconos necesarios (como el del Test) según el tema actual (Dark/Light).
+
+    def _load_icons(self):
+        icon = self._icon_cache.get(self.dark_mode)
+        if icon is None:
+            suffix = "_dark.svg" if self.dark_mode else "_light.svg"
+            test_path = resource_path(os.path.join("assets", "images", f"test{suffix}"))
+            icon = QIcon(test_path) if os.path.exists(test_path) else QIcon()
+            self._icon_cache[self.dark_mode] = icon
+        self.icon_test = icon
+
+    # =================================================
+    # ESTABLECER RUTA (SET_COURSE_PATH)
+    # =================================================
+
+    def set_course_path(self, path):
+        self.course_path = path
+
+    # =================================================
+    # ACTUALIZAR TEMA (UPDATE_THEME)
+    # =================================================
+    
+    # Se llama cuando el usuario cambia el tema en la ventana principal.
+    # Cambia el icono y los colores del modelo y repinta una sola vez las filas visibles (el estado visto/no visto
+    # de cada fila ya está guardado en el modelo, no se vuelve a consultar).
+
+    def update_theme(self, is_dark: bool):
+        self.dark_mode = is_dark
+        self._load_icons()
+        self.model.set_theme(is_dark, self.icon_test)
+        self.tree.viewport().update()
+
+    # =================================================
+    # DETECCIÓN DEL TIPO DE CURSO (DETECT_COURSE_KIND)
+    # =================================================
+
+    # "video" si hay vídeos en los primeros niveles de la carpeta (raíz, capítulos y sus subcarpetas); si no, "audio".
+    # Corre en el hilo de la interfaz, así que solo mira las primeras COURSE_KIND_DIRS_PER_LEVEL carpetas de cada nivel.
+    # Las carpetas leídas se guardan para que el escaneo que viene a continuación no las vuelva a leer, y las que
+    # están en la caché de escaneo solo se validan con un stat().
+
+    def detect_course_kind(self, root_path: str) -> str:
+        scan_cache = self.data_manager.scan_cache
+        listings = scan_cache.load(root_path, "video") or scan_cache.load(root_path, "audio")
+        census = census_course(root_path, listings=listings, dirs_per_level=COURSE_KIND_DIRS_PER_LEVEL)
+        self._known_listings = (path_key(root_path), census.listings)
+        return census.kind
+
+    # Recuento del contenido del curso abierto (vídeos, audios, evaluaciones, ejercicios y tamaño), sacado de los
+    # listados del escaneo. None mientras se escanea. Si los listados no traen tamaños (fuera de Windows), el de los
+    # audios/vídeos sale de sus metadatos a medida que los lee el MediaInfoWorker.
+    def course_census(self) -> Optional[CourseCensus]:
+        if self.course_index is None:
+            return None
+        census = CourseCensus(self.course_index.listings)
+        if census.unsized:
+            census.add_sizes({rel_path: info.size for rel_path, info in self.media_info.items()})
+        return census
+
+    # =================================================
+    # CONSTRUIR ÁRBOL DE VIDEOS (BUILD_VIDEO_TREE)
+    # =================================================
+    
+    # Lógica principal para cursos de video.
+    # Estructura: Raíz -> Capítulos (Carpetas) -> Videos/Tests
+    # El escaneo va en segundo plano: el árbol se vacía, muestra "Escaneando contenido..." y se llena por lotes.
+
+    def build_video_tree(self, root_path: str):
+        self._start_scan("video", root_path)
+
+    # Crea los nodos de un lote recibido del CourseScanWorker: archivos sueltos de la raíz y capítulos (si el capítulo
+    # ya estaba en la lista inicial, se completa su nodo).
+    def _add_video_batch(self, batch):
+        self.model.append(0, self._entries(batch))
+
+    # =================================================
+    # CONSTRUIR ÁRBOL DE AUDIOS (BUILD_AUDIO_TREE)
+    # =================================================
+    
+    # Lógica especializada para cursos de audio: un nodo raíz con el nombre del curso y debajo las carpetas
+    # (anidadas) y audios, ver _CourseWalker._scan_audio_dir en app/logic/scanner.py.
+
+    def build_audio_tree(self, root_path: str):
+        self._start_scan("audio", root_path)
+
+    def _add_audio_batch(self, batch):
+        self.model.append(self._audio_root, self._entries(batch))
+
+    # =================================================
+    # CONTENIDO DEL ÁRBOL (_APPLY_INDEX)
+    # =================================================
+
+    # Los nodos se identifican por tipo y ruta; el modelo compara los hijos actuales con los nuevos: quita los que ya
+    # no están, inserta los nuevos en su posición y actualiza el resto sin recrearlos (se conservan selección y ramas
+    # abiertas).
+
+    def _entries(self, objs) -> List[tuple]:
+        return [(NODE_MEDIA if isinstance(obj, MediaItem) else NODE_CHAPTER, obj) for obj in objs]
+
+    # Lleva el árbol al contenido de 'index' modificando solo lo que cambió.
+    def _apply_index(self, index: CourseIndex):
+        if index.kind == "audio":
+            if not self._audio_root:
+                self._audio_root = self.model.add_open_chapter(index.root)
+            self.model.sync_root([(NODE_CHAPTER, index.root)])
+        else:
+            self.model.sync_root(self.model.chapter_entries(index.root))
+        self.course_index = index
+
+    # Lista inicial de capítulos (aún sin leer) o capítulos de la caché.
+    def _add_video_outline(self, entries):
+        self.model.append(0, self._entries(entries), stubs=True)
+
+    # Capítulo de la lista inicial que el usuario abrió antes de que el escaneo lo leyera.
+    def _read_chapter(self, chapter: ChapterItem) -> ChapterItem:
+        return scan_chapter(self.course_path, chapter.path)
+
+    # =================================================
+    # ESCANEO EN SEGUNDO PLANO (_START_SCAN / CANCEL_SCAN)
+    # =================================================
+
+    # Cancela el escaneo anterior (si lo hay), vacía el árbol y lanza un CourseScanWorker nuevo.
+    # Si el curso está en la caché de escaneo, el árbol se pinta al momento desde ella (sin tocar el disco del curso)
+    # y el escaneo solo valida las carpetas en segundo plano (stale-while-revalidate). En los cursos de vídeo solo se
+    # pinta la lista de capítulos; el índice completo desde la caché lo construye el propio CourseScanWorker.
+
+    def _start_scan(self, mode: str, root_path: str):
+        self.cancel_scan()
+        self._stop_watching()
+        self.model.clear()
+        self._audio_root = 0
+        self.course_index = None
+        self._partial_index = None
+        self._tree_complete = False
+        self._load_media_info(root_path)
+        known, self._known_listings = self._known_listings, None
+        known_listings = known[1] if known is not None and known[0] == path_key(root_path) else None
+
+        listings = self.data_manager.scan_cache.load(root_path, mode)
+        from_cache = bool(listings) and mode == "video"
+        cached_index = None
+        if from_cache:
+            self._add_video_outline(cached_outline(root_path, listings))
+        elif listings:
+            cached_index = scan_course(root_path, mode, listings=listings, trust_listings=True)
+
+        if cached_index is not None:
+            self._apply_index(cached_index)
+            self._expand_audio_root()
+            self._watch_index(cached_index)
+        elif not from_cache:
+            listings = None
+            if mode == "audio":
+                # Nodo raíz del curso
+                root = ChapterItem(os.path.normpath(root_path), "", os.path.basename(root_path.rstrip(os.sep)))
+                self._audio_root = self.model.add_open_chapter(root)
+                self._expand_audio_root()
+            self.model.set_notice("Escaneando contenido...")
+
+        worker = CourseScanWorker(mode, root_path, listings, self.data_manager.scan_cache, from_cache=from_cache,
+                                  known_listings=known_listings)
+        worker.batch_ready.connect(partial(self._on_scan_batch, worker))
+        worker.outline_ready.connect(partial(self._on_scan_outline, worker))
+        worker.index_ready.connect(partial(self._on_index_ready, worker))
+        worker.finished.connect(partial(self._on_scan_finished, worker))
+        self._scan_worker = worker
+        self._workers.add(worker)
+        worker.start()
+
+        # El árbol desde la caché ya está completo: se avisa en cuanto vuelva el bucle de eventos.
+        if cached_index is not None:
+            QTimer.singleShot(0, partial(self._on_tree_complete, worker))
+
+    def _expand_audio_root(self):
+        if self._audio_root:
+            self.tree.expand(self.model.index_for_node(self._audio_root))
+
+    # Deja de atender al escaneo en curso (p. ej. el usuario abrió otro curso). No se espera al hilo: puede estar
+    # bloqueado en una unidad lenta; termina solo y se descarta al acabar.
+
+    def cancel_scan(self):
+        if self._scan_worker is not None:
+            self._scan_worker.requestInterruption()
+            self._scan_worker = None
+        if self._info_worker is not None:
+            self._info_worker.requestInterruption()
+            self._info_worker = None
+        self.model.set_notice(None)
+
+    # True mientras el árbol aún no muestra todo el curso (escaneo sin caché en marcha).
+    def is_scanning(self) -> bool:
+        return self._scan_worker is not None and not self._tree_complete
+
+    # Al cerrar la aplicación: cancela y espera a los hilos que sigan vivos.
+    def shutdown(self, timeout_ms: int = 3000):
+        self._stop_watching()
+        self.cancel_scan()
+        for worker in list(self._workers):
+            worker.requestInterruption()
+            worker.wait(timeout_ms)
+
+    def _on_scan_batch(self, worker, batch):
+        if worker is not self._scan_worker:
+            return
+        if worker.mode == "audio":
+            self._add_audio_batch(batch)
+        else:
+            self._add_video_batch(batch)
+
+        if self._partial_index is None:
+            root_path = os.path.normpath(worker.root_path)
+            self._partial_index = CourseIndex(root_path, worker.mode, ChapterItem(root_path, "", ""))
+        for entry in batch:
+            if isinstance(entry, MediaItem):
+                self._partial_index.register_media(entry)
+            else:
+                self._partial_index.register_chapter(entry)
+
+    # Lista inicial de capítulos (aún sin leer): se crean sus nodos vacíos, que se completan al llegar cada capítulo
+    # o al abrirlo el usuario.
+    def _on_scan_outline(self, worker, chapters):
+        if worker is not self._scan_worker:
+            return
+        self._add_video_outline(chapters)
+
+    # Índice completo del escaneo. Si el árbol ya estaba pintado (caché o revalidación por cambios en disco) y algo
+    # cambió, se parchea en su sitio.
+    def _on_index_ready(self, worker, index):
+        if worker is not self._scan_worker:
+            return
+        self._partial_index = None
+        if self.course_index is None or index.changed:
+            self._start_media_info(index)
+        if self.course_index is None and not worker.from_cache:
+            self.course_index = index
+        elif self.course_index is None or index.changed:
+            # Primer índice sobre la lista de capítulos (caché) o cambios en disco.
+            was_shown = self.course_index is not None
+            self._apply_index(index)
+            if was_shown and self.tree_updated_callback is not None:
+                self.tree_updated_callback()
+        self._watch_index(index)
+        if worker.from_cache:
+            self._on_tree_complete(None)
+
+    def _on_scan_finished(self, worker):
+        worker.wait()
+        self._workers.discard(worker)
+        if worker is not self._scan_worker:
+            return
+        self._scan_worker = None
+        self.model.set_notice(None)
+        self._on_tree_complete(None)
+        # Hubo cambios en disco mientras se escaneaba: revalidar otra vez.
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self._watch_timer.start()
+
+    # Avisa (una vez por curso abierto) de que el árbol ya muestra todo el curso.
+    def _on_tree_complete(self, worker):
+        if worker is not None and worker is not self._scan_worker:
+            return
+        if self._tree_complete:
+            return
+        self._tree_complete = True
+        if self.scan_finished_callback is not None:
+            self.scan_finished_callback()
+
+    # =================================================
+    # METADATOS Y DURACIONES (MEDIA_INFO)
+    # =================================================
+
+    # Metadatos guardados del curso (se muestran enseguida, aunque el escaneo aún no haya terminado).
+    def _load_media_info(self, root_path: str):
+        self.media_info.clear()
+        cached = self.data_manager.scan_cache.load(root_path, MEDIA_INFO_CACHE_KIND) or {}
+        try:
+            self.media_info.update((rel_path, MediaInfo.from_list(values)) for rel_path, values in cached.items())
+        except TypeError:
+            self.media_info.clear()
+
+    # Lee en segundo plano los metadatos de los archivos del índice: solo se analizan los nuevos o modificados.
+    # Si ya había una lectura en marcha (p. ej. el curso cambió en disco) se abandona y se empieza otra con lo que
+    # ya se conoce.
+    def _start_media_info(self, index: CourseIndex):
+        if self._info_worker is not None:
+            self._info_worker.requestInterruption()
+        worker = MediaInfoWorker(index, dict(self.media_info), self.data_manager.scan_cache)
+        worker.info_ready.connect(partial(self._on_media_info, worker))
+        worker.finished.connect(partial(self._on_media_info_finished, worker))
+        self._info_worker = worker
+        self._workers.add(worker)
+        worker.start()
+
+    def _on_media_info(self, worker, batch):
+        if worker is not self._info_worker:
+            return
+        self.media_info.update(batch)
+        if self.media_info_callback is not None:
+            self.media_info_callback()
+
+    def _on_media_info_finished(self, worker):
+        worker.wait()
+        self._workers.discard(worker)
+
+    # Duración total del curso y lo que falta por ver (ms), y cuántos archivos aún no tienen duración. None mientras
+    # se escanea.
+    def course_durations(self):
+        if self.course_index is None:
+            return None
+        return duration_totals(self.course_index.media, self.media_info, self._completed_set())
+
+    # Velocidad de reproducción actual (para el tiempo pendiente de los tooltips de los capítulos y del curso).
+    def set_playback_rate(self, rate: float):
+        self.playback_rate = rate
+        self.model.set_playback_rate(rate)
+
+    # =================================================
+    # VIGILANCIA DE CARPETAS (REFRESH)
+    # =================================================
+
+    # Revalida el curso abierto en segundo plano (un stat() por carpeta; solo se releen las modificadas) y aplica
+    # al árbol las altas, bajas y renombrados sin reconstruirlo. Lo disparan el vigilante de carpetas y el sondeo.
+
+    def refresh(self):
+        if self.course_index is None:
+            return
+        if self._scan_worker is not None:
+            self._refresh_pending = True
+            return
+        index = self.course_index
+        worker = CourseScanWorker(index.kind, index.root_path, index.listings, self.data_manager.scan_cache)
+        worker.index_ready.connect(partial(self._on_index_ready, worker))
+        worker.finished.connect(partial(self._on_scan_finished, worker))
+        self._scan_worker = worker
+        self._workers.add(worker)
+        worker.start()
+
+    def _on_directory_changed(self, path):
+        self._watch_timer.start()
+
+    # Vigila todas las carpetas del índice (raíz, capítulos, subcarpetas), añadiendo/quitando solo las diferencias.
+    def _watch_index(self, index: CourseIndex):
+        wanted = [os.path.join(index.root_path, rel) if rel else index.root_path for rel in index.listings]
+        unwatched = max(0, len(wanted) - self.WATCH_MAX_DIRS)
+        wanted = set(wanted[:self.WATCH_MAX_DIRS])
+
+        current = set(self._watcher.directories())
+        if current - wanted:
+            self._watcher.removePaths(list(current - wanted))
+        if wanted - current:
+            failed = self._watcher.addPaths(list(wanted - current))
+            unwatched += len(failed)
+
+        if unwatched:
+            self._poll_timer.start()
+        else:
+            self._poll_timer.stop()
+
+    def _stop_watching(self):
+        self._watch_timer.stop()
+        self._poll_timer.stop()
+        self._refresh_pending = False
+        watched = self._watcher.directories()
+        if watched:
+            self._watcher.removePaths(watched)
+
+    # Nodo del árbol (QModelIndex) de un audio/vídeo, o None si no está (p. ej. aún no se escaneó su capítulo).
+    # Si su capítulo aún no se había abierto, se crean sus nodos (y los de las carpetas que lo contienen).
+    def item_for_path(self, path: str) -> Optional[QModelIndex]:
+        index = self.model.media_index(path)
+        return index if index.isValid() else None
+
+    # Audio/vídeo anterior (step=-1) o siguiente (step=1) al de 'path' en orden de reproducción, o None.
+    # Mientras se escanea solo se conoce lo que ya llegó.
+    def neighbour_media(self, path: str, step: int) -> Optional[MediaItem]:
+        index = self.course_index or self._partial_index
+        return index.neighbour_media(path, step) if index is not None else None
+
+    # =================================================
+    # CARGA PEREZOSA DE CAPÍTULOS (_FETCH_CHILDREN)
+    # =================================================
+
+    # La vista pide los hijos de un capítulo al modelo (fetchMore) cuando lo necesita; además se crean en cuanto se
+    # abre o se selecciona (aunque la vista aún no se haya dibujado), para que se pueda recorrer con el teclado.
+
+    def _fetch_children(self, index, previous=None):
+        if index.isValid() and self.model.canFetchMore(index):
+            self.model.fetchMore(index)
+
+    # =================================================
+    # ACTUALIZAR COLOR ITEM (UPDATE_ITEM_COLOR)
+    # =================================================
+    
+    # Consulta al DataManager si el archivo está "Completado" y cambia el color del texto.
+    # Verde = Visto. Blanco/Negro = No visto (según tema).
+
+    def update_item_color(self, item):
+        """Pinta verde si está completado."""
+        if item is not None and item.isValid():
+            self.model.refresh_completed(item)
+
+    # Repinta todo el árbol según el historial actual (p. ej. después de borrarlo desde Opciones).
+    def refresh_all_colors(self):
+        if self.course_path:
+            self.model.refresh_all_completed()
+
+    # Historial del curso (el modelo lo consulta una vez por operación, no por archivo).
+    def _completed_set(self):
+        return self.data_manager.completed_set(self.course_path)
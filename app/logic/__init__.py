@@ -1,3 +1,3 @@
-from .player_ctrl import PlayerController
-from .scanner import CourseScanner
+from .player_ctrl import PlayerController
+from .scanner import CourseScanner
 # Si agregas la clase PomodoroTimer abajo, agrégala aquí también.
\ No newline at end of file
@@ -0,0 +1,173 @@
+"""
+Función: Exportación de datos del usuario (apuntes, historial y evaluaciones).
+
+Genera las filas directamente desde el DataManager (sin cargarlas todas en
+memoria) y las escribe una a una en CSV, JSON Lines o Markdown. No depende de
+Qt: la ventana de exportación lo ejecuta en un hilo secundario.
+
+"""
+
+# =================================================
+# IMPORTACIONES NECESARIAS
+# =================================================
+
+import os
+import csv
+import json
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+from app.data.models import CourseIndex, path_key
+
+# Qué se puede exportar y en qué formatos (clave -> texto para el usuario / filtro del diálogo de guardado).
+EXPORT_KINDS = {
+    "notes": "Apuntes",
+    "history": "Historial de vistos",
+    "tests": "Evaluaciones",
+}
+
+EXPORT_FORMATS = {
+    "csv": ("CSV (;)", "CSV (*.csv)"),
+    "jsonl": ("JSON Lines", "JSON Lines (*.jsonl)"),
+    "md": ("Markdown", "Markdown (*.md)"),
+}
+
+# Columnas de cada tipo de exportación.
+COLUMNS = {
+    "notes": ["Curso", "Archivo", "Visto", "Apuntes"],
+    "history": ["Curso", "Archivo"],
+    "tests": ["Curso", "Evaluación", "Fecha", "Puntaje", "Máximo", "Porcentaje"],
+}
+
+
+# =================================================
+# GENERADOR DE FILAS (ITER_EXPORT_ROWS)
+# =================================================
+
+# Produce las filas (listas con los valores de COLUMNS[kind]) según el alcance:
+# - video_path: solo ese audio/vídeo (apuntes e historial).
+# - course_path: todo el curso.
+# - ninguno: todos los cursos (global).
+# Si se pasa el CourseIndex del curso exportado, sus apuntes e historial salen en el orden del curso (el del árbol).
+
+def iter_export_rows(data_manager, kind: str, course_path: Optional[str] = None,
+                     video_path: Optional[str] = None, course_index: Optional[CourseIndex] = None) -> Iterator[List[Any]]:
+    if course_index is not None and (not course_path or path_key(course_index.root_path) != path_key(course_path)):
+        course_index = None
+
+    if kind == "notes":
+        yield from _iter_note_rows(data_manager, course_path, video_path, course_index)
+    elif kind == "history":
+        rel_filter = os.path.relpath(video_path, course_path) if video_path else None
+        history = data_manager.iter_history(course_path)
+        if course_index is not None:
+            history = _in_course_order(course_index, history, lambda row: row[1])
+        for c_key, rel in history:
+            if rel_filter is None or rel == rel_filter:
+                yield [os.path.basename(c_key), os.path.basename(rel)]
+    elif kind == "tests":
+        for c_key, test_name, attempt in data_manager.iter_test_attempts(course_path):
+            percent = attempt.get("percent")
+            yield [os.path.basename(c_key), test_name, attempt.get("date", ""), attempt.get("score", ""),
+                   attempt.get("max", ""), f"{percent:.1f}" if isinstance(percent, (int, float)) else ""]
+    else:
+        raise ValueError(f"Tipo de exportación desconocido: {kind}")
+
+
+def _iter_note_rows(data_manager, course_path: Optional[str], video_path: Optional[str],
+                    course_index: Optional[CourseIndex] = None) -> Iterator[List[Any]]:
+    if video_path:
+        rel = os.path.relpath(video_path, course_path)
+        note = data_manager.get_notes(course_path, rel)
+        if note.strip():
+            seen = data_manager.is_video_completed(course_path, rel)
+            yield [os.path.basename(course_path), os.path.basename(rel), _seen_label(seen), note]
+        return
+
+    # Historial de cada curso consultado una sola vez (no una consulta por apunte).
+    done_by_course: Dict[str, Any] = {}
+    notes = data_manager.iter_notes(course_path)
+    if course_index is not None:
+        notes = _in_course_order(course_index, notes, lambda row: row[1])
+    for c_key, rel, text in notes:
+        if not text.strip():
+            continue
+        if c_key not in done_by_course:
+            done_by_course[c_key] = data_manager.completed_set(c_key)
+        yield [os.path.basename(c_key), os.path.basename(rel), _seen_label(rel in done_by_course[c_key]), text]
+
+
+def _seen_label(seen: bool) -> str:
+    return "Sí" if seen else "No"
+
+
+# Reordena las filas de un curso según el orden de reproducción del CourseIndex. Las de archivos que ya no están
+# en el curso van al final, por ruta.
+def _in_course_order(course_index: CourseIndex, rows: Iterable[tuple], rel_of) -> List[tuple]:
+    position = {path_key(media.rel_path): i for i, media in enumerate(course_index.media)}
+    missing = len(position)
+    return sorted(rows, key=lambda row: (position.get(path_key(rel_of(row)), missing), rel_of(row)))
+
+
+# =================================================
+# ESCRITORES POR FORMATO (ROWWRITER)
+# =================================================
+
+# Todos reciben el archivo abierto y las columnas, y escriben cada fila en cuanto llega.
+
+class RowWriter(ABC):
+
+    def __init__(self, stream: TextIO, columns: List[str]):
+        self.stream = stream
+        self.columns = columns
+
+    def write_header(self) -> None:
+        pass
+
+    @abstractmethod
+    def write_row(self, row: List[Any]) -> None:
+        ...
+
+
+# CSV con ';' como separador (se abre directamente en Excel con configuración regional en español).
+class CsvRowWriter(RowWriter):
+
+    def __init__(self, stream: TextIO, columns: List[str]):
+        super().__init__(stream, columns)
+        self._writer = csv.writer(stream, delimiter=';')
+
+    def write_header(self) -> None:
+        self._writer.writerow(self.columns)
+
+    def write_row(self, row: List[Any]) -> None:
+        self._writer.writerow(row)
+
+
+# Un objeto JSON por línea, con los nombres de columna como claves.
+class JsonLinesRowWriter(RowWriter):
+
+    def write_row(self, row: List[Any]) -> None:
+        self.stream.write(json.dumps(dict(zip(self.columns, row)), ensure_ascii=False) + "\n")
+
+
+# Tabla Markdown. Los saltos de línea y '|' dentro de un valor se escapan para no romper la tabla.
+class MarkdownRowWriter(RowWriter):
+
+    def write_header(self) -> None:
+        self.stream.write("| " + " | ".join(self.columns) + " |\n")
+        self.stream.write("|" + "---|" * len(self.columns) + "\n")
+
+    def write_row(self, row: List[Any]) -> None:
+        cells = [str(value).replace("|", "\\|").replace("\r\n", "<br>").replace("\n", "<br>") for value in row]
+        self.stream.write("| " + " | ".join(cells) + " |\n")
+
+
+ROW_WRITERS = {
+    "csv": CsvRowWriter,
+    "jsonl": JsonLinesRowWriter,
+    "md": MarkdownRowWriter,
+}
+
+
+def create_row_writer(fmt: str, stream: TextIO, kind: str) -> RowWriter:
+    return ROW_WRITERS[fmt](stream, COLUMNS[kind])
@@ -0,0 +1,170 @@
+"""
+Función: Lectura de los metadatos de los audios y vídeos del curso.
+
+Obtiene con VLC, sin reproducirlos, la duración, la resolución, el códec y el
+bitrate de cada archivo, en varios hilos a la vez. Si el archivo no cambió
+(mismo tamaño y fecha) se reutilizan los datos de una lectura anterior. No
+depende de Qt: el gestor del árbol lo ejecuta en un hilo secundario.
+
+"""
+
+# =================================================
+# IMPORTACIONES NECESARIAS
+# =================================================
+
+import os
+import time
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+import vlc
+
+from app.config import MEDIA_INFO_THREADS, MEDIA_INFO_TIMEOUT_MS
+from app.data.models import MediaInfo, MediaItem
+
+
+# =================================================
+# CLASE VLCPROBE (LECTOR DE METADATOS CON VLC)
+# =================================================
+
+# Analiza archivos con libVLC (MediaParseFlag.local: solo el archivo, sin buscar carátulas ni datos en internet).
+# Cada instancia de VLC analiza los archivos de uno en uno, así que cada hilo usa la suya (se crea la primera vez
+# que el hilo la necesita y se liberan todas con close()). Mientras espera a VLC consulta 'is_cancelled' para no
+# retrasar el cierre de la aplicación.
+
+class VlcProbe:
+
+    WAIT_STEP_S = 0.1
+
+    def __init__(self, timeout_ms: int = MEDIA_INFO_TIMEOUT_MS, is_cancelled: Optional[Callable[[], bool]] = None):
+        self.timeout_ms = timeout_ms
+        self.is_cancelled = is_cancelled
+        self._local = threading.local()
+        self._instances = []
+        self._lock = threading.Lock()
+
+    def _instance(self):
+        instance = getattr(self._local, "instance", None)
+        if instance is None:
+            instance = vlc.Instance("--quiet")
+            if instance is None:
+                # VLC no se pudo iniciar (p. ej. faltan sus librerías): no hay metadatos.
+                return None
+            self._local.instance = instance
+            with self._lock:
+                self._instances.append(instance)
+        return instance
+
+    # Metadatos de 'path' ('stat' = su os.stat). Si VLC no lo puede analizar a tiempo, la duración queda en 0.
+    def __call__(self, path: str, stat: os.stat_result) -> MediaInfo:
+        info = MediaInfo(stat.st_size, stat.st_mtime_ns)
+        instance = self._instance()
+        media = instance.media_new_path(path) if instance is not None else None
+        if media is None:
+            return info
+        parsed = threading.Event()
+        events = media.event_manager()
+        events.event_attach(vlc.EventType.MediaParsedChanged, lambda event: parsed.set())
+        try:
+            if media.parse_with_options(vlc.MediaParseFlag.local, self.timeout_ms) != 0:
+                return info
+            deadline = time.monotonic() + self.timeout_ms / 1000 + 1
+            while not parsed.wait(self.WAIT_STEP_S) and time.monotonic() < deadline:
+                if self.is_cancelled is not None and self.is_cancelled():
+                    break
+            if media.get_parsed_status() != vlc.MediaParsedStatus.done:
+                media.parse_stop()
+                return info
+            info.duration_ms = max(media.get_duration(), 0)
+            self._read_tracks(media, info)
+        finally:
+            events.event_detach(vlc.EventType.MediaParsedChanged)
+            media.release()
+        if info.duration_ms > 0:
+            info.bitrate = info.size * 8000 // info.duration_ms
+        return info
+
+    # Resolución y códec de la pista de vídeo (o, si no hay, el códec de la primera pista de audio).
+    @staticmethod
+    def _read_tracks(media, info: MediaInfo):
+        try:
+            tracks = list(media.tracks_get() or ())
+        except (AttributeError, ValueError):
+            return
+        audio = None
+        for track in tracks:
+            if track.type == vlc.TrackType.video:
+                video = track.u.video.contents
+                info.width, info.height = video.width, video.height
+                info.codec = _fourcc(track.codec)
+                return
+            if audio is None and track.type == vlc.TrackType.audio:
+                audio = track
+        if audio is not None:
+            info.codec = _fourcc(audio.codec)
+
+    def close(self):
+        with self._lock:
+            instances, self._instances = self._instances, []
+        for instance in instances:
+            instance.release()
+
+
+# Códec de VLC (fourcc en un entero) como texto: "h264", "mp4a"...
+def _fourcc(codec: int) -> str:
+    return struct.pack("<I", codec & 0xFFFFFFFF).decode("ascii", "replace").strip()
+
+
+# =================================================
+# LECTURA DEL CURSO (READ_MEDIA_INFO)
+# =================================================
+
+# Metadatos de los audios/vídeos de 'media' (CourseIndex.media), por ruta relativa.
+# - cached: metadatos de una lectura anterior (caché). Un archivo solo se vuelve a analizar si cambió su tamaño o su
+#   fecha de modificación (para saberlo basta un stat() por archivo) o si aquella vez VLC no pudo leerlo (duración 0,
+#   p. ej. por agotar el tiempo en una unidad de red lenta).
+# - threads: archivos que se leen a la vez (los stat() y los análisis de VLC esperan al disco o a la red).
+# - probe(ruta, stat) -> MediaInfo: lector a usar (por defecto VlcProbe).
+# - on_result(ruta_relativa, info): se llama, en el hilo que llama a esta función y en orden de reproducción, con
+#   cada archivo ya leído (los que no se pueden leer, p. ej. porque ya no existen, se omiten).
+# Devuelve None si se canceló (is_cancelled se consulta antes de cada archivo).
+
+def read_media_info(media: List[MediaItem], cached: Optional[Dict[str, MediaInfo]] = None,
+                    threads: int = MEDIA_INFO_THREADS,
+                    probe: Optional[Callable[[str, os.stat_result], MediaInfo]] = None,
+                    is_cancelled: Optional[Callable[[], bool]] = None,
+                    on_result: Optional[Callable[[str, MediaInfo], None]] = None) -> Optional[Dict[str, MediaInfo]]:
+    cached = cached or {}
+    own_probe = VlcProbe(is_cancelled=is_cancelled) if probe is None else None
+    probe = probe or own_probe
+
+    def read(item: MediaItem) -> Optional[MediaInfo]:
+        if is_cancelled is not None and is_cancelled():
+            return None
+        try:
+            stat = os.stat(item.path)
+        except OSError:
+            return None
+        info = cached.get(item.rel_path)
+        if info is not None and info.duration_ms and info.matches(stat):
+            return info
+        return probe(item.path, stat)
+
+    result: Dict[str, MediaInfo] = {}
+    pool = ThreadPoolExecutor(max_workers=max(1, threads))
+    try:
+        for item, info in zip(media, pool.map(read, media)):
+            if is_cancelled is not None and is_cancelled():
+                return None
+            if info is not None:
+                result[item.rel_path] = info
+                if on_result is not None:
+                    on_result(item.rel_path, info)
+    finally:
+        # Si se canceló, los archivos que aún no empezaron se descartan.
+        pool.shutdown(cancel_futures=True)
+        if own_probe is not None:
+            own_probe.close()
+    return result
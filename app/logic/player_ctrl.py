@@ -1,195 +1,348 @@
-"""
-Función: Controlador del reproductor VLC.
-
-Es un "wrapper" (envoltorio) para la librería python-vlc. Simplifica comandos como
-play(), pause(), stop(), controlar volumen y velocidad. Tiene un reloj interno para
-avisar a la interfaz cómo avanza el video.
-
-"""
-
-# =================================================
-# IMPORTACIONES NECESARIAS
-# =================================================
-
-import sys
-import vlc
-from PyQt6.QtCore import QObject, QTimer, pyqtSignal
-from PyQt6.QtWidgets import QWidget
-
-
-# ============================================================
-# CLASE PLAYERCONTROLLER (CONTROLADOR PRINCIPAL VLC)
-# ============================================================
-
-# Controlador lógico principal. Encapsula la instancia vlc.MediaPlayer, maneja el bucle de eventos/tiempo y emite señales de PyQt6 para que la UI se actualice reactivamente (barra de progreso, tiempo, etc.).
-
-class PlayerController(QObject):
-    
-    # Señales para la UI
-    
-    # Emite (tiempo_actual_ms, duracion_total_ms)
-    time_changed = pyqtSignal(int, int)
-    # Emite (float entre 0.0 y 1.0) para la barra de progreso
-    position_changed = pyqtSignal(float)
-    # Emite cuando el estado de reproducción cambia (True=Playing, False=Paused/Stopped)
-    play_state_changed = pyqtSignal(bool)
-    # Emite cuando el video finaliza (End of Stream)
-    finished = pyqtSignal()
-    # Emite la velocidad actual (ej: 1.0, 1.5)
-    rate_changed = pyqtSignal(float)
-
-    # =================================================
-    # CONSTRUCTOR (__INIT__)
-    # =================================================
-    
-    # Inicializa la instancia de VLC, configura el timer interno para actualizaciones (polling) y prepara las variables de estado.
-    
-    def __init__(self):
-        super().__init__()
-        self._instance = vlc.Instance()
-        self._player = self._instance.media_player_new()
-        
-        # Configuraciones base de VLC para evitar conflictos con la UI
-        self._player.video_set_mouse_input(False)
-        self._player.video_set_key_input(False)
-
-        # Timer interno para consultar el estado de VLC (Polling)
-        self._timer = QTimer(self)
-        self._timer.setInterval(200) # Actualizar cada 200ms
-        self._timer.timeout.connect(self._update_state)
-        
-        # Estado interno
-        self._is_finished_emitted = False
-        
-    # ==============================================================
-    # VINCULACIÓN DE SALIDA DE VIDEO (SET_VIDEO_OUTPUT)
-    # ==============================================================
-    
-    # Conecta el reproductor VLC con un widget de PyQt (normalmente un QFrame negro) utilizando el identificador de ventana (winId) del sistema operativo.
-    
-    def set_video_output(self, widget: QWidget):
-        """Asocia el reproductor VLC al ID de ventana (handle) del Widget negro."""
-        win_id = int(widget.winId())
-        
-        if sys.platform.startswith("linux"):
-            self._player.set_xwindow(win_id)
-        elif sys.platform.startswith("win"):
-            self._player.set_hwnd(win_id)
-        elif sys.platform.startswith("darwin"):
-            self._player.set_nsobject(win_id)
-
-    # =================================================
-    # CARGAR MEDIO (LOAD_MEDIA)
-    # =================================================
-    
-    # Prepara un archivo de video o audio para ser reproducido.
-    # Reinicia los estados internos de finalización.
-    
-    def load_media(self, file_path: str):
-        """Carga un archivo de video/audio."""
-        media = self._instance.media_new(file_path)
-        self._player.set_media(media)
-        self._is_finished_emitted = False
-        
-    # ===================================================================
-    # CONTROLES DE REPRODUCCIÓN (PLAY, PAUSE, STOP)
-    # ===================================================================
-
-    # Inicia la reproducción y arranca el timer de actualización de la barra de progreso.
-    
-    def play(self):
-        if not self._player.get_media():
-            return
-        
-        if self._player.play() == -1:
-            print("Error al iniciar reproducción VLC")
-            return
-            
-        self._timer.start()
-        self.play_state_changed.emit(True)
-        
-    # Pausa el video manteniendo la posición actual.
-    def pause(self):
-        self._player.pause()
-        self.play_state_changed.emit(False)
-
-    # Alterna entre reproducir y pausar dependiendo del estado actual.
-    def toggle_play_pause(self):
-        if self.is_playing():
-            self.pause()
-        else:
-            self.play()
-            
-    # Detiene el video por completo, reinicia el timer y resetea la barra de progreso a cero.
-    def stop(self):
-        self._player.stop()
-        self._timer.stop()
-        self.play_state_changed.emit(False)
-        # Resetear UI
-        self.time_changed.emit(0, 0)
-        self.position_changed.emit(0.0)
-        
-    # Devuelve True si el video se está reproduciendo activamente.
-    def is_playing(self) -> bool:
-        return self._player.is_playing() == 1
-    
-    # =================================================
-    # NAVEGACIÓN Y AUDIO (SEEK, VOLUME, RATE)
-    # =================================================
-
-    # Mueve el video a una posición específica (valor flotante de 0.0 a 1.0). Establece la posición absoluta (0.0 a 1.0) desde la barra de progreso.
-    def set_position(self, pos: float):
-        # VLC a veces falla si el media no está parseado, proteccion simple.
-        if self._player.get_media():
-            self._player.set_position(pos)
-
-    # Salta hacia adelante o atrás una cantidad de milisegundos (ej: +5s, -5s).
-    def seek_relative(self, offset_ms: int):
-        current = self._player.get_time()
-        if current == -1: 
-            return
-        
-        new_time = max(0, current + offset_ms)
-        self._player.set_time(new_time)
-        
-    # Ajusta el volumen del audio (0-100) (Nota: VLC permite valores mayores a 100)
-    def set_volume(self, volume: int):
-        self._player.audio_set_volume(volume)
-
-    def get_volume(self) -> int:
-        return self._player.audio_get_volume()
-
-    # Cambia la velocidad de reproducción (ej: 1.5x, 2.0x).
-    def set_rate(self, rate: float):
-        if self._player.set_rate(rate) == 0:
-            self.rate_changed.emit(rate)
-
-    def get_rate(self) -> float:
-        return self._player.get_rate()
-
-    # =================================================
-    # ACTUALIZACIÓN DE ESTADO (BUCLE INTERNO)
-    # =================================================
-    
-    # Método llamado periódicamente por QTimer (cada 200ms).
-    # Consulta a VLC el tiempo actual y emite las señales para actualizar la UI.
-    
-    def _update_state(self):
-        # 1. Verificar si terminó
-        if self._player.get_state() == vlc.State.Ended:
-            if not self._is_finished_emitted:
-                self._is_finished_emitted = True
-                self.stop() # Detener timer interno
-                self.finished.emit()
-            return
-
-        self._is_finished_emitted = False
-
-        # 2. Emitir tiempo y posición para la barra
-        current_ms = self._player.get_time()
-        total_ms = self._player.get_length()
-        position = self._player.get_position()
-
-        if current_ms >= 0:
-            self.time_changed.emit(current_ms, total_ms)
+"""
+Función: Controlador del reproductor VLC.
+
+Es un "wrapper" (envoltorio) para la librería python-vlc. Simplifica comandos como
+play(), pause(), stop(), controlar volumen y velocidad. Avisa a la interfaz cómo
+avanza el video a partir de los eventos de VLC (o, si no están disponibles, con un
+reloj interno que consulta el estado).
+
+"""
+
+# =================================================
+# IMPORTACIONES NECESARIAS
+# =================================================
+
+import sys
+import time
+import vlc
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from PyQt6.QtWidgets import QWidget
+
+
+# ============================================================
+# CLASE PLAYERCONTROLLER (CONTROLADOR PRINCIPAL VLC)
+# ============================================================
+
+# Controlador lógico principal. Encapsula la instancia vlc.MediaPlayer, maneja el bucle de eventos/tiempo y emite señales de PyQt6 para que la UI se actualice reactivamente (barra de progreso, tiempo, etc.).
+#
+# El avance se recibe de los eventos de VLC (event_manager). Llegan en hilos internos de libVLC, así que ahí solo se
+# guardan los valores del evento y se avisa por señales internas (conexión en cola) al hilo de la interfaz, como
+# mucho cada UPDATE_INTERVAL_MS (un aviso que llega antes se agrupa con los siguientes y se emite al cumplirse el
+# intervalo, para que el último valor siempre llegue a la interfaz). En pausa no hay eventos y no se hace nada. Si no
+# se pueden registrar los eventos se vuelve al sondeo con QTimer.
+
+class PlayerController(QObject):
+    
+    # Señales para la UI
+    
+    # Emite (tiempo_actual_ms, duracion_total_ms)
+    time_changed = pyqtSignal(int, int)
+    # Emite (float entre 0.0 y 1.0) para la barra de progreso
+    position_changed = pyqtSignal(float)
+    # Emite cuando el estado de reproducción cambia (True=Playing, False=Paused/Stopped)
+    play_state_changed = pyqtSignal(bool)
+    # Emite cuando el video finaliza (End of Stream)
+    finished = pyqtSignal()
+    # Emite la velocidad actual (ej: 1.0, 1.5)
+    rate_changed = pyqtSignal(float)
+
+    # Señales internas: llevan los eventos de VLC al hilo de la interfaz.
+    _vlc_progress = pyqtSignal()
+    _vlc_progress_later = pyqtSignal()
+    _vlc_state = pyqtSignal()
+    _vlc_ended = pyqtSignal()
+
+    # Intervalo mínimo entre actualizaciones de la barra de progreso (ms).
+    UPDATE_INTERVAL_MS = 200
+
+    # =================================================
+    # CONSTRUCTOR (__INIT__)
+    # =================================================
+    
+    # Inicializa la instancia de VLC, registra los eventos del reproductor (o, si falla, el timer interno de sondeo) y prepara las variables de estado.
+    
+    def __init__(self):
+        super().__init__()
+        self._instance = vlc.Instance()
+        self._player = self._instance.media_player_new()
+        
+        # Configuraciones base de VLC para evitar conflictos con la UI
+        self._player.video_set_mouse_input(False)
+        self._player.video_set_key_input(False)
+
+        # Timer interno para consultar el estado de VLC (Polling), solo si no hay eventos.
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.UPDATE_INTERVAL_MS)
+        self._timer.timeout.connect(self._update_state)
+        
+        # Estado interno
+        self._is_finished_emitted = False
+
+        # Siguiente archivo ya preparado (ruta, vlc.Media), ver preload().
+        self._preloaded = None
+
+        # Últimos valores recibidos en los eventos de VLC.
+        self._current_ms = 0
+        self._length_ms = 0
+        self._position = 0.0
+        self._last_progress = 0.0
+        # Aviso agrupado pendiente de emitir (ver _queue_progress).
+        self._progress_pending = False
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(self.UPDATE_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._emit_pending_progress)
+        self._vlc_progress_later.connect(self._progress_timer.start)
+        self._vlc_progress.connect(self._emit_progress)
+        self._vlc_state.connect(self._emit_progress)
+        self._vlc_ended.connect(self._on_end_reached)
+        self._events_attached = self._attach_events()
+
+    # =================================================
+    # EVENTOS DE VLC (_ATTACH_EVENTS)
+    # =================================================
+
+    # Registra los eventos del reproductor. Devuelve False si VLC no los acepta (se usará el sondeo).
+
+    def _attach_events(self) -> bool:
+        event_type = vlc.EventType
+        handlers = (
+            (event_type.MediaPlayerTimeChanged, self._on_vlc_time),
+            (event_type.MediaPlayerPositionChanged, self._on_vlc_position),
+            (event_type.MediaPlayerLengthChanged, self._on_vlc_length),
+            (event_type.MediaPlayerPlaying, self._on_vlc_state),
+            (event_type.MediaPlayerPaused, self._on_vlc_state),
+            (event_type.MediaPlayerEndReached, self._on_vlc_end),
+        )
+        attached = []
+        try:
+            events = self._player.event_manager()
+            for kind, handler in handlers:
+                if events.event_attach(kind, handler) != 0:
+                    raise RuntimeError(f"evento {kind} no disponible")
+                attached.append(kind)
+        except Exception as e:
+            print(f"Eventos de VLC no disponibles, se consultará el estado cada {self.UPDATE_INTERVAL_MS} ms: {e}")
+            # Sin eventos a medias: o todos o el sondeo.
+            for kind in attached:
+                events.event_detach(kind)
+            return False
+        return True
+
+    # Los manejadores siguientes se ejecutan en hilos de libVLC: no llaman a VLC (podría bloquearse) ni tocan la
+    # interfaz; solo guardan el dato del evento y emiten una señal interna.
+
+    def _on_vlc_time(self, event):
+        self._current_ms = event.u.new_time
+        self._queue_progress()
+
+    def _on_vlc_position(self, event):
+        self._position = event.u.new_position
+        self._queue_progress()
+
+    def _on_vlc_length(self, event):
+        self._length_ms = event.u.new_length
+
+    def _on_vlc_state(self, event):
+        self._vlc_state.emit()
+
+    def _on_vlc_end(self, event):
+        self._vlc_ended.emit()
+
+    # Limita las actualizaciones a una cada UPDATE_INTERVAL_MS (VLC avisa del tiempo muchas veces por segundo).
+    # Si un aviso llega antes de tiempo no se pierde: se programa una sola emisión al final del intervalo con los
+    # valores que haya entonces (p. ej. dos saltos de ±5 s seguidos en pausa, donde no llegan más eventos).
+    def _queue_progress(self):
+        now = time.monotonic()
+        if now - self._last_progress >= self.UPDATE_INTERVAL_MS / 1000:
+            self._last_progress = now
+            self._vlc_progress.emit()
+        elif not self._progress_pending:
+            self._progress_pending = True
+            self._vlc_progress_later.emit()
+
+    # (Hilo de la interfaz) Fin del intervalo con un aviso agrupado pendiente.
+    def _emit_pending_progress(self):
+        self._progress_pending = False
+        self._last_progress = time.monotonic()
+        self._emit_progress()
+
+    # (Hilo de la interfaz) Últimos tiempo y posición recibidos. Al pausar/reanudar se emiten enseguida.
+    def _emit_progress(self):
+        if self._is_finished_emitted:
+            return
+        self.time_changed.emit(self._current_ms, self._length_ms)
+        self.position_changed.emit(self._position)
+
+    def _on_end_reached(self):
+        if not self._is_finished_emitted:
+            self._is_finished_emitted = True
+            self.stop()
+            self.finished.emit()
+        
+    # ==============================================================
+    # VINCULACIÓN DE SALIDA DE VIDEO (SET_VIDEO_OUTPUT)
+    # ==============================================================
+    
+    # Conecta el reproductor VLC con un widget de PyQt (normalmente un QFrame negro) utilizando el identificador de ventana (winId) del sistema operativo.
+    
+    def set_video_output(self, widget: QWidget):
+        """Asocia el reproductor VLC al ID de ventana (handle) del Widget negro."""
+        win_id = int(widget.winId())
+        
+        if sys.platform.startswith("linux"):
+            self._player.set_xwindow(win_id)
+        elif sys.platform.startswith("win"):
+            self._player.set_hwnd(win_id)
+        elif sys.platform.startswith("darwin"):
+            self._player.set_nsobject(win_id)
+
+    # =================================================
+    # CARGAR MEDIO (LOAD_MEDIA)
+    # =================================================
+    
+    # Prepara un archivo de video o audio para ser reproducido (si ya se precargó, se usa ese Media).
+    # Reinicia los estados internos de finalización.
+    
+    def load_media(self, file_path: str):
+        """Carga un archivo de video/audio."""
+        if self._preloaded is not None and self._preloaded[0] == file_path:
+            media = self._preloaded[1]
+        else:
+            media = self._instance.media_new(file_path)
+        self._preloaded = None
+        self._player.set_media(media)
+        self._is_finished_emitted = False
+        self._current_ms, self._length_ms, self._position = 0, 0, 0.0
+        
+    # =================================================
+    # PRECARGA DEL SIGUIENTE (PRELOAD)
+    # =================================================
+
+    # Crea el Media del archivo que se reproducirá a continuación y deja que VLC lo analice en segundo plano
+    # (formato, pistas, duración). Cuando después se llame a load_media con esa ruta, el cambio no empieza en frío.
+
+    def preload(self, file_path: str):
+        if self._preloaded is not None and self._preloaded[0] == file_path:
+            return
+        media = self._instance.media_new(file_path)
+        try:
+            media.parse_with_options(vlc.MediaParseFlag.local, 0)
+        except AttributeError:
+            # python-vlc antiguo (sin análisis asíncrono): al menos el Media ya está creado.
+            pass
+        self._preloaded = (file_path, media)
+
+    # ===================================================================
+    # CONTROLES DE REPRODUCCIÓN (PLAY, PAUSE, STOP)
+    # ===================================================================
+
+    # Inicia la reproducción (y, sin eventos de VLC, el timer de actualización de la barra de progreso).
+    
+    def play(self):
+        if not self._player.get_media():
+            return
+        
+        if self._player.play() == -1:
+            print("Error al iniciar reproducción VLC")
+            return
+            
+        # Al terminar, VLC puede volver a reproducir el mismo archivo: que vuelva a avisar del final.
+        self._is_finished_emitted = False
+        if not self._events_attached:
+            self._timer.start()
+        self.play_state_changed.emit(True)
+        
+    # Pausa el video manteniendo la posición actual.
+    def pause(self):
+        self._player.pause()
+        self.play_state_changed.emit(False)
+
+    # Alterna entre reproducir y pausar dependiendo del estado actual.
+    def toggle_play_pause(self):
+        if self.is_playing():
+            self.pause()
+        else:
+            self.play()
+            
+    # Detiene el video por completo, reinicia el timer y resetea la barra de progreso a cero.
+    def stop(self):
+        self._player.stop()
+        self._timer.stop()
+        self._progress_timer.stop()
+        self._progress_pending = False
+        self._current_ms, self._position = 0, 0.0
+        self.play_state_changed.emit(False)
+        # Resetear UI
+        self.time_changed.emit(0, 0)
+        self.position_changed.emit(0.0)
+        
+    # Devuelve True si el video se está reproduciendo activamente.
+    def is_playing(self) -> bool:
+        return self._player.is_playing() == 1
+    
+    # =================================================
+    # NAVEGACIÓN Y AUDIO (SEEK, VOLUME, RATE)
+    # =================================================
+
+    # Mueve el video a una posición específica (valor flotante de 0.0 a 1.0). Establece la posición absoluta (0.0 a 1.0) desde la barra de progreso.
+    def set_position(self, pos: float):
+        # VLC a veces falla si el media no está parseado, proteccion simple.
+        if self._player.get_media():
+            self._player.set_position(pos)
+
+    # Salta hacia adelante o atrás una cantidad de milisegundos (ej: +5s, -5s).
+    def seek_relative(self, offset_ms: int):
+        current = self._player.get_time()
+        if current == -1: 
+            return
+        
+        new_time = max(0, current + offset_ms)
+        self._player.set_time(new_time)
+
+    # Salta a un instante concreto (ms), p. ej. para reanudar donde se dejó.
+    def set_time(self, time_ms: int):
+        if self._player.get_media():
+            self._player.set_time(max(0, int(time_ms)))
+        
+    # Ajusta el volumen del audio (0-100) (Nota: VLC permite valores mayores a 100)
+    def set_volume(self, volume: int):
+        self._player.audio_set_volume(volume)
+
+    def get_volume(self) -> int:
+        return self._player.audio_get_volume()
+
+    # Cambia la velocidad de reproducción (ej: 1.5x, 2.0x).
+    def set_rate(self, rate: float):
+        if self._player.set_rate(rate) == 0:
+            self.rate_changed.emit(rate)
+
+    def get_rate(self) -> float:
+        return self._player.get_rate()
+
+    # =================================================
+    # ACTUALIZACIÓN DE ESTADO (BUCLE INTERNO)
+    # =================================================
+    
+    # Método llamado periódicamente por QTimer (cada 200ms) cuando no hay eventos de VLC.
+    # Consulta a VLC el tiempo actual y emite las señales para actualizar la UI.
+    
+    def _update_state(self):
+        # 1. Verificar si terminó
+        if self._player.get_state() == vlc.State.Ended:
+            if not self._is_finished_emitted:
+                self._is_finished_emitted = True
+                self.stop() # Detener timer interno
+                self.finished.emit()
+            return
+
+        self._is_finished_emitted = False
+
+        # 2. Emitir tiempo y posición para la barra
+        current_ms = self._player.get_time()
+        total_ms = self._player.get_length()
+        position = self._player.get_position()
+
+        if current_ms >= 0:
+            self.time_changed.emit(current_ms, total_ms)
             self.position_changed.emit(position)
\ No newline at end of file
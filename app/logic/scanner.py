@@ -1,94 +1,737 @@
-"""
-Función: Lector de archivos de examen.
-
-Lee archivos .test (que son JSON), valida que estén bien escritos y extrae
-las preguntas y respuestas para que test_dialog.py las use.
-
-"""
-
-# =================================================
-# IMPORTACIONES NECESARIAS
-# =================================================
-
-import os
-import json
-from typing import Optional, Dict, Any, List
-
-# =================================================
-# CLASE COURSESCANNER (LECTOR DE ESTRUCTURA/TESTS)
-# =================================================
-
-# Utilitario para escanear y leer archivos especiales del curso, principalmente los archivos .test (JSON) para las evaluaciones.
-
-class CourseScanner:
-
-    # =================================================
-    # CARGAR ARCHIVO DE TEST (LOAD_TEST_FILE)
-    # =================================================
-    
-    # Lee un archivo .test, valida su estructura JSON, normaliza los datos (asegurando que existan preguntas, respuestas y puntajes) y devuelve un diccionario limpio listo para ser usado por la interfaz gráfica.
-    
-    @staticmethod
-    def load_test_file(test_path: str) -> Optional[Dict[str, Any]]:
-        if not os.path.exists(test_path):
-            return None
-
-        try:
-            with open(test_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, OSError):
-            return None
-
-        # Validación básica.
-        if not isinstance(data, dict) or "questions" not in data:
-            return None
-
-        questions_raw = data.get("questions", [])
-        if not isinstance(questions_raw, list):
-            return None
-
-        # Normalización de datos (para evitar errores en la UI).
-        normalized_questions = []
-        for q in questions_raw:
-            if not isinstance(q, dict):
-                continue
-            
-            # Asegurar estructura de respuestas.
-            answers_raw = q.get("answers", [])
-            answers = []
-            if isinstance(answers_raw, list):
-                for a in answers_raw:
-                    # Soporte para formato antiguo (string) o nuevo (dict).
-                    if isinstance(a, dict):
-                        answers.append(str(a.get("text", "")))
-                    else:
-                        answers.append(str(a))
-            
-            # Rellenar si faltan respuestas para evitar crash por índice.
-            while len(answers) < 2:
-                answers.append("")
-
-            normalized_questions.append({
-                "text": str(q.get("text", "")),
-                "score": float(q.get("score", 1.0)),
-                "answers": answers,
-                "correct_index": int(q.get("correct_index", 0)),
-                "explanation": str(q.get("explanation", ""))
-            })
-
-        if not normalized_questions:
-            return None
-
-        # Mensajes finales (lógica de legado).
-        final_msg_pass = data.get("final_message_pass") or data.get("final_message", "")
-        final_msg_fail = data.get("final_message_fail") or data.get("final_message", "")
-
-        return {
-            "title": data.get("title", "Evaluación"),
-            "final_message_pass": final_msg_pass,
-            "final_message_fail": final_msg_fail,
-            "num_questions_to_run": int(data.get("num_questions_to_run", len(normalized_questions))),
-            "random_questions": bool(data.get("random_questions", False)),
-            "random_answers": bool(data.get("random_answers", False)),
-            "questions": normalized_questions
+"""
+Función: Escáner de la estructura del curso y lector de archivos de examen.
+
+Recorre la carpeta del curso con os.scandir (una sola lectura por carpeta, sin
+consultar de nuevo el tipo de cada archivo) y construye el CourseIndex de
+app/data/models.py. También lee archivos .test (que son JSON), valida que
+estén bien escritos y extrae las preguntas y respuestas para que
+test_dialog.py las use.
+
+"""
+
+# =================================================
+# IMPORTACIONES NECESARIAS
+# =================================================
+
+import os
+import re
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Callable, Union, Tuple, Set
+
+from app.config import VIDEO_EXTS, AUDIO_EXTS, SCAN_MAX_THREADS
+from app.data.models import CourseIndex, ChapterItem, MediaItem, TestItem, natural_key
+from app.data.notes_index import fold_text
+from app.utils.helpers import format_date_name
+
+MEDIA_EXTS = VIDEO_EXTS + AUDIO_EXTS
+# Carpeta de evaluaciones dentro de cada capítulo.
+TESTS_FOLDER_NAME = "Tests"
+# Orden personalizado del curso (opcional, en la raíz): ver _read_order_manifest.
+ORDER_MANIFEST_NAME = "orden.txt"
+# Extensiones que no se muestran como recursos en el panel de archivos (ya aparecen en el árbol o son notas).
+_NOT_RESOURCE_EXTS = MEDIA_EXTS + (".test", ".txt")
+
+
+# =================================================
+# CLASE SCANSTATS (CONTADORES DEL ESCANEO)
+# =================================================
+
+# Cuántas carpetas se leyeron, cuántas se validaron solo con stat() (caché de escaneo) y cuántas entradas se vieron.
+# Con scandir el tipo de cada entrada (archivo/carpeta) viene en la misma lectura del directorio, así que no hay
+# llamadas stat() adicionales por archivo.
+
+class ScanStats:
+    __slots__ = ("dirs_listed", "dirs_checked", "entries_seen", "latency", "threads")
+
+    def __init__(self):
+        self.dirs_listed = 0
+        self.dirs_checked = 0
+        self.entries_seen = 0
+        # Latencia medida de una lectura de carpeta (segundos, 0 si no se midió) e hilos usados para leer.
+        self.latency = 0.0
+        self.threads = 1
+
+
+# =================================================
+# CLASE COURSECENSUS (RECUENTO DEL CONTENIDO)
+# =================================================
+
+# Cuántos vídeos, audios, evaluaciones (.test) y carpetas de ejercicios hay en cada carpeta leída y cuánto ocupan
+# sus archivos. Se calcula a partir de los listados de las carpetas (los mismos de CourseIndex.listings y de la caché
+# de escaneo), así que no lee nada del disco. 'listings' son los listados de los que sale el recuento.
+# Fuera de Windows los listados no traen el tamaño de los archivos (ver _entry_size): esos quedan en 'unsized' y su
+# tamaño se puede sumar después con add_sizes() (p. ej. el de los audios/vídeos, que ya lee media_info.py).
+
+class FolderCensus:
+    __slots__ = ("videos", "audios", "tests", "exercises", "bytes")
+
+    def __init__(self):
+        self.videos = 0
+        self.audios = 0
+        self.tests = 0
+        self.exercises = 0
+        self.bytes = 0
+
+
+class CourseCensus:
+
+    def __init__(self, listings: Optional[Dict[str, list]] = None):
+        self.folders: Dict[str, FolderCensus] = {}
+        self.listings: Dict[str, list] = {}
+        # Rutas relativas de los archivos cuyo tamaño no viene en el listado, y bytes sumados con add_sizes().
+        self.unsized: Set[str] = set()
+        self._added_bytes = 0
+        for rel_dir, listing in (listings or {}).items():
+            self.add(rel_dir, listing)
+
+    # Suma el listado de una carpeta ([mtime_ns, [[nombre, tipo, tamaño], ...]]).
+    def add(self, rel_dir: str, listing: list) -> FolderCensus:
+        folder = FolderCensus()
+        for name, kind, size in listing[1]:
+            if kind == _KIND_DIR:
+                if name.lower().startswith("ejercicio"):
+                    folder.exercises += 1
+                continue
+            lower = name.lower()
+            if lower.endswith(VIDEO_EXTS):
+                folder.videos += 1
+            elif lower.endswith(AUDIO_EXTS):
+                folder.audios += 1
+            elif lower.endswith(".test"):
+                folder.tests += 1
+            if size < 0:
+                self.unsized.add(os.path.join(rel_dir, name))
+            else:
+                folder.bytes += size
+        self.folders[rel_dir] = folder
+        self.listings[rel_dir] = listing
+        return folder
+
+    def _total(self, field: str) -> int:
+        return sum(getattr(folder, field) for folder in self.folders.values())
+
+    @property
+    def videos(self) -> int:
+        return self._total("videos")
+
+    @property
+    def audios(self) -> int:
+        return self._total("audios")
+
+    @property
+    def tests(self) -> int:
+        return self._total("tests")
+
+    @property
+    def exercises(self) -> int:
+        return self._total("exercises")
+
+    @property
+    def bytes(self) -> int:
+        return self._total("bytes") + self._added_bytes
+
+    # Suma los tamaños conocidos (ruta relativa -> bytes) de archivos que no lo traían en el listado.
+    def add_sizes(self, sizes: Dict[str, int]) -> None:
+        for rel_path in [rel_path for rel_path in self.unsized if rel_path in sizes]:
+            self._added_bytes += sizes[rel_path]
+            self.unsized.discard(rel_path)
+
+    # "video" si hay algún vídeo; si no, se trata como carpeta de audios.
+    @property
+    def kind(self) -> str:
+        return "video" if any(folder.videos for folder in self.folders.values()) else "audio"
+
+
+# Entrada de carpeta recuperada de la caché de escaneo; se usa igual que un os.DirEntry.
+class _CachedEntry:
+    __slots__ = ("name", "path", "kind")
+
+    def __init__(self, name: str, path: str, kind: int):
+        self.name = name
+        self.path = path
+        self.kind = kind
+
+    def is_dir(self) -> bool:
+        return self.kind == _KIND_DIR
+
+    def is_file(self) -> bool:
+        return self.kind == _KIND_FILE
+
+
+_KIND_FILE, _KIND_DIR, _KIND_OTHER = 0, 1, 2
+# Una carpeta modificada hace menos de esto no se da por válida en la caché (algunas unidades, como FAT en USB,
+# guardan la fecha con 2 segundos de resolución y un cambio inmediato podría no alterarla).
+_RACY_MTIME_NS = 2_000_000_000
+# Solo en Windows os.scandir() trae el tamaño de cada archivo sin llamar a stat().
+_SIZES_IN_LISTING = os.name == "nt"
+
+# Ajuste automático de hilos (threads=0): se miden las primeras lecturas de carpetas; si la más rápida tarda al menos
+# _AUTO_MIN_LATENCY_S (unidad de red) se pasa a leer en paralelo con un hilo más por cada milisegundo de latencia,
+# entre _AUTO_MIN_THREADS y SCAN_MAX_THREADS. En un disco local la lectura es muy inferior y se sigue con uno.
+_AUTO_SAMPLES = 3
+_AUTO_MIN_LATENCY_S = 0.002
+_AUTO_MIN_THREADS = 4
+
+
+# =================================================
+# ESCANEO DEL CURSO (SCAN_COURSE)
+# =================================================
+
+# Construye el CourseIndex de 'root_path'. kind: "video" (Raíz -> Capítulos -> Videos/Tests) o "audio"
+# (carpetas anidadas, con aplanado de carpetas que solo contienen su propio audio).
+# - on_entry: se llama con cada elemento de primer nivel (MediaItem o ChapterItem) en cuanto está completo,
+#   para que el árbol se pueda ir dibujando.
+# - on_outline: (solo vídeo) se llama una vez, justo después de leer la raíz, con los capítulos aún sin leer
+#   (ChapterItem vacíos e independientes de los del índice). Así el árbol muestra todos los capítulos sin esperar
+#   a que se lean sus carpetas; el contenido de un capítulo se puede leer aparte con scan_chapter().
+# - is_cancelled: se consulta antes de leer cada carpeta; si devuelve True el escaneo se abandona (devuelve None).
+# - listings: listados de un escaneo anterior (CourseIndex.listings, ver app/data/scan_cache.py). Cada carpeta
+#   se valida con un stat(): si su fecha de modificación no cambió se reutiliza el listado guardado.
+#   Con trust_listings=True ni siquiera se valida (no se toca el disco): sirve para pintar el árbol al instante.
+# - known_listings: listados recién leídos en esta misma apertura (ver census_course); esas carpetas se usan tal
+#   cual, sin volver a leerlas ni validarlas.
+# - threads: con más de 1, los capítulos (vídeo) o las subcarpetas de cada carpeta (audio) se leen a la vez en ese
+#   número de hilos; con 0 se decide solo según la latencia medida de las primeras lecturas (ver _AUTO_SAMPLES).
+#   En un disco local no aporta nada; en unidades de red, donde cada lectura espera la respuesta del servidor, sí.
+#   Las lecturas se recogen en el orden de las carpetas: el resultado (y el orden de on_entry) es el mismo que con
+#   un solo hilo.
+
+def scan_course(root_path: str, kind: str = "video",
+                on_entry: Optional[Callable[[Union[MediaItem, ChapterItem]], None]] = None,
+                on_outline: Optional[Callable[[List[ChapterItem]], None]] = None,
+                is_cancelled: Optional[Callable[[], bool]] = None,
+                stats: Optional[ScanStats] = None,
+                listings: Optional[Dict[str, list]] = None,
+                trust_listings: bool = False,
+                known_listings: Optional[Dict[str, list]] = None,
+                threads: int = 1) -> Optional[CourseIndex]:
+    scanner = _CourseWalker(root_path, kind, on_entry, is_cancelled, stats or ScanStats(), listings, trust_listings,
+                            on_outline, known_listings)
+    if not scanner.trust_listings:
+        scanner.set_threads(threads)
+    try:
+        return scanner.run()
+    finally:
+        # Si se canceló, las lecturas que aún no empezaron se descartan.
+        if scanner.pool is not None:
+            scanner.pool.shutdown(cancel_futures=True)
+
+
+# Archivos sueltos de la raíz y capítulos (vacíos, como en on_outline) de un curso de vídeo según los listados de la
+# caché de escaneo, sin tocar el disco ni leer los capítulos: es lo primero que se pinta al reabrir un curso.
+
+def cached_outline(root_path: str, listings: Dict[str, list]) -> List[Union[MediaItem, ChapterItem]]:
+    scanner = _CourseWalker(root_path, "video", None, None, ScanStats(), listings, trust_listings=True)
+    root_name = os.path.basename(scanner.root_path.rstrip(os.sep))
+    root = ChapterItem(scanner.root_path, root_name, root_name)
+    root_media, folders = scanner._split_video_root(root, scanner._list_dir(scanner.root_path))
+    return root_media + [ChapterItem(entry.path, entry.name, entry.name, root) for entry in folders]
+
+
+# Lee un único capítulo de un curso de vídeo (sus audios/vídeos, evaluaciones, ejercicios y recursos), p. ej. cuando
+# el usuario abre un capítulo que el escaneo en segundo plano aún no alcanzó.
+
+def scan_chapter(root_path: str, chapter_path: str) -> ChapterItem:
+    scanner = _CourseWalker(root_path, "video", None, None, ScanStats())
+    root_name = os.path.basename(scanner.root_path.rstrip(os.sep))
+    root = ChapterItem(scanner.root_path, root_name, root_name)
+    chapter_path = os.path.normpath(chapter_path)
+    return scanner._scan_video_chapter(root, chapter_path, os.path.basename(chapter_path))
+
+
+# =================================================
+# DETECCIÓN DEL TIPO DE CURSO (CENSUS_COURSE)
+# =================================================
+
+# Recuento de las carpetas del curso hasta 'max_depth' niveles (0 = solo la raíz), por niveles: primero la raíz,
+# luego sus subcarpetas, etc. Con stop_at_video se detiene en cuanto aparece un vídeo (basta para decidir el tipo de
+# curso con CourseCensus.kind). Los listados leídos (census.listings) se pasan luego a scan_course como
+# known_listings para que ninguna carpeta se lea dos veces al abrir el curso. Con 'listings' (caché de escaneo) las
+# carpetas que no cambiaron se validan con un stat() en lugar de leerlas. Con 'dirs_per_level' solo se leen las
+# primeras carpetas de cada nivel (el recuento queda incompleto, pero acota el tiempo en cursos grandes o en red).
+
+def census_course(root_path: str, max_depth: int = 3, stop_at_video: bool = True,
+                  listings: Optional[Dict[str, list]] = None, dirs_per_level: Optional[int] = None) -> CourseCensus:
+    scanner = _CourseWalker(root_path, "video", None, None, ScanStats(), listings)
+    census = CourseCensus()
+    level = [scanner.root_path]
+    for _ in range(max_depth):
+        next_level = []
+        for path in level[:dirs_per_level]:
+            entries = scanner._list_dir(path)
+            listing = scanner.listings.get(path[len(scanner.root_path) + 1:])
+            if listing is None:
+                continue
+            if census.add(path[len(scanner.root_path) + 1:], listing).videos and stop_at_video:
+                return census
+            next_level.extend(entry.path for entry in entries if _is_dir(entry))
+        level = next_level
+    return census
+
+
+class _CourseWalker:
+
+    def __init__(self, root_path, kind, on_entry, is_cancelled, stats, listings=None, trust_listings=False,
+                 on_outline=None, known_listings=None):
+        # Ruta normalizada: todas las rutas del índice se forman a partir de ella y se comparan tal cual.
+        self.root_path = os.path.normpath(root_path)
+        self.kind = kind
+        self.on_entry = on_entry or (lambda entry: None)
+        self.on_outline = on_outline or (lambda chapters: None)
+        self.is_cancelled = is_cancelled or (lambda: False)
+        self.stats = stats
+        self.cancelled = False
+
+        self.old_listings = listings
+        self.trust_listings = trust_listings and listings is not None
+        self.known_listings = known_listings or {}
+        # Listados de este escaneo: ruta relativa de la carpeta ("" = raíz) -> [mtime_ns, [[nombre, tipo, tamaño], ...]].
+        self.listings: Dict[str, list] = {}
+        self.changed = listings is None
+        # Orden personalizado del curso (None = aún no se buscó; ver _order_ranks).
+        self.manifest: Optional[Dict[str, Dict[str, int]]] = None
+        # Hilos para leer varias carpetas a la vez (ver _read_dirs); None = una a una. Con 'auto_threads' se miden
+        # las primeras lecturas ('_samples') para decidir si se crea.
+        self.pool: Optional[ThreadPoolExecutor] = None
+        self.auto_threads = False
+        self._samples: List[float] = []
+
+    # 0 = automático; 1 = sin hilos.
+    def set_threads(self, threads: int) -> None:
+        if threads == 0:
+            self.auto_threads = True
+        elif threads > 1:
+            self.pool = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="scan")
+            self.stats.threads = threads
+
+    # Registra lo que tardó una lectura hecha en este hilo; tras _AUTO_SAMPLES lecturas decide los hilos.
+    def _measure(self, seconds: float) -> None:
+        self._samples.append(seconds)
+        if len(self._samples) < _AUTO_SAMPLES:
+            return
+        self.auto_threads = False
+        latency = self.stats.latency = min(self._samples)
+        if latency >= _AUTO_MIN_LATENCY_S:
+            self.set_threads(max(_AUTO_MIN_THREADS, min(SCAN_MAX_THREADS, int(latency * 1000) + 1)))
+
+    def run(self) -> Optional[CourseIndex]:
+        root_name = os.path.basename(self.root_path.rstrip(os.sep))
+        root = ChapterItem(self.root_path, root_name, root_name)
+        entries = self._list_dir(self.root_path)
+        if self.kind == "audio":
+            self._scan_audio_dir(root, "", entries, top_level=True)
+        else:
+            self._scan_video_root(root, entries)
+        if self.cancelled:
+            return None
+
+        # Carpetas que estaban en la caché y ya no existen.
+        if self.old_listings is not None and self.listings.keys() != self.old_listings.keys():
+            self.changed = True
+
+        index = CourseIndex(self.root_path, self.kind, root)
+        index.register_chapter(root)
+        index.listings = self.listings
+        index.changed = self.changed
+        return index
+
+    # Entradas de la carpeta en orden natural (ver natural_key), o en el del orden personalizado del curso si lo
+    # tiene. Lista vacía si no se puede leer o se canceló.
+    # 'read' es el resultado de _read_dir si la carpeta ya se leyó en otro hilo (ver _read_dirs).
+    def _list_dir(self, path: str, read: Optional[tuple] = None) -> List[os.DirEntry]:
+        entries = self._load_dir(path, read)
+        ranks = self._order_ranks(path[len(self.root_path) + 1:], entries)
+        if ranks:
+            last = len(ranks)
+            entries = sorted(entries, key=lambda entry: ranks.get(fold_text(entry.name), last))
+        return entries
+
+    # Posiciones que el orden personalizado da a las entradas de la carpeta 'rel_dir' (None si no dice nada).
+    # El archivo se busca en el listado de la raíz; si este escaneo no lee la raíz (scan_chapter) se intenta abrir.
+    def _order_ranks(self, rel_dir: str, entries: List[os.DirEntry]) -> Optional[Dict[str, int]]:
+        if self.manifest is None:
+            present = not rel_dir and any(entry.name.lower() == ORDER_MANIFEST_NAME for entry in entries)
+            if present or rel_dir:
+                self.manifest = _read_order_manifest(os.path.join(self.root_path, ORDER_MANIFEST_NAME))
+            else:
+                self.manifest = {}
+        if not self.manifest:
+            return None
+        return self.manifest.get(fold_text(rel_dir))
+
+    # Listado de la carpeta ordenado por nombre (ver _list_dir), de la caché o del disco.
+    def _load_dir(self, path: str, read: Optional[tuple] = None) -> List[os.DirEntry]:
+        if self.cancelled or self.is_cancelled():
+            self.cancelled = True
+            return []
+        rel_dir = path[len(self.root_path) + 1:]
+        cached = self._cached_listing(path)
+
+        if self.trust_listings:
+            if cached is None:
+                return []
+            self.listings[rel_dir] = cached
+            return self._cached_entries(path, cached)
+
+        known = self.known_listings.get(rel_dir)
+        if known is not None:
+            self.listings[rel_dir] = known
+            if known != cached:
+                self.changed = True
+            return self._cached_entries(path, known)
+
+        if read is None:
+            started = time.perf_counter()
+            read = _read_dir(path, cached)
+            if self.auto_threads:
+                self._measure(time.perf_counter() - started)
+        mtime, entries = read
+        if mtime is None:
+            self.changed = True
+            return []
+        if cached is not None:
+            self.stats.dirs_checked += 1
+            if entries is None:
+                self.listings[rel_dir] = cached
+                return self._cached_entries(path, cached)
+
+        self.stats.dirs_listed += 1
+        self.stats.entries_seen += len(entries)
+        self.changed = True
+
+        if time.time_ns() - mtime < _RACY_MTIME_NS:
+            mtime = -1
+        self.listings[rel_dir] = [mtime, [[entry.name, kind, _entry_size(entry) if kind == _KIND_FILE else 0]
+                                          for entry, kind in zip(entries, map(_entry_kind, entries))]]
+        return entries
+
+    def _cached_listing(self, path: str) -> Optional[list]:
+        if self.old_listings is None:
+            return None
+        return self.old_listings.get(path[len(self.root_path) + 1:])
+
+    # Lee varias carpetas a la vez en los hilos de 'pool' y devuelve sus lecturas en el orden recibido, a medida que
+    # se van necesitando. Mientras no hay hilos devuelve None (_list_dir lee la carpeta en este hilo); si el ajuste
+    # automático crea el pool a mitad de la lista, el resto ya se lee en paralelo.
+    def _read_dirs(self, paths: List[str], prefetch=None):
+        prefetch = prefetch or self._prefetch
+        position = 0
+        while position < len(paths) and self.pool is None:
+            yield None
+            position += 1
+        if position < len(paths):
+            yield from self.pool.map(prefetch, paths[position:])
+
+    # (En un hilo del pool) las carpetas de known_listings no se leen.
+    def _prefetch(self, path: str) -> Optional[tuple]:
+        if path[len(self.root_path) + 1:] in self.known_listings:
+            return None
+        return _read_dir(path, self._cached_listing(path))
+
+    # (En un hilo del pool) un capítulo de vídeo y su carpeta de evaluaciones, si la tiene.
+    def _prefetch_chapter(self, path: str) -> Tuple[Optional[tuple], Optional[tuple]]:
+        read = self._prefetch(path)
+        if read is not None and read[1] is not None:
+            names = [entry.name for entry in read[1] if _is_dir(entry)]
+        else:
+            listing = self.known_listings.get(path[len(self.root_path) + 1:]) or self._cached_listing(path)
+            names = [name for name, kind, _ in listing[1] if kind == _KIND_DIR] if listing else []
+        for name in names:
+            if name.lower() == TESTS_FOLDER_NAME.lower():
+                return read, self._prefetch(os.path.join(path, name))
+        return read, None
+
+    def _cached_entries(self, path: str, cached: list) -> List[_CachedEntry]:
+        return [_CachedEntry(name, os.path.join(path, name), kind) for name, kind, _ in cached[1]]
+
+    def _collect_extras(self, chapter: ChapterItem, entries: List[os.DirEntry]) -> None:
+        chapter.exercises, chapter.resources = _classify_extras(entries)
+
+    # =================================================
+    # CURSOS DE VÍDEO (_SCAN_VIDEO_ROOT)
+    # =================================================
+
+    def _scan_video_root(self, root: ChapterItem, entries: List[os.DirEntry]) -> None:
+        self._collect_extras(root, entries)
+
+        root_media, folders = self._split_video_root(root, entries)
+
+        # 1. Archivos sueltos en raíz (sin capítulo).
+        for media in root_media:
+            root.entries.append(media)
+            self.on_entry(media)
+
+        # 2. Carpetas (Capítulos). Primero se avisa de cuáles hay y luego se lee cada una.
+        # Con hilos, los capítulos se leen en paralelo y se recogen en orden.
+        self.on_outline([ChapterItem(entry.path, entry.name, entry.name, root) for entry in folders])
+        reads = self._read_dirs([entry.path for entry in folders], self._prefetch_chapter)
+        for entry, read in zip(folders, reads):
+            chapter = self._scan_video_chapter(root, entry.path, entry.name, read or (None, None))
+            if self.cancelled:
+                return
+            root.entries.append(chapter)
+            self.on_entry(chapter)
+
+    def _split_video_root(self, root: ChapterItem, entries: List[os.DirEntry]):
+        root_media = [self._media(entry, "", root) for entry in entries
+                      if entry.name.lower().endswith(MEDIA_EXTS) and _is_file(entry)]
+        return root_media, [entry for entry in entries if _is_dir(entry)]
+
+    # 'reads': lecturas ya hechas en otro hilo del capítulo y de su carpeta de evaluaciones (ver _prefetch_chapter).
+    def _scan_video_chapter(self, root: ChapterItem, path: str, name: str, reads=(None, None)) -> ChapterItem:
+        chapter = ChapterItem(path, name, name, root)
+        sub_entries = self._list_dir(path, reads[0])
+        for sub in sub_entries:
+            if sub.name.lower().endswith(MEDIA_EXTS) and not _is_dir(sub):
+                chapter.entries.append(self._media(sub, name, chapter))
+            elif sub.name.lower() == TESTS_FOLDER_NAME.lower() and _is_dir(sub):
+                chapter.tests = [TestItem(t.path, os.path.splitext(t.name)[0])
+                                 for t in self._list_dir(sub.path, reads[1]) if t.name.endswith(".test")]
+        self._collect_extras(chapter, sub_entries)
+        return chapter
+
+    # =================================================
+    # CURSOS DE AUDIO (_SCAN_AUDIO_DIR)
+    # =================================================
+
+    # Navega carpetas. Si una carpeta contiene un archivo de audio con su mismo nombre, la "aplana" (se muestra la
+    # carpeta como si fuera el archivo). La lectura de cada subcarpeta se reutiliza para bajar en ella.
+
+    def _scan_audio_dir(self, chapter: ChapterItem, rel_dir: str, entries: List[os.DirEntry],
+                        top_level: bool = False) -> None:
+        self._collect_extras(chapter, entries)
+
+        # Procesar Carpetas
+        folders = [entry for entry in entries if _is_dir(entry)]
+        for entry, read in zip(folders, self._read_dirs([entry.path for entry in folders])):
+            sub_entries = self._list_dir(entry.path, read)
+            if self.cancelled:
+                return
+            rel_sub = os.path.join(rel_dir, entry.name)
+
+            # Lógica de aplanamiento (Smart Flatten).
+            target = None
+            for sub in sub_entries:
+                s_name, s_ext = os.path.splitext(sub.name)
+                if s_name == entry.name and s_ext.lower() in AUDIO_EXTS:
+                    target = sub
+                    break
+
+            if target is not None:
+                # Caso especial: Carpeta se visualiza como un nodo reproducible.
+                node = self._media(target, rel_sub, chapter)
+            else:
+                # Caso normal: Es una carpeta contenedora, seguimos bajando.
+                node = ChapterItem(entry.path, entry.name, format_date_name(entry.name), chapter)
+                self._scan_audio_dir(node, rel_sub, sub_entries)
+                if self.cancelled:
+                    return
+            chapter.entries.append(node)
+            if top_level:
+                self.on_entry(node)
+
+        # Procesar Archivos sueltos
+        for entry in entries:
+            if entry.name.lower().endswith(AUDIO_EXTS) and _is_file(entry):
+                media = self._media(entry, rel_dir, chapter)
+                chapter.entries.append(media)
+                if top_level:
+                    self.on_entry(media)
+
+    # El nombre siempre termina en una extensión de audio/vídeo, así que el título es lo anterior al último punto.
+    def _media(self, entry: os.DirEntry, rel_dir: str, chapter: ChapterItem) -> MediaItem:
+        name = entry.name
+        base_name = name[:name.rfind(".")]
+        title = format_date_name(base_name) if self.kind == "audio" else base_name
+        rel_path = rel_dir + os.sep + name if rel_dir else name
+        return MediaItem(entry.path, rel_path, title, self.kind, chapter)
+
+
+# =================================================
+# ORDEN PERSONALIZADO (ORDEN.TXT)
+# =================================================
+
+# El curso puede traer en su raíz un 'orden.txt' con una ruta por línea, relativa a la raíz ("Introducción" o
+# "03 - Funciones/Resumen.mp4"); las líneas vacías y las que empiezan por '#' se ignoran. Dentro de cada carpeta lo
+# listado va primero, en ese orden, y el resto sigue en orden natural. Devuelve carpeta -> {nombre: posición}, con
+# carpetas y nombres en minúsculas y sin tildes (ver fold_text).
+
+def _read_order_manifest(path: str) -> Dict[str, Dict[str, int]]:
+    try:
+        with open(path, "r", encoding="utf-8-sig", errors="replace") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return {}
+    manifest: Dict[str, Dict[str, int]] = {}
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        parts = [part for part in re.split(r"[\\/]", line) if part]
+        if not parts:
+            continue
+        ranks = manifest.setdefault(fold_text(os.sep.join(parts[:-1])), {})
+        ranks.setdefault(fold_text(parts[-1]), len(ranks))
+    return manifest
+
+
+# Lectura de una carpeta, sin tocar el estado del escaneo (se puede llamar desde varios hilos a la vez).
+# Devuelve (mtime_ns, entradas ordenadas), (mtime_ns, None) si el listado de la caché ('cached') sigue siendo
+# válido, o (None, None) si la carpeta no se puede leer.
+
+def _read_dir(path: str, cached: Optional[list]) -> Tuple[Optional[int], Optional[list]]:
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None, None
+    if cached is not None and cached[0] == mtime:
+        return mtime, None
+    try:
+        with os.scandir(path) as it:
+            return mtime, sorted(it, key=_entry_sort_key)
+    except OSError:
+        return None, None
+
+
+# =================================================
+# EJERCICIOS Y RECURSOS (FOLDER_EXTRAS)
+# =================================================
+
+# Ejercicios (carpetas "Ejercicio...") y recursos (otros archivos) de una carpeta, para el panel de archivos.
+# Los capítulos escaneados ya los traen en el CourseIndex; esto es para carpetas fuera de él.
+
+def folder_extras(folder: str) -> Tuple[List[str], List[str]]:
+    try:
+        with os.scandir(folder) as it:
+            entries = sorted(it, key=_entry_sort_key)
+    except OSError:
+        return [], []
+    return _classify_extras(entries)
+
+
+def _classify_extras(entries: List[os.DirEntry]) -> Tuple[List[str], List[str]]:
+    exercises, resources = [], []
+    for entry in entries:
+        if _is_dir(entry):
+            if entry.name.lower().startswith("ejercicio"):
+                exercises.append(entry.path)
+        elif not entry.name.lower().endswith(_NOT_RESOURCE_EXTS) and _is_file(entry):
+            resources.append(entry.path)
+    return exercises, resources
+
+
+def _entry_sort_key(entry: os.DirEntry) -> tuple:
+    return natural_key(entry.name)
+
+
+def _entry_kind(entry: os.DirEntry) -> int:
+    if _is_dir(entry):
+        return _KIND_DIR
+    return _KIND_FILE if _is_file(entry) else _KIND_OTHER
+
+
+# Tamaño de un archivo, solo donde viene en la misma lectura del directorio (Windows). En otros sistemas costaría un
+# stat() por archivo (lento en unidades de red), así que se deja en -1 = desconocido (ver CourseCensus.add_sizes).
+def _entry_size(entry: os.DirEntry) -> int:
+    if not _SIZES_IN_LISTING:
+        return -1
+    try:
+        return entry.stat().st_size
+    except OSError:
+        return 0
+
+
+# El tipo de la entrada viene de la lectura del directorio; solo se hace stat() si el sistema no lo informó.
+def _is_dir(entry: os.DirEntry) -> bool:
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _is_file(entry: os.DirEntry) -> bool:
+    try:
+        return entry.is_file()
+    except OSError:
+        return False
+
+# =================================================
+# CLASE COURSESCANNER (LECTOR DE ESTRUCTURA/TESTS)
+# =================================================
+
+# Utilitario para escanear y leer archivos especiales del curso, principalmente los archivos .test (JSON) para las evaluaciones.
+
+class CourseScanner:
+
+    # =================================================
+    # CARGAR ARCHIVO DE TEST (LOAD_TEST_FILE)
+    # =================================================
+    
+    # Lee un archivo .test, valida su estructura JSON, normaliza los datos (asegurando que existan preguntas, respuestas y puntajes) y devuelve un diccionario limpio listo para ser usado por la interfaz gráfica.
+    
+    @staticmethod
+    def load_test_file(test_path: str) -> Optional[Dict[str, Any]]:
+        if not os.path.exists(test_path):
+            return None
+
+        try:
+            with open(test_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return None
+
+        # Validación básica.
+        if not isinstance(data, dict) or "questions" not in data:
+            return None
+
+        questions_raw = data.get("questions", [])
+        if not isinstance(questions_raw, list):
+            return None
+
+        # Normalización de datos (para evitar errores en la UI).
+        normalized_questions = []
+        for q in questions_raw:
+            if not isinstance(q, dict):
+                continue
+            
+            # Asegurar estructura de respuestas.
+            answers_raw = q.get("answers", [])
+            answers = []
+            if isinstance(answers_raw, list):
+                for a in answers_raw:
+                    # Soporte para formato antiguo (string) o nuevo (dict).
+                    if isinstance(a, dict):
+                        answers.append(str(a.get("text", "")))
+                    else:
+                        answers.append(str(a))
+            
+            # Rellenar si faltan respuestas para evitar crash por índice.
+            while len(answers) < 2:
+                answers.append("")
+
+            normalized_questions.append({
+                "text": str(q.get("text", "")),
+                "score": float(q.get("score", 1.0)),
+                "answers": answers,
+                "correct_index": int(q.get("correct_index", 0)),
+                "explanation": str(q.get("explanation", ""))
+            })
+
+        if not normalized_questions:
+            return None
+
+        # Mensajes finales (lógica de legado).
+        final_msg_pass = data.get("final_message_pass") or data.get("final_message", "")
+        final_msg_fail = data.get("final_message_fail") or data.get("final_message", "")
+
+        return {
+            "title": data.get("title", "Evaluación"),
+            "final_message_pass": final_msg_pass,
+            "final_message_fail": final_msg_fail,
+            "num_questions_to_run": int(data.get("num_questions_to_run", len(normalized_questions))),
+            "random_questions": bool(data.get("random_questions", False)),
+            "random_answers": bool(data.get("random_answers", False)),
+            "questions": normalized_questions
         }
\ No newline at end of file
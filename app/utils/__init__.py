@@ -1,6 +1,6 @@
-# =================================================
-# IMPORTACIONES NECESARIAS
-# =================================================
-
-from .paths import resource_path
+# =================================================
+# IMPORTACIONES NECESARIAS
+# =================================================
+
+from .paths import resource_path
 from .helpers import format_ms_to_time
\ No newline at end of file